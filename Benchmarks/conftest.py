@@ -0,0 +1,141 @@
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from vfbLib.compilers.value import write_value
+from vfbLib.enum import G
+from vfbLib.parsers.glyph import read_glyph_name
+from vfbLib.parsers.value import read_value
+from vfbLib.synthetic import write_synthetic_vfb
+from vfbLib.vfb.entry import VfbEntry
+from vfbLib.vfb.index import glyph_entry_ids
+from vfbLib.vfb.vfb import Vfb
+
+data_path = Path(__file__).parent.parent / "Tests" / "Data"
+
+# The fonts from the test data that are used in all benchmarks
+test_fonts = (
+    "IBMPlexSans-Medium.vfb",
+    "ComicJensPro-Regular3.000.vfb",
+    "imported_glyph.vfb",
+)
+
+# The font that is scaled up to the glyph counts of the synthetic fonts
+synthetic_source = "IBMPlexSans-Medium.vfb"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--synthetic-glyphs",
+        default="10000",
+        help="comma-separated glyph counts of the synthetic fonts, e.g. 10000,60000",
+    )
+    parser.addoption(
+        "--synthetic-mm-glyphs",
+        default="500",
+        help="comma-separated glyph counts of the synthetic 16-master fonts",
+    )
+    parser.addoption(
+        "--rounds",
+        type=int,
+        default=3,
+        help="number of rounds of each benchmark",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "vfb_path" in metafunc.fixturenames:
+        names = list(test_fonts)
+        option = metafunc.config.getoption("--synthetic-glyphs")
+        if option:
+            names.extend(f"synthetic-{n}" for n in option.split(","))
+        option = metafunc.config.getoption("--synthetic-mm-glyphs")
+        if option:
+            names.extend(f"synthetic-mm-{n}" for n in option.split(","))
+        metafunc.parametrize("vfb_path", names, indirect=True)
+
+
+def rename_glyph(data: bytes, name: str, encoding: str) -> bytes:
+    """
+    Return the compiled data of a glyph entry with the glyph name replaced.
+    """
+    # The glyph constant and the name marker are followed by the encoded name length
+    stream = BytesIO(data[5:10])
+    size = read_value(stream, signed=False)
+    rest = data[5 + stream.tell() + size :]  # noqa: E203
+    encoded_name = name.encode(encoding)
+    out = BytesIO()
+    out.write(data[:5])
+    write_value(len(encoded_name), out, signed=False)
+    out.write(encoded_name)
+    out.write(rest)
+    return out.getvalue()
+
+
+def write_scaled_vfb(source_path: Path, num_glyphs: int, out_path: Path) -> None:
+    """
+    Write a copy of the VFB at `source_path` that has `num_glyphs` glyphs, by repeating
+    its glyphs under new names.
+    """
+    vfb = Vfb(source_path, timing=False, lazy=True)
+    glyphs: list[list[VfbEntry]] = []
+    end = 0
+    for i, entry in enumerate(vfb.entries):
+        if entry.id == G.Glyph:
+            glyphs.append([entry])
+            end = i + 1
+        elif entry.id in glyph_entry_ids and glyphs:
+            glyphs[-1].append(entry)
+            end = i + 1
+
+    copies: list[VfbEntry] = []
+    for i in range(num_glyphs - len(glyphs)):
+        glyph = glyphs[i % len(glyphs)]
+        for entry in glyph:
+            raw = entry.raw
+            assert raw is not None
+            if entry.id == G.Glyph:
+                name = read_glyph_name(raw, vfb.encoding)
+                raw = rename_glyph(bytes(raw), f"{name}.copy{i}", vfb.encoding)
+            copy = VfbEntry(vfb, eid=entry.id)
+            copy.data = bytes(raw)
+            copies.append(copy)
+    vfb.entries[end:end] = copies
+    vfb.write(out_path)
+
+
+@pytest.fixture(scope="session")
+def synthetic_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("synthetic")
+
+
+@pytest.fixture
+def vfb_path(request: pytest.FixtureRequest, synthetic_dir: Path) -> Path:
+    name: str = request.param
+    if not name.startswith("synthetic-"):
+        return data_path / name
+
+    num_glyphs = int(name.rsplit("-", 1)[1])
+    path = synthetic_dir / f"{name}.vfb"
+    if path.exists():
+        return path
+
+    if name.startswith("synthetic-mm-"):
+        write_synthetic_vfb(
+            path,
+            num_glyphs=num_glyphs,
+            num_masters=16,
+            num_nodes=60,
+            num_kerning_pairs=10,
+            num_hints=4,
+            num_tt_commands=20,
+        )
+    else:
+        write_scaled_vfb(data_path / synthetic_source, num_glyphs, path)
+    return path
+
+
+@pytest.fixture
+def rounds(request: pytest.FixtureRequest) -> int:
+    return request.config.getoption("--rounds")
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from vfbLib.enum import F
+from vfbLib.ufo.builder import VfbToUfoBuilder
+from vfbLib.vfb.vfb import Vfb
+
+
+def get_decompiled_vfb(vfb_path: Path) -> Vfb:
+    vfb = Vfb(vfb_path, timing=False, drop_keys={F.Encoding, F.EncodingDefault})
+    vfb.decompile()
+    return vfb
+
+
+def test_build(benchmark, vfb_path: Path, rounds: int) -> None:
+    def setup():
+        return (get_decompiled_vfb(vfb_path),), {}
+
+    benchmark.pedantic(VfbToUfoBuilder, setup=setup, rounds=rounds)
+
+
+def test_get_ufo_masters(benchmark, vfb_path: Path, rounds: int) -> None:
+    def setup():
+        return (VfbToUfoBuilder(get_decompiled_vfb(vfb_path)),), {"silent": True}
+
+    benchmark.pedantic(VfbToUfoBuilder.get_ufo_masters, setup=setup, rounds=rounds)
+
+
+def test_write(benchmark, vfb_path: Path, rounds: int, tmp_path: Path) -> None:
+    out_path = tmp_path / vfb_path.with_suffix(".ufo").name
+
+    def setup():
+        builder = VfbToUfoBuilder(get_decompiled_vfb(vfb_path))
+        return (builder, out_path), {"overwrite": True, "silent": True}
+
+    benchmark.pedantic(VfbToUfoBuilder.write, setup=setup, rounds=rounds)
@@ -0,0 +1,48 @@
+from io import BytesIO
+from pathlib import Path
+
+from vfbLib.vfb.index import VfbIndex
+from vfbLib.vfb.vfb import Vfb
+
+
+def get_decompiled_vfb(vfb_path: Path) -> Vfb:
+    vfb = Vfb(vfb_path, timing=False)
+    vfb.decompile()
+    return vfb
+
+
+def test_read(benchmark, vfb_path: Path, rounds: int) -> None:
+    # Read the header and the binary data of all entries
+    benchmark.pedantic(Vfb, args=(vfb_path,), kwargs={"timing": False}, rounds=rounds)
+
+
+def test_index(benchmark, vfb_path: Path, rounds: int) -> None:
+    # Scan the entry headers only
+    benchmark.pedantic(VfbIndex.from_path, args=(vfb_path,), rounds=rounds)
+
+
+def test_decompile(benchmark, vfb_path: Path, rounds: int) -> None:
+    def setup():
+        return (Vfb(vfb_path, timing=False),), {}
+
+    benchmark.pedantic(Vfb.decompile, setup=setup, rounds=rounds)
+
+
+def test_compile(benchmark, vfb_path: Path, rounds: int) -> None:
+    def setup():
+        vfb = get_decompiled_vfb(vfb_path)
+        for entry in vfb.entries:
+            entry.modified = True
+        return (vfb, BytesIO()), {}
+
+    benchmark.pedantic(Vfb.write_bytes, setup=setup, rounds=rounds)
+
+
+def test_roundtrip(benchmark, vfb_path: Path, rounds: int) -> None:
+    def roundtrip() -> None:
+        vfb = get_decompiled_vfb(vfb_path)
+        for entry in vfb.entries:
+            entry.modified = True
+        vfb.write_bytes(BytesIO())
+
+    benchmark.pedantic(roundtrip, rounds=rounds)
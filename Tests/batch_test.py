@@ -0,0 +1,27 @@
+from argparse import Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from vfbLib.batch import run_batch
+
+
+def convert(path: Path, args: Namespace) -> None:
+    if path.suffix != ".vfb":
+        raise ValueError(f"Unsupported file: {path}")
+
+    path.with_suffix(args.suffix).write_text("converted")
+
+
+class RunBatchTest(TestCase):
+    def test_run_batch(self):
+        for jobs in (None, 2):
+            with self.subTest(jobs=jobs), TemporaryDirectory() as tmp:
+                paths = [Path(tmp) / name for name in ("a.vfb", "b.txt", "c.vfb")]
+                args = Namespace(suffix=".out")
+                # The failing file doesn't stop the batch
+                assert run_batch(convert, paths, args, jobs) == 1
+                assert sorted(p.name for p in Path(tmp).iterdir()) == [
+                    "a.out",
+                    "c.out",
+                ]
@@ -3,6 +3,8 @@ import io
 import sys
 import unittest
 from pathlib import Path
+from shutil import copyfile
+from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
 # Import of the function to test
@@ -19,30 +21,61 @@ def vfb_path(name: str) -> Path:
 
 class CmdlineTest(unittest.TestCase):
     def test_vfb2json(self):
-        args = [
-            "vfb2json",
-            str(vfb_path("masters.vfb")),
-            "-p",
-            str(data_path() / "out"),
-        ]
-        with patch.object(sys, "argv", args):
-            f = io.StringIO()
-            with contextlib.redirect_stdout(f):
-                vfb2json()
-            # with open(font_path("css")) as expected:
-            #     assert f.getvalue() == expected.read()
+        with TemporaryDirectory() as tmp:
+            args = [
+                "vfb2json",
+                str(vfb_path("masters.vfb")),
+                "-p",
+                tmp,
+            ]
+            with patch.object(sys, "argv", args):
+                f = io.StringIO()
+                with contextlib.redirect_stdout(f):
+                    vfb2json()
+                # with open(font_path("css")) as expected:
+                #     assert f.getvalue() == expected.read()
 
     def test_vfb2ufo(self):
-        args = [
-            "vfb3ufo",
-            str(vfb_path("masters.vfb")),
-            "-fo",
-            "-p",
-            str(data_path() / "out"),
-        ]
+        with TemporaryDirectory() as tmp:
+            args = [
+                "vfb3ufo",
+                str(vfb_path("masters.vfb")),
+                "-fo",
+                "-p",
+                tmp,
+            ]
+            with patch.object(sys, "argv", args):
+                f = io.StringIO()
+                with contextlib.redirect_stdout(f):
+                    vfb2ufo()
+                # with open(font_path("css")) as expected:
+                #     assert f.getvalue() == expected.read()
+
+    def test_vfb2ufo_outputpath(self):
+        with TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "out.ufo"
+            args = ["vfb3ufo", str(vfb_path("masters.vfb")), str(out_path), "-s"]
+            with patch.object(sys, "argv", args):
+                vfb2ufo()
+            assert (out_path / "metainfo.plist").exists()
+
+    def test_file_not_found(self):
+        args = ["vfb2json", str(vfb_path("masters.vfb")), "missing.vfb"]
         with patch.object(sys, "argv", args):
             f = io.StringIO()
-            with contextlib.redirect_stdout(f):
-                vfb2ufo()
-            # with open(font_path("css")) as expected:
-            #     assert f.getvalue() == expected.read()
+            with contextlib.redirect_stderr(f), self.assertRaises(SystemExit) as cm:
+                vfb2json()
+            assert cm.exception.code == 1
+            assert "File not found: 'missing.vfb'" in f.getvalue()
+
+    def test_other_suffix(self):
+        # Input files don't need the .vfb suffix
+        with TemporaryDirectory() as tmp:
+            in_path = Path(tmp) / "masters.bak"
+            copyfile(vfb_path("masters.vfb"), in_path)
+            args = ["vfb2json", str(in_path), "-p", tmp]
+            with patch.object(sys, "argv", args):
+                f = io.StringIO()
+                with contextlib.redirect_stdout(f):
+                    vfb2json()
+            assert len(list(Path(tmp).glob("*.json"))) == 1
@@ -3,7 +3,7 @@ from unittest import TestCase
 
 from fontTools.misc.textTools import hexStr
 
-from vfbLib.compilers.value import write_value, write_value_long
+from vfbLib.compilers.value import encode_values, write_value, write_value_long
 
 
 class ValueEncoderTest(TestCase):
@@ -82,3 +82,27 @@ class ValueEncoderTest(TestCase):
     def test_0xffffffefffu(self):
         # 4294963199
         self.expect("ffffffefff", 0xFFFFEFFF, False)
+
+
+class ValuesEncoderTest(TestCase):
+    def test_encode_values(self):
+        values = [-107, 0, 107, 108, 1131, -108, -1131, 4096, -4097]
+        encoded = encode_values(values)
+        assert isinstance(encoded, bytearray)
+        assert hexStr(encoded) == "208bf6f700fafffb00feffff00001000ffffffefff"
+
+    def test_encode_values_matches_write_value(self):
+        values = list(range(-1200, 1200, 7)) + [-(2**31), 2**31 - 1]
+        data = BytesIO()
+        for value in values:
+            write_value(value, data)
+        assert encode_values(values) == data.getvalue()
+
+    def test_encode_values_append(self):
+        buffer = bytearray(b"\x01")
+        result = encode_values([0, 1], buffer)
+        assert result is buffer
+        assert hexStr(buffer) == "018b8c"
+
+    def test_encode_values_unsigned(self):
+        assert hexStr(encode_values([0xFFFFEFFF], signed=False)) == "ffffffefff"
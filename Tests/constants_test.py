@@ -1,6 +1,9 @@
 from unittest import TestCase
 
+from vfbLib.compilers.glyph import GlyphCompiler
 from vfbLib.constants import parser_classes
+from vfbLib.enum import G
+from vfbLib.parsers.glyph import GlyphParser
 
 
 class ConstantsTest(TestCase):
@@ -10,3 +13,15 @@ class ConstantsTest(TestCase):
         assert len(set(all_classes)) == len(all_classes), (
             f"Duplicate keys in classes: {sorted(all_classes)}"
         )
+
+    def test_get_key(self):
+        assert parser_classes.get_key(G.Glyph) == "Glyph"
+        assert parser_classes.get_key(-1) is None
+
+    def test_lookup(self):
+        key, parser, compiler = parser_classes[G.Glyph]
+        assert key == "Glyph"
+        assert parser is GlyphParser
+        assert compiler is GlyphCompiler
+        assert parser_classes.get(-1) is None
+        assert len(parser_classes) == len(list(parser_classes))
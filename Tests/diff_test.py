@@ -0,0 +1,61 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from vfbLib.diff import MISSING, VfbDifference, diff_vfbs
+from vfbLib.enum import G
+from vfbLib.vfb.vfb import Vfb
+
+data_path = Path(__file__).parent / "Data"
+masters_path = data_path / "masters.vfb"
+
+
+def get_glyph_entry(vfb: Vfb, name: str):
+    for entry in vfb.entries:
+        if entry.id == G.Glyph and entry.data["name"] == name:
+            return entry
+
+    raise KeyError(name)
+
+
+class DiffVfbsTest(TestCase):
+    def test_identical(self):
+        assert diff_vfbs(masters_path, masters_path) == []
+
+    def test_changed_field(self):
+        vfb = Vfb(masters_path, timing=False, lazy=True)
+        entry = get_glyph_entry(vfb, "t")
+        entry.data["metrics"][2] = (510, 0)
+        with TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "out.vfb"
+            vfb.write(out_path)
+            differences = diff_vfbs(masters_path, out_path)
+        assert differences == [
+            VfbDifference("glyph 't' / Glyph.metrics[2][0]", 500, 510)
+        ]
+
+    def test_moved_and_removed_glyphs(self):
+        vfb = Vfb(masters_path, timing=False, lazy=True)
+        glyph_ids = set(G)
+        a, t = [i for i, e in enumerate(vfb.entries) if e.id == G.Glyph]
+        end = t + 1
+        while vfb.entries[end].id in glyph_ids:
+            end += 1
+        glyph_t = vfb.entries[t:end]
+        with TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "out.vfb"
+
+            # Move glyph "t" before glyph "a"
+            vfb.entries[t:end] = []
+            vfb.entries[a:a] = glyph_t
+            vfb.write(out_path)
+            assert diff_vfbs(masters_path, out_path) == [
+                VfbDifference("glyph order", ["a", "t"], ["t", "a"])
+            ]
+
+            # Remove glyph "t"
+            vfb.entries[a : a + len(glyph_t)] = []  # noqa: E203
+            vfb.write(out_path)
+            assert diff_vfbs(masters_path, out_path) == [
+                VfbDifference("glyph 't'", "t", MISSING)
+            ]
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+# Modules that are slow to import and are only needed by some commands
+heavy_modules = (
+    "concurrent.futures.process",
+    "fontTools.designspaceLib",
+    "fontTools.ttLib",
+    "ufoLib2",
+    "ufonormalizer",
+    "vfbLib.compilers.glyph",
+    "vfbLib.parsers.glyph",
+)
+
+
+def get_imported_modules(code: str) -> set[str]:
+    # Import in a fresh interpreter, the test process has imported everything already
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{code}\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.splitlines())
+
+
+class ImportsTest(TestCase):
+    def test_cmdline(self):
+        modules = get_imported_modules("import vfbLib.cmdline")
+        for name in heavy_modules:
+            assert name not in modules, f"{name} imported by vfbLib.cmdline"
+
+    def test_vfb(self):
+        modules = get_imported_modules("import vfbLib.vfb.vfb")
+        for name in heavy_modules:
+            assert name not in modules, f"{name} imported by vfbLib.vfb.vfb"
+
+    def test_parser_classes(self):
+        modules = get_imported_modules(
+            "from vfbLib.constants import parser_classes\n"
+            "from vfbLib.enum import G\n"
+            "parser_classes[G.Glyph]"
+        )
+        assert "vfbLib.parsers.glyph" in modules
+        assert "vfbLib.compilers.glyph" in modules
+        assert "vfbLib.parsers.truetype" not in modules
@@ -0,0 +1,70 @@
+from io import BytesIO
+from pathlib import Path
+from unittest import TestCase
+
+from vfbLib.enum import G
+from vfbLib.outlines import CompactOutline
+from vfbLib.vfb.vfb import Vfb
+
+data_path = Path(__file__).parent / "Data"
+
+nodes = [
+    {"type": "move", "flags": 0, "points": [[(10, 20)], [(11, 21)]]},
+    {
+        "type": "curve",
+        "flags": 1,
+        "points": [
+            [(100, 200), (30, 40), (70, 180)],
+            [(101, 201), (31, 41), (71, 181)],
+        ],
+    },
+    {"type": "line", "flags": 0, "points": [[(-5, 0)], [(-6, 0)]]},
+]
+
+
+class CompactOutlineTest(TestCase):
+    def test_from_nodes(self):
+        outline = CompactOutline.from_nodes(nodes, 2)
+        assert len(outline) == 3
+        assert outline[1] == nodes[1]
+        assert outline[-1] == nodes[2]
+        assert outline[:2] == nodes[:2]
+        assert outline == nodes
+        assert outline.to_list() == nodes
+        assert outline.types.tolist() == [0x00, 0x13, 0x01]
+        assert len(outline.coords) == 2 * 2 * 5
+
+    def test_index_error(self):
+        outline = CompactOutline.from_nodes(nodes, 2)
+        with self.assertRaises(IndexError):
+            outline[3]
+
+    def test_iter_master(self):
+        outline = CompactOutline.from_nodes(nodes, 2)
+        assert list(outline.iter_master(1)) == [
+            ("move", 0, [(11, 21)]),
+            ("curve", 1, [(101, 201), (31, 41), (71, 181)]),
+            ("line", 0, [(-6, 0)]),
+        ]
+
+    def test_vfb(self):
+        for name in ("masters.vfb", "mask.vfb", "cu2qu_2m.vfb"):
+            with self.subTest(name=name):
+                vfb = Vfb(data_path / name, timing=False)
+                vfb.decompile()
+                vfb_compact = Vfb(data_path / name, timing=False, compact_outlines=True)
+                vfb_compact.decompile()
+                for entry, entry_compact in zip(vfb.entries, vfb_compact.entries):
+                    if entry.id in (G.Glyph, G.mask):
+                        nodes = entry_compact.data.get("nodes", [])
+                        if nodes:
+                            assert isinstance(nodes, CompactOutline)
+                        assert nodes == entry.data.get("nodes", [])
+
+                for e in vfb.entries + vfb_compact.entries:
+                    e.modified = True
+                out = BytesIO()
+                out_compact = BytesIO()
+                vfb.write_bytes(out)
+                vfb_compact.write_bytes(out_compact)
+                assert out_compact.getvalue() == out.getvalue()
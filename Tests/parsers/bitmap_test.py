@@ -1,5 +1,4 @@
 from copy import deepcopy
-from io import BytesIO
 from unittest import TestCase
 
 from fontTools.misc.textTools import deHexStr
@@ -630,7 +629,7 @@ class BackgroundBitmapParserTest(TestCase):
 
     def test_read(self) -> None:
         parser = BaseBitmapParser()
-        parser.stream = BytesIO(deHexStr(rle_bin))
+        parser.buffer = deHexStr(rle_bin)
         result = parser._read_bitmap(20)
         assert result == rle_dec
 
@@ -1,6 +1,7 @@
 from unittest import TestCase
 
-from vfbLib.parsers.glyph import GlyphParser
+from vfbLib.helpers import deHexStr
+from vfbLib.parsers.glyph import GlyphParser, read_glyph_name
 
 
 class GlyphParserTest(TestCase):
@@ -112,3 +113,12 @@ class GlyphParserTest(TestCase):
         }
         result = GlyphParser().parse_hex(data)
         assert result == expected
+
+
+class ReadGlyphNameTest(TestCase):
+    def test_read_glyph_name(self):
+        data = deHexStr("01090701 01 91 64 61 67 67 65 72 08")
+        assert read_glyph_name(data) == "dagger"
+        assert read_glyph_name(memoryview(data)) == "dagger"
+        # No glyph name
+        assert read_glyph_name(deHexStr("01090701 08 8b 8b")) is None
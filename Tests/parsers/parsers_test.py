@@ -1,12 +1,76 @@
+import struct
+from io import BytesIO
 from unittest import TestCase
 
 from vfbLib.parsers.base import (
+    BufferReader,
     EncodedValueListParser,
     OpenTypeKerningClassFlagsParser,
     OpenTypeMetricsClassFlagsParser,
+    StreamReader,
+    get_struct,
 )
 
 
+class BufferReaderTest(TestCase):
+    def test_read(self):
+        reader = BufferReader()
+        reader.buffer = bytes.fromhex("ff 2c 01 02 00 00 80 8c 8e 61 62 63 8b")
+        assert reader.read_uint8() == 255
+        assert reader.read_int16() == 300
+        assert reader.read_uint32() == 0x80000002
+        assert reader.read_value() == 1
+        assert reader.read_str_with_len() == "abc"
+        assert reader.read_bytes(2) == b"\x8b"
+        assert reader.offset == len(reader.buffer)
+        assert reader.read_uint8() == 0
+        with self.assertRaises(EOFError):
+            reader.read_value()
+
+    def test_read_value_0(self):
+        data = bytes.fromhex("8c 00 8d 8e 00 8f")
+        buffer_reader = BufferReader()
+        buffer_reader.buffer = data
+        stream_reader = StreamReader()
+        stream_reader.stream = BytesIO(data)
+        for reader in (buffer_reader, stream_reader):
+            assert reader.read_value() == 1
+            # The 0 byte is consumed
+            with self.assertRaises(EOFError):
+                reader.read_value()
+            assert reader.read_value() == 2
+            # The values before the 0 byte and the 0 byte are consumed
+            with self.assertRaises(EOFError):
+                reader.read_values(3)
+            assert reader.read_value() == 4
+
+    def test_read_struct(self):
+        reader = BufferReader()
+        reader.buffer = bytes.fromhex("01 00 02 00 00 00 00 00 00 00 f0 3f 03")
+        assert reader.read_uint16s(2) == [1, 2]
+        assert reader.read_struct(get_struct("<d")) == (1.0,)
+        with self.assertRaises(struct.error):
+            reader.read_struct(get_struct("<H"))
+        # A truncated integer is read like from a stream
+        assert reader.read_uint16() == 3
+        assert reader.offset == len(reader.buffer)
+
+
+class StreamReaderTest(TestCase):
+    def test_read(self):
+        reader = StreamReader()
+        reader.stream = BytesIO(bytes.fromhex("ff 2c 01 02 00 00 80 8c 8e 61 62 63 8b"))
+        assert reader.read_uint8() == 255
+        assert reader.read_int16() == 300
+        assert reader.read_uint32() == 0x80000002
+        assert reader.read_value() == 1
+        assert reader.read_str_with_len() == "abc"
+        assert reader.read_bytes(2) == b"\x8b"
+        assert reader.read_uint8() == 0
+        with self.assertRaises(EOFError):
+            reader.read_value()
+
+
 class EncodedValueListParserTest(TestCase):
     def test_links_1(self):
         data = "8c 8d 89 8b"
@@ -14,6 +78,13 @@ class EncodedValueListParserTest(TestCase):
         result = EncodedValueListParser().parse_hex(data)
         assert result == expected
 
+    def test_memoryview(self):
+        # A memoryview, e.g. of a memory-mapped file, is parsed without copying it
+        data = memoryview(bytes.fromhex("8c 8d 89 8b 8c"))
+        parser = EncodedValueListParser()
+        assert parser.parse(data, 4, None) == [1, 2, -2, 0]
+        assert isinstance(parser.buffer, memoryview)
+
 
 class OpenTypeClassFlagsParserTest(TestCase):
     def test_2_masters_kerning(self):
@@ -4,7 +4,7 @@ from unittest import TestCase
 import pytest
 from fontTools.misc.textTools import deHexStr
 
-from vfbLib.parsers.value import read_value
+from vfbLib.parsers.value import read_value, read_values
 
 
 class ValueDecoderTest(TestCase):
@@ -75,3 +75,44 @@ class ValueDecoderTest(TestCase):
 
     def test_0xffffffefff(self):
         self.expect("ffffffefff", -4097)
+
+
+class ValuesDecoderTest(TestCase):
+    data = deHexStr("20 8b f6 f700 faff fb00 feff ff00001000 ffffffefff 8b")
+    decoded = [-107, 0, 107, 108, 1131, -108, -1131, 4096, -4097]
+
+    def test_read_values(self):
+        values, offset = read_values(self.data, 0, len(self.decoded))
+        assert values == self.decoded
+        assert offset == len(self.data) - 1
+
+    def test_read_values_offset(self):
+        values, offset = read_values(self.data, 2, 3)
+        assert values == [107, 108, 1131]
+        assert offset == 7
+
+    def test_read_values_unsigned(self):
+        values, _ = read_values(deHexStr("ffffffefff"), 0, 1, signed=False)
+        assert values == [0xFFFFEFFF]
+
+    def test_read_values_until_end(self):
+        values, offset = read_values(self.data, 0)
+        assert values == self.decoded + [0]
+        assert offset == len(self.data)
+
+    def test_read_values_until_zero(self):
+        values, offset = read_values(deHexStr("8b8c008d"), 0)
+        assert values == [0, 1]
+        assert offset == 3
+
+    def test_read_values_eof(self):
+        with pytest.raises(EOFError):
+            read_values(deHexStr("8b8c"), 0, 3)
+        with pytest.raises(EOFError):
+            read_values(deHexStr("8bf7"), 0, 2)
+        with pytest.raises(EOFError):
+            read_values(deHexStr("8b008c"), 0, 3)
+
+    def test_read_values_illegal(self):
+        with pytest.raises(ValueError):
+            read_values(deHexStr("8b19"), 0, 2)
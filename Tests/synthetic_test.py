@@ -0,0 +1,51 @@
+from io import BytesIO
+from unittest import TestCase
+
+from vfbLib.enum import G
+from vfbLib.synthetic import get_synthetic_vfb
+from vfbLib.vfb.vfb import Vfb
+
+
+class SyntheticVfbTest(TestCase):
+    def test_synthetic_vfb(self):
+        vfb = get_synthetic_vfb(
+            num_glyphs=20,
+            num_masters=4,
+            num_nodes=30,
+            num_kerning_pairs=3,
+            num_hints=2,
+            num_tt_commands=5,
+        )
+        out = BytesIO()
+        vfb.write_bytes(out)
+        data = out.getvalue()
+
+        read_vfb = Vfb(timing=False)
+        read_vfb.read_bytes(BytesIO(data))
+        read_vfb.decompile()
+        assert not read_vfb.any_errors
+        assert read_vfb.num_masters == 4
+
+        glyphs = [e.data for e in read_vfb.entries if e.id == G.Glyph]
+        assert len(glyphs) == 20
+        assert glyphs[0]["name"] == ".notdef"
+        assert glyphs[1]["name"] == "uni4E00"
+        glyph = glyphs[5]
+        assert len(glyph["nodes"]) == 30
+        assert len(glyph["nodes"][0]["points"]) == 4
+        assert [node["type"] for node in glyph["nodes"]].count("move") == 2
+        assert len(glyph["kerning"]) == 3
+        assert len(glyph["hints"]["h"]) == 2
+        assert len(glyph["hints"]["v"]) == 2
+        assert len(glyph["tth"]) == 5
+
+        # Recompiling the decompiled entries gives the same data
+        for entry in read_vfb.entries:
+            entry.modified = True
+        out = BytesIO()
+        read_vfb.write_bytes(out)
+        assert out.getvalue() == data
+
+    def test_num_masters(self):
+        with self.assertRaises(ValueError):
+            get_synthetic_vfb(num_glyphs=1, num_masters=3)
@@ -0,0 +1,83 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import orjson
+
+from vfbLib.ufo.builder import VfbToUfoBuilder
+from vfbLib.ufo.hashcache import GlyphHashCache
+from vfbLib.ufo.vfb2ufo import TT_UFO_LIB_KEY
+from vfbLib.vfb.vfb import Vfb
+
+vfb_path = Path(__file__).parent.parent / "Data" / "BinaryImport.vfb"
+
+
+def get_glyph_hashes(hash_cache=None) -> dict[str, str]:
+    vfb = Vfb(vfb_path, timing=False)
+    vfb.decompile()
+    builder = VfbToUfoBuilder(vfb, hash_cache=hash_cache)
+    ufo = builder.get_ufo_masters(silent=True)[0]
+    return {g.name: g.lib[TT_UFO_LIB_KEY]["id"] for g in ufo if TT_UFO_LIB_KEY in g.lib}
+
+
+class GlyphHashCacheTest(TestCase):
+    def test_cache(self):
+        hashes = get_glyph_hashes()
+        assert hashes
+        with TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "hashes.json"
+            assert get_glyph_hashes(cache_path) == hashes
+            cache = GlyphHashCache(cache_path)
+            assert len(cache) == len(hashes)
+            assert sorted(cache.hashes.values()) == sorted(hashes.values())
+
+            # The cached hashes are used instead of calculating them
+            for key in cache.hashes:
+                cache.set(key, "cached")
+            cache.save()
+            assert set(get_glyph_hashes(cache_path).values()) == {"cached"}
+
+            # A modified glyph is not looked up in the cache
+            cache = GlyphHashCache(cache_path)
+            vfb = Vfb(vfb_path, timing=False)
+            vfb.decompile()
+            for entry in vfb.entries:
+                entry.modified = True
+            builder = VfbToUfoBuilder(vfb, hash_cache=cache)
+            ufo = builder.get_ufo_masters(silent=True)[0]
+            ids = {g.lib[TT_UFO_LIB_KEY]["id"] for g in ufo if TT_UFO_LIB_KEY in g.lib}
+            assert ids == set(hashes.values())
+
+    def test_outdated(self):
+        with TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "hashes.json"
+            cache_path.write_bytes(
+                orjson.dumps({"version": 0, "fonttools": "", "hashes": {"a": "b"}})
+            )
+            assert len(GlyphHashCache(cache_path)) == 0
+
+    def test_vfblib_version_changed(self):
+        with TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "hashes.json"
+            cache = GlyphHashCache(cache_path)
+            cache.set("a", "b")
+            cache.save()
+            assert len(GlyphHashCache(cache_path)) == 1
+
+            # Hashes from another vfbLib version are not used
+            with patch("vfbLib.ufo.hashcache.get_vfblib_version", return_value="0.0"):
+                assert len(GlyphHashCache(cache_path)) == 0
+
+    def test_prune(self):
+        with TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "hashes.json"
+            cache = GlyphHashCache(cache_path)
+            cache.set("old", "a")
+            cache.save()
+
+            # Hashes that are not used in a run are not saved again
+            hashes = get_glyph_hashes(cache_path)
+            cache = GlyphHashCache(cache_path)
+            assert "old" not in cache
+            assert len(cache) == len(hashes)
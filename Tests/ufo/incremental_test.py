@@ -0,0 +1,61 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from vfbLib.enum import G
+from vfbLib.ufo.builder import VfbToUfoBuilder
+from vfbLib.ufo.incremental import get_manifest_path
+from vfbLib.vfb.vfb import Vfb
+
+vfb_path = Path(__file__).parent.parent / "Data" / "masters.vfb"
+
+
+def write_ufos(ufo_path: Path, incremental=True, shift=0) -> None:
+    vfb = Vfb(vfb_path, timing=False)
+    vfb.decompile()
+    if shift:
+        for entry in vfb.entries:
+            if entry.id == G.Glyph and entry.data.get("nodes"):
+                node = entry.data["nodes"][0]
+                node["points"] = [
+                    [(x + shift, y) for x, y in m] for m in node["points"]
+                ]
+                break
+    VfbToUfoBuilder(vfb).write(
+        ufo_path, silent=True, overwrite=not incremental, incremental=incremental
+    )
+
+
+def read_files(path: Path) -> dict[Path, bytes]:
+    return {
+        p.relative_to(path): p.read_bytes()
+        for p in sorted(path.rglob("*"))
+        if p.is_file() and p.suffix in (".glif", ".plist", ".fea")
+    }
+
+
+class IncrementalTest(TestCase):
+    def test_incremental(self):
+        with TemporaryDirectory() as tmp:
+            incremental_path = Path(tmp) / "incremental" / "masters.ufo"
+            full_path = Path(tmp) / "full" / "masters.ufo"
+            incremental_path.parent.mkdir()
+            full_path.parent.mkdir()
+
+            write_ufos(incremental_path)
+            manifest_path = get_manifest_path(incremental_path)
+            assert manifest_path.exists()
+            glif_path = incremental_path / "glyphs" / "t.glif"
+            mtime = glif_path.stat().st_mtime_ns
+
+            # Update from a modified VFB
+            write_ufos(incremental_path, shift=7)
+            write_ufos(full_path, incremental=False, shift=7)
+            assert not get_manifest_path(full_path).exists()
+            for i in range(4):
+                assert read_files(
+                    VfbToUfoBuilder.get_master_path(incremental_path, i)
+                ) == read_files(VfbToUfoBuilder.get_master_path(full_path, i))
+
+            # Unchanged glyphs were not rewritten
+            assert glif_path.stat().st_mtime_ns == mtime
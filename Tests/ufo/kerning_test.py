@@ -69,3 +69,25 @@ class UfoKerningTest(TestCase):
 
     def test_exception_unkerned(self):
         assert not kerning._is_exception("X", "hyphen")
+
+    def test_get_master_kerning(self):
+        k = UfoKerning(
+            glyph_order=glyph_order, groups=groups, mm_kerning=mmk, key_glyphs=kg
+        )
+        k.mm_kerning_names = {
+            ("public.kern1.A", "public.kern2.T"): [-100, 0],
+            ("Tbar", "Adieresis"): [0, -55],
+            ("Tbar", "A"): [0, 0],
+            ("P", "J"): [-90, 0],
+        }
+        assert k.get_master_kerning(0) == {
+            ("public.kern1.A", "public.kern2.T"): -100,
+            ("Tbar", "Adieresis"): 0,
+            ("Tbar", "A"): 0,
+            ("P", "J"): -90,
+        }
+        # Zero values are only kept for exceptions
+        assert k.get_master_kerning(1) == {
+            ("Tbar", "Adieresis"): -55,
+            ("Tbar", "A"): 0,
+        }
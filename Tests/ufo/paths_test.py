@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from vfbLib.outlines import CompactOutline
 from vfbLib.ufo.glyph import VfbToUfoGlyph
 from vfbLib.ufo.paths import UfoMasterGlyph
 
@@ -561,3 +562,107 @@ class PathsTest(TestCase):
             ("qcurve", False, None, [263, 353]),
             ("line", False, None, [424, 192]),
         ]
+
+    def test_masters_share_template(self):
+        mm_glyph = VfbToUfoGlyph()
+        mm_glyph.name = "a"
+        mm_glyph.mm_metrics = [(500, 0), (600, 0)]
+        mm_glyph.mm_nodes = [
+            {"type": "move", "flags": 0, "points": [[(0, 0)], [(10, 0)]]},
+            {"type": "line", "flags": 0, "points": [[(0, 100)], [(10, 110)]]},
+            {
+                "type": "curve",
+                "flags": 1,
+                "points": [
+                    [(100, 0), (50, 100), (100, 50)],
+                    [(120, 0), (60, 110), (120, 60)],
+                ],
+            },
+        ]
+        contours_0, _ = get_master_glyph(mm_glyph, [], 0)
+        template = mm_glyph.get_contour_template()
+        assert template is not None
+        # A label added after the first master was built is used by later masters
+        mm_glyph.point_labels[1] = "at01"
+        contours_1, _ = get_master_glyph(mm_glyph, [], 1)
+        # The template is released after the last master
+        assert mm_glyph.get_contour_template() is None
+        assert contours_0 == [
+            [
+                ("line", False, None, (0, 0)),
+                ("line", False, None, (0, 100)),
+                (None, False, None, (50, 100)),
+                (None, False, None, (100, 50)),
+                ("curve", True, None, (100, 0)),
+            ]
+        ]
+        assert contours_1 == [
+            [
+                ("line", False, None, (10, 0)),
+                ("line", False, "at01", (10, 110)),
+                (None, False, None, (60, 110)),
+                (None, False, None, (120, 60)),
+                ("curve", True, None, (120, 0)),
+            ]
+        ]
+
+    def test_masters_share_template_compact(self):
+        mm_glyph = VfbToUfoGlyph()
+        mm_glyph.name = "a"
+        mm_glyph.mm_metrics = [(500, 0), (600, 0), (700, 0)]
+        nodes = [
+            {"type": "move", "flags": 0, "points": [[(0, 0)], [(10, 0)], [(20, 0)]]},
+            {
+                "type": "curve",
+                "flags": 1,
+                "points": [
+                    [(100, 0), (50, 100), (100, 50)],
+                    [(120, 0), (60, 110), (120, 60)],
+                    [(140, 0), (70, 120), (140, 70)],
+                ],
+            },
+        ]
+        mm_glyph.mm_nodes = CompactOutline.from_nodes(nodes, 3)
+        list_glyph = VfbToUfoGlyph()
+        list_glyph.name = "a"
+        list_glyph.mm_metrics = mm_glyph.mm_metrics
+        list_glyph.mm_nodes = nodes
+        for m in range(3):
+            contours, _ = get_master_glyph(mm_glyph, [], m)
+            if m < 2:
+                assert mm_glyph.get_contour_template() is not None
+            assert contours == get_master_glyph(list_glyph, [], m)[0]
+            assert contours[0][-1] == ("curve", True, None, (100 + 20 * m, 0))
+        assert mm_glyph.get_contour_template() is None
+
+    def test_masters_independent(self):
+        mm_glyph = VfbToUfoGlyph()
+        mm_glyph.name = "a"
+        mm_glyph.mm_metrics = [(500, 0), (600, 0)]
+        mm_glyph.lib = {
+            "com.fontlab.v5.userData": {"key": "value"},
+            "public.truetype.instructions": {"formatVersion": "1", "assembly": ""},
+        }
+        mm_glyph.tth_commands = [{"code": "alignt", "point": "p1", "zone": "z"}]
+        masters = []
+        for i in range(2):
+            m = UfoMasterGlyph(mm_glyph, [], i)
+            m.build(minimal=True, include_ps_hints=False, encode_data_base64=False)
+            masters.append(m)
+        m0, m1 = masters
+        assert m0.lib == m1.lib
+        # Changing nested values of one master doesn't change the other masters
+        m0.lib["com.fontlab.v5.userData"]["key"] = "changed"
+        m0.lib["public.truetype.instructions"]["id"] = "hash"
+        m0.tth_commands[0]["point"] = "p2"
+        for lib in (m1.lib, mm_glyph.lib):
+            assert lib["com.fontlab.v5.userData"] == {"key": "value"}
+            assert lib["public.truetype.instructions"] == {
+                "formatVersion": "1",
+                "assembly": "",
+            }
+        assert (
+            m1.tth_commands
+            == mm_glyph.tth_commands
+            == [{"code": "alignt", "point": "p1", "zone": "z"}]
+        )
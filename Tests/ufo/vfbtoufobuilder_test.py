@@ -19,3 +19,59 @@ class VfbToUfoBuilderTest(TestCase):
         # Second master with number
         master_path = VfbToUfoBuilder.get_master_path(ufo_path, 1)
         assert master_path == ufo_path.parent / "my_ufo-1.ufo"
+
+    def test_get_ufo_masters_workers(self):
+        from vfbLib.vfb.vfb import Vfb
+
+        vfb = Vfb(Path(__file__).parent.parent / "Data" / "masters.vfb", timing=False)
+        vfb.decompile()
+        ufos = VfbToUfoBuilder(vfb).get_ufo_masters(silent=True)
+        ufos_workers = VfbToUfoBuilder(vfb).get_ufo_masters(silent=True, workers=2)
+        assert len(ufos) == 4
+        assert ufos_workers == ufos
+
+    def test_masters_not_shared(self):
+        from vfbLib.vfb.vfb import Vfb
+
+        vfb = Vfb(Path(__file__).parent.parent / "Data" / "masters.vfb", timing=False)
+        vfb.decompile()
+        m0, m1, *_ = VfbToUfoBuilder(vfb).get_ufo_masters(silent=True)
+        groups = dict(m1.groups)
+        assert groups
+        for glyphs in m0.groups.values():
+            glyphs.append("x")
+        m0.groups["new"] = ["a"]
+        assert m1.groups == groups
+
+        blues = list(m1.info.postscriptBlueValues)
+        m0.info.postscriptBlueValues.append(1000)
+        assert m1.info.postscriptBlueValues == blues
+
+    def test_write_workers(self):
+        from tempfile import TemporaryDirectory
+
+        from vfbLib.vfb.vfb import Vfb
+
+        vfb = Vfb(Path(__file__).parent.parent / "Data" / "masters.vfb", timing=False)
+        vfb.decompile()
+        with TemporaryDirectory() as tmp:
+            serial = Path(tmp) / "serial" / "masters.ufo"
+            parallel = Path(tmp) / "parallel" / "masters.ufo"
+            serial.parent.mkdir()
+            parallel.parent.mkdir()
+            VfbToUfoBuilder(vfb).write(serial, silent=True)
+            VfbToUfoBuilder(vfb).write(parallel, silent=True, workers=2)
+            for i in range(4):
+                serial_path = VfbToUfoBuilder.get_master_path(serial, i)
+                parallel_path = VfbToUfoBuilder.get_master_path(parallel, i)
+                files = sorted(
+                    p.relative_to(serial_path) for p in serial_path.rglob("*.*")
+                )
+                assert files == sorted(
+                    p.relative_to(parallel_path) for p in parallel_path.rglob("*.*")
+                )
+                for file in files:
+                    if (serial_path / file).is_file():
+                        assert (serial_path / file).read_bytes() == (
+                            parallel_path / file
+                        ).read_bytes()
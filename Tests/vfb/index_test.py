@@ -0,0 +1,82 @@
+from os import utime
+from pathlib import Path
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from vfbLib.enum import F, G
+from vfbLib.vfb.index import VfbIndex
+from vfbLib.vfb.vfb import Vfb
+
+data_path = Path(__file__).parent.parent / "Data"
+vfb_path = data_path / "IBMPlexSans-Medium.vfb"
+mm_vfb_path = data_path / "masters.vfb"
+
+
+class VfbIndexTest(TestCase):
+    def test_index_matches_entries(self) -> None:
+        vfb = Vfb(vfb_path, timing=False)
+        index = VfbIndex.from_path(vfb_path)
+        assert [r.id for r in index.records] == [e.id for e in vfb.entries]
+        for record, entry in zip(index.records, vfb.entries):
+            if isinstance(entry.data, bytes):
+                assert record.size == entry.size
+
+    def test_glyph_records(self) -> None:
+        index = VfbIndex.from_path(vfb_path)
+        assert index.num_glyphs == 991
+        records = index.glyph_records(5)
+        assert records[0] == index.glyph(5)
+        assert records[0].id == G.Glyph
+        assert all(r.glyph_index == 5 for r in records)
+        assert [r.key for r in records][:3] == ["Glyph", "Links", "VSB"]
+        assert index.find(F.features)[0].glyph_index is None
+
+    def test_load_entry(self) -> None:
+        vfb = Vfb(mm_vfb_path, only_header=True, timing=False)
+        assert vfb.entries == []
+        index = vfb.read_index()
+        assert vfb.num_masters == 4
+        entry = vfb.load_entry(index.glyph(1))
+        assert not entry.modified
+        entry.decompile()
+        assert not entry.modified
+        assert isinstance(entry.data, dict)
+        assert entry.data["num_masters"] == 4
+
+        full = Vfb(mm_vfb_path, timing=False)
+        full.decompile()
+        glyph_entries = [e for e in full.entries if e.id == G.Glyph]
+        assert entry.data == glyph_entries[1].data
+
+    def test_load_entry_mmap(self) -> None:
+        vfb = Vfb(vfb_path, only_header=True, timing=False, mmap=True)
+        index = vfb.read_index()
+        entry = vfb.load_entry(index.find(F.features)[0])
+        assert isinstance(entry.data, memoryview)
+        assert not entry.modified
+        entry.decompile()
+        assert isinstance(entry.data, list)
+        vfb.close()
+
+    def test_sidecar(self) -> None:
+        with TemporaryDirectory() as tempdir:
+            path = Path(tempdir) / vfb_path.name
+            copyfile(vfb_path, path)
+            assert VfbIndex.load_sidecar(path) is None
+
+            vfb = Vfb(path, only_header=True, timing=False)
+            index = vfb.read_index(sidecar=True)
+            assert VfbIndex.get_sidecar_path(path).exists()
+
+            loaded = VfbIndex.load_sidecar(path)
+            assert loaded is not None
+            assert loaded.records == index.records
+
+            # Touching the file invalidates the sidecar, unless the hash is checked
+            stat = path.stat()
+            utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert VfbIndex.load_sidecar(path) is None
+            loaded = VfbIndex.load_sidecar(path, check_hash=True)
+            assert loaded is not None
+            assert loaded.records == index.records
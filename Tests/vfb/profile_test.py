@@ -0,0 +1,55 @@
+from pathlib import Path
+from unittest import TestCase
+
+from vfbLib.enum import G
+from vfbLib.vfb.profile import VfbProfile
+from vfbLib.vfb.vfb import Vfb
+
+masters_vfb_path = Path(__file__).parent.parent / "Data" / "masters.vfb"
+
+
+class VfbProfileTest(TestCase):
+    def test_profile(self) -> None:
+        events: list[tuple[str, str, int, float]] = []
+        profile = VfbProfile(callback=lambda *args: events.append(args))
+        vfb = Vfb(masters_vfb_path, timing=False, profile=profile)
+        glyph_entries = [e for e in vfb.entries if e.id == G.Glyph]
+        glyph_bytes = sum(e.size for e in glyph_entries)
+
+        glyph = profile["Glyph"]
+        assert glyph.count == len(glyph_entries) == 2
+        assert glyph.bytes == glyph_bytes
+        assert glyph.parse_count == 0
+        assert sum(p.count for p in profile.entries.values()) == len(vfb.entries)
+
+        vfb.decompile()
+        assert glyph.parse_count == 2
+        assert glyph.parse_time > 0
+
+        for entry in glyph_entries:
+            entry.modified = True
+        vfb.compile()
+        assert glyph.compile_count == 2
+        assert glyph.compile_time > 0
+        assert profile["Glyph Hinting Options"].compile_count == 0
+
+        glyph_events = [
+            (event, size) for event, key, size, _ in events if key == "Glyph"
+        ]
+        sizes = [e.size for e in glyph_entries]
+        assert glyph_events == (
+            [("read", size) for size in sizes]
+            + [("parse", size) for size in sizes]
+            + [("compile", size) for size in sizes]
+        )
+
+        d = profile.as_dict()
+        assert d["Glyph"]["count"] == 2
+        assert profile.format().splitlines()[0].startswith("Entry")
+
+    def test_profile_workers(self) -> None:
+        profile = VfbProfile()
+        vfb = Vfb(masters_vfb_path, timing=False, profile=profile)
+        vfb.decompile(workers=2)
+        assert profile["Glyph"].parse_count == 2
+        assert profile["Encoding"].parse_count == profile["Encoding"].count
@@ -622,6 +622,25 @@ class VfbGlyphTest(TestCase):
         g.entry.decompile()
         assert g.entry.data["nodes"] == glyph_nodes_q_1m
 
+    def test_getPointPen_component(self):
+        vfb = Vfb(empty_vfb_path)
+        vfb.glyph_order = ["a", "b"]
+        vfb.glyph_ids = {"a": 0, "b": 1}
+        g = VfbGlyph(VfbEntry(vfb, parser=GlyphParser, compiler=GlyphCompiler), vfb)
+        pen = g.getPointPen()
+        pen.addComponent("b", (1, 0, 0, 1, 10, 20))
+        assert g.entry.data["components"] == [
+            {
+                "gid": 1,
+                "offsetX": [10],
+                "offsetY": [20],
+                "scaleX": [1],
+                "scaleY": [1],
+            }
+        ]
+        with self.assertRaises(KeyError):
+            pen.addComponent("c", (1, 0, 0, 1, 0, 0))
+
     def test_getPointPenMM(self):
         # FIXME
         pass
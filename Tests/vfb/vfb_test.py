@@ -1,9 +1,15 @@
 from io import BytesIO
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest import TestCase
+from unittest.mock import patch
 
-from vfbLib.vfb.vfb import Vfb
+import pytest
+
+from vfbLib.enum import G
+from vfbLib.parsers.glyph import GlyphParser
+from vfbLib.vfb.index import glyph_entry_ids
+from vfbLib.vfb.vfb import Vfb, _decompile_chunk, iter_glyph_records
 
 empty_vfb_path = Path(__file__).parent.parent / "Data" / "empty_522.vfb"
 
@@ -55,3 +61,181 @@ class VfbGlyphTest(TestCase):
         out = BytesIO()
         vfb.write_bytes(out)
         out.seek(0)
+
+    def test_read_mmap(self) -> None:
+        vfb = Vfb(empty_vfb_path, timing=False)
+        vfb_mm = Vfb(empty_vfb_path, timing=False, mmap=True)
+        assert len(vfb_mm.entries) == len(vfb.entries)
+        for entry, entry_mm in zip(vfb.entries, vfb_mm.entries):
+            assert entry.id == entry_mm.id
+            if isinstance(entry.data, bytes):
+                # Entries that were not decompiled while reading
+                assert isinstance(entry_mm.data, memoryview)
+            assert entry_mm.data == entry.data
+
+        vfb.decompile()
+        vfb_mm.decompile()
+        assert vfb_mm.as_dict() == vfb.as_dict()
+        vfb_mm.close()
+
+    def test_write_mmap(self) -> None:
+        with open(empty_vfb_path, "rb") as f:
+            original = f.read()
+        vfb = Vfb(empty_vfb_path, timing=False, mmap=True)
+        out = BytesIO()
+        vfb.write_bytes(out)
+        assert out.getvalue() == original
+
+        # Closing copies the remaining mapped data into memory
+        vfb.close()
+        assert all(not isinstance(e.data, memoryview) for e in vfb.entries)
+        out = BytesIO()
+        vfb.write_bytes(out)
+        assert out.getvalue() == original
+
+    def test_decompile_workers(self) -> None:
+        path = empty_vfb_path.parent / "masters.vfb"
+        vfb = Vfb(path, timing=False)
+        vfb.decompile()
+        vfb_parallel = Vfb(path, timing=False)
+        vfb_parallel.decompile(workers=2)
+        assert vfb_parallel.as_dict() == vfb.as_dict()
+        assert not vfb_parallel.any_errors
+
+    def test_decompile_chunk_settings(self) -> None:
+        # The workers get the encoding and master count of the Vfb
+        def get_settings(parser):
+            vfb = parser.vfb
+            return vfb.encoding, vfb.num_masters, vfb.compact_outlines
+
+        with patch.object(GlyphParser, "_parse", get_settings):
+            results = _decompile_chunk([(G.Glyph, b"")], "utf-8", 4, True)
+        assert [r[:2] for r in results] == [(True, ("utf-8", 4, True))]
+
+    def test_decompile_workers_error(self) -> None:
+        path = empty_vfb_path.parent / "masters.vfb"
+        vfb = Vfb(path, timing=False)
+        glyph_entries = [e for e in vfb.entries if e.id == G.Glyph]
+        glyph_entries[1].data = b"\x01\x09\x07\x01\xee"
+        with pytest.raises(ValueError):
+            vfb.decompile(workers=2)
+        assert vfb.any_errors
+        # Entries before the broken one have been decompiled
+        assert isinstance(glyph_entries[0].data, dict)
+
+    def test_lazy(self) -> None:
+        path = empty_vfb_path.parent / "masters.vfb"
+        vfb = Vfb(path, timing=False)
+        vfb.decompile()
+        vfb_lazy = Vfb(path, timing=False, lazy=True)
+        glyph_entries = [e for e in vfb_lazy.entries if e.id == G.Glyph]
+        assert all(e.is_compiled for e in glyph_entries)
+
+        # Accessing the data decompiles the entry
+        assert isinstance(glyph_entries[0].data, dict)
+        assert not glyph_entries[0].is_compiled
+        assert glyph_entries[1].is_compiled
+
+        # The raw accessor does not decompile
+        assert isinstance(glyph_entries[1].raw, bytes)
+        assert glyph_entries[1].is_compiled
+
+        assert vfb_lazy.as_dict() == vfb.as_dict()
+
+    def test_lazy_write(self) -> None:
+        path = empty_vfb_path.parent / "masters.vfb"
+        with open(path, "rb") as f:
+            original = f.read()
+        vfb = Vfb(path, timing=False, lazy=True)
+        out = BytesIO()
+        vfb.write_bytes(out)
+        assert out.getvalue() == original
+        assert all(e.is_compiled for e in vfb.entries if e.id == G.Glyph)
+
+    def test_iter_glyph_records(self) -> None:
+        path = empty_vfb_path.parent / "masters.vfb"
+        vfb = Vfb(path, timing=False)
+        vfb.decompile()
+        expected = []
+        for entry in vfb.entries:
+            if entry.id == G.Glyph:
+                expected.append((entry.data, []))
+            elif entry.id in glyph_entry_ids and expected:
+                expected[-1][1].append((entry.id, entry.data))
+
+        records = list(iter_glyph_records(path, decompile=True))
+        assert len(records) == len(expected)
+        for record, (glyph_data, entries) in zip(records, expected):
+            assert record.glyph.data == glyph_data
+            assert [(e.id, e.data) for e in record.entries] == entries
+
+    def test_iter_glyph_records_drop_keys(self) -> None:
+        path = empty_vfb_path.parent / "masters.vfb"
+        records = list(iter_glyph_records(path, drop_keys={G.unicodes}))
+        assert records
+        for record in records:
+            assert record.glyph.is_compiled
+            assert all(e.id != G.unicodes for e in record.entries)
+
+    def test_write_unmodified(self) -> None:
+        path = empty_vfb_path.parent / "IBMPlexSans-Medium.vfb"
+        with open(path, "rb") as f:
+            original = f.read()
+        vfb = Vfb(path, timing=False)
+        vfb.decompile()
+        assert not any(e.modified for e in vfb.entries if e.id == G.Glyph)
+        with TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "out.vfb"
+            vfb.write(out_path)
+            with open(out_path, "rb") as f:
+                assert f.read() == original
+
+        # Unmodified entries stay decompiled
+        assert all(isinstance(e.data, dict) for e in vfb.entries if e.id == G.Glyph)
+
+    def test_write_modified(self) -> None:
+        path = empty_vfb_path.parent / "masters.vfb"
+        vfb = Vfb(path, timing=False)
+        vfb.decompile()
+        glyph_entries = [e for e in vfb.entries if e.id == G.Glyph]
+        glyph_entries[1].data["name"] = "renamed"
+        assert glyph_entries[1].modified
+        assert not glyph_entries[0].modified
+        with TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "out.vfb"
+            vfb.write(out_path)
+            out = BytesIO()
+            vfb.write_bytes(out)
+            with open(out_path, "rb") as f:
+                assert f.read() == out.getvalue()
+
+            written = Vfb(out_path, timing=False)
+            written.decompile()
+            names = [e.data["name"] for e in written.entries if e.id == G.Glyph]
+            assert names[1] == "renamed"
+            assert len(written.entries) == len(vfb.entries)
+
+    def test_write_after_lookup(self) -> None:
+        for name, key in (("masters.vfb", "t"), ("IBMPlexSans-Medium.vfb", "A")):
+            path = empty_vfb_path.parent / name
+            with open(path, "rb") as f:
+                original = f.read()
+            vfb = Vfb(path, timing=False)
+            glyph = vfb[key]
+            assert glyph.entry.data["name"] == key
+            # Only the glyph that was handed out may have been changed
+            assert [e for e in vfb.entries if e.modified] == [glyph.entry]
+            out = BytesIO()
+            vfb.write_bytes(out)
+            assert out.getvalue() == original
+            # It was compiled to the original data
+            assert not glyph.entry.modified
+
+    def test_write_header_size_changed(self) -> None:
+        path = empty_vfb_path.parent / "masters.vfb"
+        vfb = Vfb(path, timing=False)
+        entry = [e for e in vfb.entries if e.id == G.Glyph][0]
+        header = entry.header
+        entry.data = entry.raw + b"\x00"
+        assert entry.header != header
+        assert entry.header[2:] == (entry.size).to_bytes(2, "little")
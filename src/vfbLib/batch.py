@@ -0,0 +1,104 @@
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
+
+# A function that converts one input file, using the parsed command line arguments
+ConvertFunc = Callable[[Path, Namespace], None]
+
+
+def add_batch_arguments(
+    parser: ArgumentParser, inputpath_help: str = "input file path(s) (.vfb)"
+) -> None:
+    """
+    Add the input path and batch processing arguments to a command line parser.
+    """
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes when converting more than one file",
+    )
+    parser.add_argument(
+        "inputpath",
+        type=str,
+        nargs="+",
+        help=inputpath_help,
+    )
+
+
+def get_input_paths(args: Namespace) -> list[Path]:
+    """
+    Return the input paths from the parsed command line arguments. Exit with an error
+    message if any of the files doesn't exist.
+    """
+    paths = [Path(p) for p in args.inputpath]
+    for path in paths:
+        if not path.exists():
+            print(f"File not found: '{path}'", file=sys.stderr)
+            sys.exit(1)
+    return paths
+
+
+def _run_timed(convert: ConvertFunc, path: Path, args: Namespace) -> float:
+    start = perf_counter()
+    convert(path, args)
+    return perf_counter() - start
+
+
+def run_batch(
+    convert: ConvertFunc, paths: list[Path], args: Namespace, jobs: int | None = None
+) -> int:
+    """
+    Convert many files, optionally in a process pool, and report the time per file.
+    Errors are reported and the remaining files are still converted.
+
+    Args:
+        convert (ConvertFunc): The function to convert one file. It must be defined at
+            module level, so it can be used in worker processes.
+        paths (list[Path]): The input file paths.
+        args (Namespace): The parsed command line arguments, passed to `convert`.
+        jobs (int | None, optional): The number of worker processes. If None or 1,
+            the files are converted in the current process. Defaults to None.
+
+    Returns:
+        int: The number of files that could not be converted.
+    """
+    start = perf_counter()
+    failed: list[Path] = []
+
+    def report(path: Path, duration: float | None, error: BaseException | None):
+        if error is None:
+            print(f"{path}: {duration:.2f} s")
+        else:
+            failed.append(path)
+            print(f"{path}: FAILED: {error!r}", file=sys.stderr)
+
+    if jobs is None or jobs < 2:
+        for path in paths:
+            try:
+                report(path, _run_timed(convert, path, args), None)
+            except Exception as e:
+                report(path, None, e)
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(_run_timed, convert, path, args): path for path in paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    report(path, future.result(), None)
+                except Exception as e:
+                    report(path, None, e)
+
+    print(
+        f"Processed {len(paths)} files in {perf_counter() - start:.2f} s, "
+        f"{len(failed)} failed."
+    )
+    for path in failed:
+        print(f"    {path}", file=sys.stderr)
+    return len(failed)
@@ -1,11 +1,28 @@
 import logging
-from argparse import ArgumentParser
+import sys
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
-from vfbLib.enum import F
-from vfbLib.json import save_vfb_json
-from vfbLib.ufo.builder import VfbToUfoBuilder
-from vfbLib.vfb.vfb import Vfb
+from vfbLib.batch import add_batch_arguments, get_input_paths, run_batch
+
+# The modules for the actual conversion are imported in the functions that use them,
+# so the command line is parsed without importing ufoLib2, fontTools etc.
+
+
+def _vfb2json_file(vfb_path: Path, args: Namespace) -> None:
+    from vfbLib.json import save_vfb_json
+
+    print(f"Reading file {vfb_path} ...")
+    save_vfb_json(
+        vfb_path,
+        out_path=args.path[0] if args.path else None,
+        only_header=args.header,
+        minimal=args.minimal,
+        unicode_strings=args.unicode_strings,
+        no_decompile=args.no_decompile,
+        roundtrip=args.roundtrip,
+        profile=args.profile,
+    )
 
 
 def vfb2json():
@@ -39,6 +56,12 @@ def vfb2json():
         nargs=1,
         help="output folder",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="print the number, size and read, parse and compile times of entries",
+    )
     parser.add_argument(
         "-r",
         "--roundtrip",
@@ -53,37 +76,64 @@ def vfb2json():
         default=False,
         help="force strings to be interpreted as Unicode instead of Windows-1252",
     )
-    parser.add_argument(
-        "inputpath",
-        type=str,
-        nargs=1,
-        help="input file path (.vfb)",
-    )
+    add_batch_arguments(parser)
     args = parser.parse_args()
     if args:
-        vfb_path = Path(args.inputpath[0])
-        if not vfb_path.exists():
-            import sys
-
-            print(f"File not found: '{vfb_path}'", file=sys.stderr)
-            sys.exit(1)
-
+        vfb_paths = get_input_paths(args)
         print(parser.description)
-        print(f"Reading file {vfb_path} ...")
-        save_vfb_json(
-            vfb_path,
-            out_path=args.path[0] if args.path else None,
-            only_header=args.header,
-            minimal=args.minimal,
-            unicode_strings=args.unicode_strings,
-            no_decompile=args.no_decompile,
-            roundtrip=args.roundtrip,
-        )
+        if len(vfb_paths) > 1:
+            sys.exit(1 if run_batch(_vfb2json_file, vfb_paths, args, args.jobs) else 0)
+
+        _vfb2json_file(vfb_paths[0], args)
 
     else:
         parser.print_help()
 
 
+def _vfb2ufo_file(vfb_path: Path, args: Namespace) -> None:
+    from vfbLib.enum import F
+    from vfbLib.ufo.builder import VfbToUfoBuilder
+    from vfbLib.vfb.vfb import Vfb
+
+    if not args.silent:
+        print(f"Reading file {vfb_path} ...")
+    vfb = Vfb(
+        vfb_path,
+        minimal=args.minimal,
+        drop_keys={F.Encoding, F.EncodingDefault},
+        unicode_strings=args.unicode_strings,
+    )
+    suffix = ".ufo"
+    if args.zip and not args.json:
+        suffix += "z"
+    if args.outputpath:
+        out_path = Path(args.outputpath)
+    elif args.path:
+        out_path = (Path(args.path[0]) / vfb_path.name).with_suffix(suffix)
+    else:
+        out_path = vfb_path.with_suffix(suffix)
+    vfb.decompile()
+    builder = VfbToUfoBuilder(
+        vfb,
+        minimal=args.minimal,
+        base64=args.base64,
+        pshints=not args.no_postscript_hints,
+        add_kerning_groups=args.add_kerning_groups,
+        move_groups=not args.keep_groups,
+        normalize=not args.no_normalize,
+        hash_cache=Path(args.hash_cache[0]) if args.hash_cache else None,
+    )
+    builder.write(
+        out_path,
+        overwrite=args.force_overwrite,
+        silent=args.silent,
+        ufoz=args.zip,
+        json=args.json,
+        workers=args.workers,
+        incremental=args.incremental,
+    )
+
+
 def vfb2ufo():
     parser = ArgumentParser(
         description="vfb3ufo Converter\nCopyright (c) 2026 by LucasFonts"
@@ -175,18 +225,6 @@ def vfb2ufo():
         default=False,
         help="write UFOZ (compressed UFO)",
     )
-    parser.add_argument(
-        "inputpath",
-        type=str,
-        nargs=1,
-        help="input file path (.vfb)",
-    )
-    parser.add_argument(
-        "outputpath",
-        type=str,
-        nargs="?",
-        help="output file path (.ufo[z])",
-    )
     parser.add_argument(
         "-m",
         "--minimal",
@@ -201,49 +239,44 @@ def vfb2ufo():
         default=False,
         help="force strings to be interpreted as Unicode instead of Windows-1252",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes to build and save master UFOs in parallel",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=False,
+        help="only write glyphs that have changed since the last incremental run",
+    )
+    parser.add_argument(
+        "--hash-cache",
+        type=str,
+        nargs=1,
+        help="cache file for TrueType glyph hashes, reused across runs",
+    )
+    add_batch_arguments(
+        parser,
+        "input file path(s) (.vfb), or one input file path followed by the output "
+        "file path (.ufo[z])",
+    )
     args = parser.parse_args()
     if args:
-        vfb_path = Path(args.inputpath[0])
-        if not vfb_path.exists():
-            import sys
-
-            print(f"File not found: '{vfb_path}'", file=sys.stderr)
-            sys.exit(1)
-
         if args.verbose:
             logging.basicConfig(level=logging.DEBUG)
         if not args.silent:
             print(parser.description)
-            print(f"Reading file {vfb_path} ...")
-        vfb = Vfb(
-            vfb_path,
-            minimal=args.minimal,
-            drop_keys={F.Encoding, F.EncodingDefault},
-            unicode_strings=args.unicode_strings,
-        )
-        suffix = ".ufo"
-        if args.zip and not args.json:
-            suffix += "z"
-        if args.path:
-            out_path = (Path(args.path[0]) / vfb_path.name).with_suffix(suffix)
-        else:
-            out_path = vfb_path.with_suffix(suffix)
-        vfb.decompile()
-        builder = VfbToUfoBuilder(
-            vfb,
-            minimal=args.minimal,
-            base64=args.base64,
-            pshints=not args.no_postscript_hints,
-            add_kerning_groups=args.add_kerning_groups,
-            move_groups=not args.keep_groups,
-            normalize=not args.no_normalize,
-        )
-        builder.write(
-            out_path,
-            overwrite=args.force_overwrite,
-            silent=args.silent,
-            ufoz=args.zip,
-            json=args.json,
-        )
+
+        # Support the single file syntax "vfb3ufo inputpath outputpath"
+        args.outputpath = None
+        if len(args.inputpath) == 2 and not args.inputpath[1].lower().endswith(".vfb"):
+            args.outputpath = args.inputpath.pop()
+        vfb_paths = get_input_paths(args)
+        if len(vfb_paths) > 1:
+            sys.exit(1 if run_batch(_vfb2ufo_file, vfb_paths, args, args.jobs) else 0)
+
+        _vfb2ufo_file(vfb_paths[0], args)
     else:
         parser.print_help()
@@ -2,7 +2,7 @@ from io import BytesIO
 from struct import pack
 from typing import TYPE_CHECKING
 
-from vfbLib.compilers.value import write_value, write_value_long
+from vfbLib.compilers.value import encode_values, write_value, write_value_long
 from vfbLib.helpers import deHexStr, hexStr, int8_size, int16_size, int32_size
 
 if TYPE_CHECKING:
@@ -159,6 +159,17 @@ class StreamWriter:
         else:
             write_value_long(value, self.stream, signed)
 
+    def write_values(self, values: "Iterable[int]", signed: bool = True) -> None:
+        """
+        Encode several int values in their shortest representation and write them to
+        the stream at once.
+
+        Args:
+            values (Iterable[int]): The values to write to the stream.
+            signed (bool, optional): Whether the values are signed. Defaults to True.
+        """
+        self.stream.write(encode_values(values, signed=signed))
+
 
 class BaseCompiler(StreamWriter):
     """
@@ -219,15 +230,13 @@ class BaseCompiler(StreamWriter):
 
 class EncodedValueListCompiler(BaseCompiler):
     def _compile(self, data: "Any") -> None:
-        for value in data:
-            self.write_value(value)
+        self.write_values(data)
 
 
 class EncodedValueListWithCountCompiler(BaseCompiler):
     def _compile(self, data: list[int]) -> None:
         self.write_value(len(data))
-        for value in data:
-            self.write_value(value)
+        self.write_values(data)
 
 
 class GlyphEncodingCompiler(BaseCompiler):
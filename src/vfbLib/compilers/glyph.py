@@ -3,12 +3,11 @@ from io import BytesIO
 from struct import pack
 from typing import TYPE_CHECKING, Any
 
-from fontTools.ttLib.tables.ttProgram import Program
-
 from vfbLib import DIRECTIONS, GLYPH_CONSTANT, gdef_class_names
 from vfbLib.compilers.base import BaseCompiler, StreamWriter
 from vfbLib.compilers.guides import GuidesCompiler
-from vfbLib.parsers.glyph import PathCommand
+from vfbLib.compilers.value import encode_values
+from vfbLib.outlines import CompactOutline, PathCommand
 from vfbLib.truetype import TT_COMMAND_CONSTANTS, TT_COMMANDS
 
 if TYPE_CHECKING:
@@ -30,10 +29,12 @@ class GlyphAnchorsCompiler(BaseCompiler):
         assert self.vfb is not None
         self.write_value(len(data), signed=False)
         self.write_value(self.vfb.num_masters, signed=False)
+        values: list[int] = []
         for anchor in data:
             for i in range(self.vfb.num_masters):
-                self.write_value(anchor["x"][i])
-                self.write_value(anchor["y"][i])
+                values.append(anchor["x"][i])
+                values.append(anchor["y"][i])
+        self.write_values(values)
 
 
 class GlyphAnchorsSuppCompiler(BaseCompiler):
@@ -86,6 +87,8 @@ class GlyphCompiler(BaseCompiler):
             # See if there is any data to merge
             if "nodes" in master_data:
                 assert "nodes" in data
+                if isinstance(data["nodes"], CompactOutline):
+                    data["nodes"] = data["nodes"].to_list()
                 for i, tgt in enumerate(data["nodes"]):
                     src = master_data["nodes"][i]
                     for key in ("type", "flags"):
@@ -165,6 +168,9 @@ class GlyphCompiler(BaseCompiler):
         instructions = imported.get("instructions")
         self.write_uint8(0x2B)
         if instructions:
+            # Only imported when needed, fontTools.ttLib is slow to import
+            from fontTools.ttLib.tables.ttProgram import Program
+
             p = Program()
             p.fromAssembly(instructions)
             bytecode = p.getBytecode()
@@ -237,12 +243,13 @@ class GlyphCompiler(BaseCompiler):
         self.write_uint8(3)
         for direction in DIRECTIONS:
             if direction_hints := hints.get(direction):
-                self.write_value(len(direction_hints))
+                values = [len(direction_hints)]
                 for mm_hint in direction_hints:
                     for i in range(self.num_masters):
                         hint = mm_hint[i]
-                        self.write_value(hint["pos"])
-                        self.write_value(hint["width"])
+                        values.append(hint["pos"])
+                        values.append(hint["width"])
+                self.write_values(values)
             else:
                 self.write_value(0)
 
@@ -278,11 +285,11 @@ class GlyphCompiler(BaseCompiler):
             return
 
         self.write_uint8(6)
-        self.write_value(len(kerning))
-        for gid, values in kerning.items():
-            self.write_value(gid)
-            for value in values:
-                self.write_value(value)
+        values = [len(kerning)]
+        for gid, master_values in kerning.items():
+            values.append(gid)
+            values.extend(master_values)
+        self.write_values(values)
 
     def _compile_metrics(self, data):
         # Metrics
@@ -290,10 +297,10 @@ class GlyphCompiler(BaseCompiler):
             return
 
         self.write_uint8(2)
+        values: list[int] = []
         for i in range(self.num_masters):
-            x, y = metrics[i]
-            self.write_value(x)
-            self.write_value(y)
+            values.extend(metrics[i])
+        self.write_values(values)
 
     def compile_outlines(self, data, write_key=True):
         # Outlines
@@ -322,10 +329,7 @@ class GlyphOriginCompiler(BaseCompiler):
 class GlyphSketchCompiler(BaseCompiler):
     def _compile(self, data: list[tuple[int, int, int]]) -> None:
         self.write_value(len(data), signed=False)
-        for a, b, c in data:
-            self.write_value(a)
-            self.write_value(b)
-            self.write_value(c)
+        self.write_values(value for point in data for value in point)
 
 
 class GlyphUnicodesCompiler(BaseCompiler):
@@ -347,10 +351,10 @@ class InstructionsCompiler(BaseCompiler):
             command_id = TT_COMMAND_CONSTANTS[cmd["cmd"]]
             self.write_uint8(command_id)
             params = cmd["params"]
-            for param_name in TT_COMMANDS[command_id]["params"]:
-                self.write_value(params[param_name])
-        for _ in range(3):
-            self.write_value(0)
+            self.write_values(
+                params[param_name] for param_name in TT_COMMANDS[command_id]["params"]
+            )
+        self.write_values((0, 0, 0))
 
 
 class OutlinesCompiler(StreamWriter):
@@ -361,42 +365,68 @@ class OutlinesCompiler(StreamWriter):
         return self.stream.getvalue(), num_values
 
     def _compile(self, data: Any) -> int:
-        self.write_value(len(data))  # Number of nodes, may be 0
+        if isinstance(data, CompactOutline) and data.num_masters == self.num_masters:
+            return self._compile_compact(data)
+
+        # Number of nodes, may be 0
+        buffer = encode_values((len(data),))
         num_values = 0
         # Reference coordinates to build relative values for each master
         ref_coords = [[0, 0] for _ in range(self.num_masters)]
         for node in data:
             type_flags = node.get("flags", 0) * 16 + PathCommand[node["type"]].value
-            self.write_uint8(type_flags)
+            buffer.append(type_flags)
             num_values += 1
+            values: list[int] = []
             for j in range(len(node["points"][0])):
                 for i in range(self.num_masters):
                     x, y = node["points"][i][j]
                     refx, refy = ref_coords[i]
                     # Coordinates are written relatively to the previous coords
-                    self.write_value(x - refx)
-                    self.write_value(y - refy)
-                    num_values += 2
+                    values.append(x - refx)
+                    values.append(y - refy)
                     ref_coords[i] = [x, y]
+            encode_values(values, buffer)
+            num_values += len(values)
+        self.write_bytes(buffer)
         return 2 * num_values
 
+    def _compile_compact(self, data: CompactOutline) -> int:
+        buffer = encode_values((len(data),))
+        coords = data.coords
+        starts = data.starts
+        stride = 2 * self.num_masters
+        # Reference coordinates to build relative values, x and y per master
+        ref = [0] * stride
+        values: list[int] = []
+        for i, type_flags in enumerate(data.types):
+            buffer.append(type_flags)
+            values.clear()
+            start = starts[i]
+            end = starts[i + 1]
+            for k in range(start, end, stride):
+                # Coordinates are written relatively to the previous coords
+                point = coords[k : k + stride]  # noqa: E203
+                values.extend(v - r for v, r in zip(point, ref))
+                ref = point.tolist()
+            encode_values(values, buffer)
+        self.write_bytes(buffer)
+        return 2 * (len(data) + len(coords))
+
 
 class LinksCompiler(BaseCompiler):
     def _compile(self, data: "LinkDict") -> None:
         for direction in ("y", "x"):
             dir_links = data[direction]
             self.write_value(len(dir_links))
-            for p0, p1 in dir_links:
-                self.write_value(p0)
-                self.write_value(p1)
+            self.write_values(value for link in dir_links for value in link)
 
 
 class MaskCompiler(GlyphCompiler):
     def _compile(self, data: "MaskData") -> None:
         weight_vector = data["weight_vector"]
         self.write_value(len(weight_vector))
-        for value in weight_vector:
-            self.write_value(round(value * 100_000_000))
+        self.write_values(round(value * 100_000_000) for value in weight_vector)
 
         self.num_masters = data["num_masters"]
         self.compile_outlines(data, write_key=False)
@@ -417,7 +447,4 @@ class MaskMetricsCompiler(BaseCompiler):
 
 class MaskMetricsMMCompiler(BaseCompiler):
     def _compile(self, data: list[tuple[int, int]]) -> None:
-        for value in data:
-            x, y = value
-            self.write_value(x)
-            self.write_value(y)
+        self.write_values(value for point in data for value in point)
@@ -2,9 +2,22 @@ from struct import pack
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from io import BufferedIOBase
 
 
+# Precomputed short encodings for the values -1131 to 1131
+_short_encodings: list[bytes] = []
+for _value in range(-1131, 1132):
+    if -107 <= _value <= 107:
+        _short_encodings.append(pack(">B", (_value + 0x8B)))
+    elif _value > 107:
+        _short_encodings.append(pack(">H", (_value + 0xF694)))
+    else:
+        _short_encodings.append(pack(">H", (-_value + 0xFA94)))
+del _value
+
+
 def write_value(value: int, stream: "BufferedIOBase", signed=True) -> None:
     """
     Encode and write an int value to the stream in the shortest possible representation.
@@ -14,21 +27,12 @@ def write_value(value: int, stream: "BufferedIOBase", signed=True) -> None:
         stream (BufferedIOBase): The output stream.
         signed (bool, optional): Whether the value is signed. Defaults to True.
     """
-    if -107 <= value <= 107:
-        # 1-byte representation
-        encoded = pack(">B", (value + 0x8B))
-    elif 107 < value <= 1131:
-        # 2-byte representation
-        encoded = pack(">H", (value + 0xF694))
-    elif -1131 <= value < -107:
-        # 2-byte representation, negative values
-        encoded = pack(">H", (-value + 0xFA94))
+    if -1131 <= value <= 1131:
+        # 1-byte or 2-byte representation
+        stream.write(_short_encodings[value + 1131])
     else:
         # 5-byte representation
         write_value_long(value, stream, signed)
-        return
-
-    stream.write(encoded)
 
 
 def write_value_long(value: int, stream: "BufferedIOBase", signed=True) -> None:
@@ -44,3 +48,31 @@ def write_value_long(value: int, stream: "BufferedIOBase", signed=True) -> None:
     fmt = "i" if signed else "I"
     encoded = pack(f">B{fmt}", 0xFF, value)
     stream.write(encoded)
+
+
+def encode_values(
+    values: "Iterable[int]", buffer: bytearray | None = None, signed=True
+) -> bytearray:
+    """
+    Encode int values in their shortest possible representation and append them to a
+    buffer in a single pass. This is the bulk version of `write_value`.
+
+    Args:
+        values (Iterable[int]): The values to encode.
+        buffer (bytearray | None, optional): The buffer to append the encoded values
+            to. If None, a new buffer is created. Defaults to None.
+        signed (bool, optional): Whether the values are signed. Defaults to True.
+
+    Returns:
+        bytearray: The buffer.
+    """
+    if buffer is None:
+        buffer = bytearray()
+    fmt = ">Bi" if signed else ">BI"
+    short_encodings = _short_encodings
+    for value in values:
+        if -1131 <= value <= 1131:
+            buffer += short_encodings[value + 1131]
+        else:
+            buffer += pack(fmt, 0xFF, value)
+    return buffer
@@ -1,13 +1,261 @@
 import codecs
 from argparse import ArgumentParser
+from collections.abc import Iterator
 from difflib import HtmlDiff, unified_diff
 from pathlib import Path
+from typing import Any, NamedTuple
 
 import orjson
 
+from vfbLib.helpers import hexStr
+from vfbLib.parsers.glyph import read_glyph_name
+from vfbLib.vfb.entry import VfbEntry
+from vfbLib.vfb.index import VfbIndex, VfbIndexRecord
 from vfbLib.vfb.vfb import Vfb
 
 
+class Missing:
+    """
+    The value of a difference for something that only exists in one of the files.
+    """
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+MISSING = Missing()
+
+
+class VfbDifference(NamedTuple):
+    """
+    A difference between two VFB files.
+    """
+
+    # Where the difference was found, e.g. "glyph 'a' / Glyph.metrics[0]"
+    path: str
+    # The value in the first file, or MISSING
+    old: Any
+    # The value in the second file, or MISSING
+    new: Any
+
+
+# The index records of a glyph or of the font, by entry id and occurrence
+RecordGroup = dict[tuple[int, int], VfbIndexRecord]
+
+
+class VfbDiffSource:
+    """
+    A VFB file prepared for diffing. Only the entry headers are scanned, and entries
+    are decompiled on request.
+    """
+
+    def __init__(self, vfb_path: Path) -> None:
+        self.vfb_path = vfb_path
+        with open(vfb_path, "rb") as f:
+            self.data = f.read()
+        self._vfb: Vfb | None = None
+
+    @property
+    def vfb(self) -> Vfb:
+        """
+        The Vfb with the header and the entry index, which is read on first access.
+        """
+        if self._vfb is None:
+            self._vfb = Vfb(self.vfb_path, timing=False, only_header=True)
+            self._vfb.read_index()
+        return self._vfb
+
+    @property
+    def index(self) -> VfbIndex:
+        assert self.vfb.index is not None
+        return self.vfb.index
+
+    def raw(self, record: VfbIndexRecord) -> bytes:
+        return self.data[record.offset : record.offset + record.size]  # noqa: E203
+
+    def decompile(self, record: VfbIndexRecord) -> Any:
+        entry = VfbEntry(self.vfb, eid=record.id)
+        entry.data = self.raw(record)
+        entry.decompile()
+        return entry.data
+
+    def split_records(self) -> tuple[RecordGroup, dict[str, RecordGroup]]:
+        """
+        Split the index records into those of the font-level entries and those of each
+        glyph, by glyph name. Only the glyph names are decompiled.
+        """
+        font_records: list[VfbIndexRecord] = []
+        glyphs: dict[str, list[VfbIndexRecord]] = {}
+        for glyph_index in range(self.index.num_glyphs):
+            records = self.index.glyph_records(glyph_index)
+            name = read_glyph_name(self.raw(records[0]), self.vfb.encoding)
+            if name is None:
+                name = f"#{glyph_index}"
+            elif name in glyphs:
+                # Keep glyphs with duplicate names apart
+                name = f"{name}#{glyph_index}"
+            glyphs[name] = records
+        for record in self.index.records:
+            if record.glyph_index is None:
+                font_records.append(record)
+        return _group_records(font_records), {
+            name: _group_records(records) for name, records in glyphs.items()
+        }
+
+
+def _group_records(records: list[VfbIndexRecord]) -> RecordGroup:
+    group: RecordGroup = {}
+    counts: dict[int, int] = {}
+    for record in records:
+        count = counts.get(record.id, 0)
+        counts[record.id] = count + 1
+        group[record.id, count] = record
+    return group
+
+
+def _get_record_path(prefix: str, record: VfbIndexRecord, count: int) -> str:
+    path = f"{prefix}{record.key}"
+    if count:
+        path += f"[{count}]"
+    return path
+
+
+def _merge_keys(old: dict[Any, Any], new: dict[Any, Any]) -> list[Any]:
+    # The keys of both dicts in order, the keys that are only in `new` last
+    return list(old) + [key for key in new if key not in old]
+
+
+def diff_values(path: str, old: Any, new: Any) -> Iterator[VfbDifference]:
+    """
+    Compare decompiled entry data field by field, and yield the differences.
+
+    Dicts are compared by key and lists of the same length item by item. Lists of
+    different lengths and other values are reported as a whole. The path of nested
+    values is built like in Python, e.g. "Glyph.metrics[0]".
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in _merge_keys(old, new):
+            yield from diff_values(
+                f"{path}.{key}", old.get(key, MISSING), new.get(key, MISSING)
+            )
+    elif (
+        isinstance(old, (list, tuple))
+        and isinstance(new, (list, tuple))
+        and len(old) == len(new)
+    ):
+        for i, (old_item, new_item) in enumerate(zip(old, new)):
+            yield from diff_values(f"{path}[{i}]", old_item, new_item)
+    elif old != new:
+        yield VfbDifference(path, old, new)
+
+
+def _diff_record_groups(
+    prefix: str,
+    source1: VfbDiffSource,
+    old: RecordGroup,
+    source2: VfbDiffSource,
+    new: RecordGroup,
+) -> Iterator[VfbDifference]:
+    for key in _merge_keys(old, new):
+        old_record = old.get(key)
+        new_record = new.get(key)
+        if old_record is None:
+            assert new_record is not None
+            path = _get_record_path(prefix, new_record, key[1])
+            yield VfbDifference(path, MISSING, source2.decompile(new_record))
+        elif new_record is None:
+            path = _get_record_path(prefix, old_record, key[1])
+            yield VfbDifference(path, source1.decompile(old_record), MISSING)
+        elif source1.raw(old_record) != source2.raw(new_record):
+            # Only entries that differ are decompiled
+            path = _get_record_path(prefix, old_record, key[1])
+            yield from diff_values(
+                path, source1.decompile(old_record), source2.decompile(new_record)
+            )
+
+
+def diff_vfbs(vfb1_path: Path, vfb2_path: Path) -> list[VfbDifference]:
+    """
+    Compare two VFB files structurally, and return the differences.
+
+    Entries are compared by their compiled data first, and only entries that differ are
+    decompiled and compared field by field. Glyphs are matched by name, so glyphs that
+    were moved are only reported as a difference of the glyph order.
+
+    Args:
+        vfb1_path (Path): The path of the first VFB file.
+        vfb2_path (Path): The path of the second VFB file.
+
+    Returns:
+        list[VfbDifference]: The differences of the header, the font-level entries,
+            the glyph order, and the glyphs in the order of the first VFB, followed
+            by glyphs that are only in the second VFB.
+    """
+    source1 = VfbDiffSource(vfb1_path)
+    source2 = VfbDiffSource(vfb2_path)
+    if source1.data == source2.data:
+        # Don't even scan identical files
+        return []
+
+    differences: list[VfbDifference] = list(
+        diff_values(
+            "header", source1.vfb.header.as_dict(), source2.vfb.header.as_dict()
+        )
+    )
+
+    font1, glyphs1 = source1.split_records()
+    font2, glyphs2 = source2.split_records()
+    differences.extend(_diff_record_groups("", source1, font1, source2, font2))
+
+    order1 = [name for name in glyphs1 if name in glyphs2]
+    order2 = [name for name in glyphs2 if name in glyphs1]
+    if order1 != order2:
+        differences.append(VfbDifference("glyph order", order1, order2))
+
+    for name, records1 in glyphs1.items():
+        records2 = glyphs2.get(name)
+        if records2 is None:
+            differences.append(VfbDifference(f"glyph '{name}'", name, MISSING))
+        else:
+            differences.extend(
+                _diff_record_groups(
+                    f"glyph '{name}' / ", source1, records1, source2, records2
+                )
+            )
+
+    for name in glyphs2:
+        if name not in glyphs1:
+            differences.append(VfbDifference(f"glyph '{name}'", MISSING, name))
+
+    return differences
+
+
+def _format_default(value: Any) -> str:
+    if isinstance(value, (bytes, memoryview)):
+        return hexStr(value)
+
+    return str(value)
+
+
+def _format_value(value: Any) -> str:
+    if value is MISSING:
+        return repr(value)
+
+    return orjson.dumps(
+        value, default=_format_default, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+def print_differences(differences: list[VfbDifference]) -> None:
+    """
+    Print differences in a format similar to a unified diff.
+    """
+    for difference in differences:
+        print(difference.path)
+        print(f"- {_format_value(difference.old)}")
+        print(f"+ {_format_value(difference.new)}")
+
+
 def diffvfb():
     parser = ArgumentParser(description="vfbdiff\nCopyright (c) 2024 by LucasFonts")
     parser.add_argument(
@@ -15,6 +263,12 @@ def diffvfb():
         type=str,
         help="Output diff in HTML format to file path",
     )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        default=False,
+        help="Output a unified diff of the JSON representation of the files",
+    )
     parser.add_argument(
         "file1",
         type=str,
@@ -35,6 +289,10 @@ def diffvfb():
     vfb1_path = Path(args.file1[0])
     vfb2_path = Path(args.file2[0])
 
+    if not (args.html or args.json):
+        print_differences(diff_vfbs(vfb1_path, vfb2_path))
+        return
+
     vfb1 = Vfb(vfb_path=vfb1_path, timing=False)
     vfb2 = Vfb(vfb_path=vfb2_path, timing=False)
     vfb1.read()
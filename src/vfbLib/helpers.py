@@ -32,5 +32,5 @@ def deHexStr(hexstr: str) -> bytes:
     return bytes.fromhex(hexstr)
 
 
-def hexStr(b: bytes) -> str:
-    return bytes.hex(b)
+def hexStr(b: bytes | memoryview) -> str:
+    return b.hex()
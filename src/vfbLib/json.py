@@ -1,7 +1,10 @@
 from pathlib import Path
+from typing import Any
 
 import orjson
 
+from vfbLib.outlines import CompactOutline
+from vfbLib.vfb.profile import VfbProfile
 from vfbLib.vfb.vfb import Vfb
 
 
@@ -13,12 +16,14 @@ def save_vfb_json(
     unicode_strings: bool = False,
     no_decompile: bool = False,
     roundtrip: bool = False,
+    profile: bool = False,
 ) -> None:
     vfb = Vfb(
         vfb_path,
         only_header=only_header,
         minimal=minimal,
         unicode_strings=unicode_strings,
+        profile=VfbProfile() if profile else None,
     )
     if roundtrip:
         vfb.decompile()
@@ -33,12 +38,24 @@ def save_vfb_json(
     else:
         out_path = vfb_path.with_suffix(suffix)
     write_vfb_json(vfb, out_path)
+    if vfb.profile is not None:
+        print(vfb.profile.format())
+
+
+def _default(obj: Any) -> Any:
+    # Serialize types that orjson doesn't support natively
+    if isinstance(obj, CompactOutline):
+        return obj.to_list()
+
+    raise TypeError
 
 
 def write_vfb_json(vfb: Vfb, out_path: Path) -> None:
     with open(str(out_path), "wb") as f:
         f.write(
             orjson.dumps(
-                vfb.as_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                vfb.as_dict(),
+                default=_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
             )
         )
@@ -0,0 +1,160 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from vfbLib.typing import MMNode, Point
+
+
+class PathCommand(Enum):
+    move = 0
+    line = 1
+    curve = 3
+    qcurve = 4
+
+
+path_command_names = {c.value: c.name for c in PathCommand}
+
+
+class CompactOutline(Sequence["MMNode"]):
+    """
+    A compact, array-backed representation of the nodes of a multiple master glyph
+    outline. Instead of one dict per node holding lists of point tuples per master, the
+    node types and flags are stored in a byte array, and the absolute coordinates of all
+    nodes in one int32 array, ordered by node, point, master, and x/y.
+
+    The object behaves like a list of `MMNode` dicts for existing consumers. Items are
+    built on access, so changing a returned dict does not change the outline. Use
+    `to_list` to get a list of mutable nodes.
+    """
+
+    __slots__ = ("coords", "num_masters", "starts", "types")
+
+    def __init__(self, num_masters: int) -> None:
+        self.num_masters = num_masters
+        # The node type in the low 4 bits, the flags in the high 4 bits, as in the VFB
+        self.types = array("B")
+        # The index of the first coordinate of each node in coords, plus the end index
+        self.starts = array("I", (0,))
+        # The absolute coordinates
+        self.coords = array("i")
+
+    @classmethod
+    def from_nodes(
+        cls, nodes: "Iterable[MMNode]", num_masters: int
+    ) -> "CompactOutline":
+        """
+        Build a compact outline from a list of `MMNode` dicts.
+        """
+        outline = cls(num_masters)
+        outline.extend(nodes)
+        return outline
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self.types):
+            raise IndexError("CompactOutline index out of range")
+
+        type_flags = self.types[index]
+        return {
+            "type": path_command_names[type_flags & 0x0F],
+            "flags": type_flags >> 4,
+            "points": [self.points(index, m) for m in range(self.num_masters)],
+        }
+
+    def __iter__(self) -> "Iterator[MMNode]":
+        for i in range(len(self.types)):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactOutline):
+            return (
+                self.num_masters == other.num_masters
+                and self.types == other.types
+                and self.starts == other.starts
+                and self.coords == other.coords
+            )
+
+        if isinstance(other, Sequence):
+            return self.to_list() == list(other)
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<CompactOutline {len(self)} nodes, {self.num_masters} masters>"
+
+    def append_node(self, type_flags: int, coords: Iterable[int]) -> None:
+        """
+        Append a node from its raw type and flags byte and its absolute coordinates,
+        ordered by point, master, and x/y.
+        """
+        self.types.append(type_flags)
+        self.coords.extend(coords)
+        self.starts.append(len(self.coords))
+
+    def append(self, node: "MMNode") -> None:
+        """
+        Append a node from an `MMNode` dict.
+        """
+        points = node["points"]
+        type_flags = node.get("flags", 0) * 16 + PathCommand[node["type"]].value
+        self.append_node(
+            type_flags,
+            (
+                value
+                for j in range(len(points[0]))
+                for m in range(self.num_masters)
+                for value in points[m][j]
+            ),
+        )
+
+    def extend(self, nodes: "Iterable[MMNode]") -> None:
+        for node in nodes:
+            self.append(node)
+
+    def node_type(self, index: int) -> str:
+        return path_command_names[self.types[index] & 0x0F]
+
+    def node_flags(self, index: int) -> int:
+        return self.types[index] >> 4
+
+    def points(self, index: int, master_index: int) -> "list[Point]":
+        """
+        Return the points of a node for one master.
+        """
+        start = self.starts[index]
+        step = 2 * self.num_masters
+        return [
+            (self.coords[i], self.coords[i + 1])
+            for i in range(start + 2 * master_index, self.starts[index + 1], step)
+        ]
+
+    def iter_master(
+        self, master_index: int
+    ) -> "Iterator[tuple[str, int, list[Point]]]":
+        """
+        Iterate over the nodes of one master without building the node dicts.
+
+        Yields:
+            tuple[str, int, list[Point]]: The node type, the flags, and the points.
+        """
+        for i, type_flags in enumerate(self.types):
+            yield (
+                path_command_names[type_flags & 0x0F],
+                type_flags >> 4,
+                self.points(i, master_index),
+            )
+
+    def to_list(self) -> "list[MMNode]":
+        """
+        Return the nodes as a list of `MMNode` dicts.
+        """
+        return list(self)
@@ -1,18 +1,13 @@
 import logging
+from functools import lru_cache
 from io import BytesIO
-from struct import unpack
+from struct import Struct
+from struct import error as StructError
 from typing import TYPE_CHECKING, Any
 
 from vfbLib import mapping_modes
-from vfbLib.helpers import (
-    deHexStr,
-    double_size,
-    hexStr,
-    int8_size,
-    int16_size,
-    int32_size,
-)
-from vfbLib.parsers.value import read_value
+from vfbLib.helpers import deHexStr, hexStr
+from vfbLib.parsers.value import read_value, read_values
 from vfbLib.typing import MappingModeDict
 
 if TYPE_CHECKING:
@@ -25,21 +20,84 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class StreamReader:
+# Precompiled structs for the little-endian fixed-size values
+int8_struct = Struct("<b")
+int16_struct = Struct("<h")
+int32_struct = Struct("<i")
+uint8_struct = Struct("<B")
+uint16_struct = Struct("<H")
+uint32_struct = Struct("<I")
+
+
+@lru_cache(maxsize=256)
+def get_struct(fmt: str) -> Struct:
     """
-    Base class that reads values from the input stream.
+    Return a precompiled struct for the format string `fmt`. The structs are cached,
+    so reading arrays of the same length or records of the same format doesn't compile
+    the format again.
+
+    Args:
+        fmt (str): The struct format string, e.g. "<I4d"
 
-    This is the parent class for the general BaseParser, from which all other parsers
-    inherit, but it may be subclassed directly if more flexibility is needed.
+    Returns:
+        Struct: The struct
     """
+    return Struct(fmt)
 
-    def __init__(self) -> None:
-        self.encoding = "cp1252"
-        self.stream: "BufferedIOBase" = BytesIO()
+
+class BaseReader:
+    """
+    Base class that reads values from the input data.
+
+    The values are decoded from the bytes returned by `read_bytes` and the encoded
+    values returned by `read_value`, which must be implemented by subclasses.
+    `StreamReader` reads from a stream, `BufferReader` reads from a bytes buffer.
+
+    Like reading from a stream, reading past the end of the data returns less data
+    instead of raising an error, except for encoded values, which raise an EOFError,
+    and structs, which raise a struct.error.
+    """
+
+    encoding = "cp1252"
+
+    def read_bytes(self, size: int | None = None) -> bytes:
+        """
+        Return `size` bytes from the data, or all remaining bytes if `size` is None.
+
+        Args:
+            size (int | None, optional): The number of bytes to read. Defaults to None.
+
+        Returns:
+            bytes: The bytes
+        """
+        raise NotImplementedError
+
+    def read_struct(self, s: Struct) -> tuple[Any, ...]:
+        """
+        Read the fields of a precompiled struct from the data in one go.
+
+        Args:
+            s (Struct): The struct, e.g. from `get_struct`
+
+        Raises:
+            struct.error: If the data ends before all fields have been read.
+
+        Returns:
+            tuple[Any, ...]: The values of the fields
+        """
+        return s.unpack(self.read_bytes(s.size))
+
+    def _read_int(self, s: Struct, signed: bool) -> int:
+        # Read an integer, or what is left of it at the end of the data
+        data = self.read_bytes(s.size)
+        if len(data) == s.size:
+            return s.unpack(data)[0]
+
+        return int.from_bytes(data, byteorder="little", signed=signed)
 
     def read_double(self) -> float:
         """
-        Return a double-precision float from the stream.
+        Return a double-precision float from the data.
 
         Returns:
             float: The float
@@ -48,53 +106,46 @@ class StreamReader:
 
     def read_doubles(self, num) -> tuple[float, ...]:
         """
-        Return a tuple of `num` double-precision floats from the stream.
+        Return a tuple of `num` double-precision floats from the data.
 
         Args:
-            num (int): The number of double-precision floats to read from the stream
+            num (int): The number of double-precision floats to read from the data
 
         Returns:
             tuple[float]: The tuple of floats
         """
-        return unpack(num * "d", self.stream.read(num * double_size))
+        return self.read_struct(get_struct(f"<{num}d"))
 
     def read_int8(self) -> int:
         """
-        Return a signed 8-bit integer from the stream.
+        Return a signed 8-bit integer from the data.
 
         Returns:
             int: The integer
         """
-        return int.from_bytes(
-            self.stream.read(int8_size), byteorder="little", signed=True
-        )
+        return self._read_int(int8_struct, signed=True)
 
     def read_int16(self) -> int:
         """
-        Return a signed 16-bit integer from the stream.
+        Return a signed 16-bit integer from the data.
 
         Returns:
             int: The integer
         """
-        return int.from_bytes(
-            self.stream.read(int16_size), byteorder="little", signed=True
-        )
+        return self._read_int(int16_struct, signed=True)
 
     def read_int32(self) -> int:
         """
-        Return a signed 32-bit integer from the stream.
+        Return a signed 32-bit integer from the data.
 
         Returns:
             int: The integer
         """
-        return int.from_bytes(
-            self.stream.read(int32_size), byteorder="little", signed=True
-        )
+        return self._read_int(int32_struct, signed=True)
 
     def read_str(self, size: int) -> str:
         """
-        Return a string of the specified `size` from the current stream with the current
-        encoding.
+        Return a string of the specified `size` from the data with the current encoding.
 
         Args:
             size (int): The size in bytes to be converted to a string
@@ -104,12 +155,12 @@ class StreamReader:
         """
         if size == 0:
             return ""
-        return self.stream.read(size).decode(self.encoding)
+        return self.read_bytes(size).decode(self.encoding)
 
     def read_str_with_len(self) -> str:
         """
-        Read the length of a string from the current stream, then the string itself, and
-        return the string.
+        Read the length of a string from the data, then the string itself, and return
+        the string.
 
         Returns:
             str: The string
@@ -119,98 +170,253 @@ class StreamReader:
 
     def read_str_all(self) -> str:
         """
-        Return the remaining bytes of the current stream as a string with the current
-        encoding.
+        Return the remaining bytes of the data as a string with the current encoding.
 
         Returns:
             str: The string
         """
-        return self.stream.read().decode(self.encoding)
+        return self.read_bytes().decode(self.encoding)
 
     def read_uint8(self) -> int:
         """
-        Return an unsigned 8-bit integer from the stream.
+        Return an unsigned 8-bit integer from the data.
 
         Returns:
-            int: The integer
+            int: The integer, or 0 at the end of the data
         """
-        return int.from_bytes(
-            self.stream.read(int8_size), byteorder="little", signed=False
-        )
+        return self._read_int(uint8_struct, signed=False)
 
     def read_uint16(self) -> int:
         """
-        Return an unsigned 16-bit integer from the stream.
+        Return an unsigned 16-bit integer from the data.
 
         Returns:
             int: The integer
         """
-        return int.from_bytes(
-            self.stream.read(int16_size), byteorder="little", signed=False
-        )
+        return self._read_int(uint16_struct, signed=False)
 
     def read_uint32(self) -> int:
         """
-        Return an unsigned 32-bit integer from the stream.
+        Return an unsigned 32-bit integer from the data.
 
         Returns:
             int: The integer
         """
-        return int.from_bytes(
-            self.stream.read(int32_size), byteorder="little", signed=False
-        )
+        return self._read_int(uint32_struct, signed=False)
+
+    def read_uint16s(self, num: int) -> list[int]:
+        """
+        Return a list of `num` unsigned 16-bit integers from the data.
+
+        Args:
+            num (int): The number of integers to read from the data
+
+        Returns:
+            list[int]: The integers
+        """
+        return list(self.read_struct(get_struct(f"<{num}H")))
+
+    def read_uint32s(self, num: int) -> list[int]:
+        """
+        Return a list of `num` unsigned 32-bit integers from the data.
+
+        Args:
+            num (int): The number of integers to read from the data
+
+        Returns:
+            list[int]: The integers
+        """
+        return list(self.read_struct(get_struct(f"<{num}I")))
 
     def read_value(self, signed: bool = True) -> int:
         """
-        Return an encoded integer value from the stream.
+        Return an encoded integer value from the data.
 
         Args:
             signed (bool, optional): Whether the value is interpreted as a signed value.
             Defaults to True.
 
+        Raises:
+            EOFError: At the end of the data or at a 0 byte.
+
         Returns:
             int: The integer
         """
+        raise NotImplementedError
+
+    def read_values(self, count: int | None = None, signed: bool = True) -> list[int]:
+        """
+        Return a list of encoded integer values from the data.
+
+        Args:
+            count (int | None, optional): The number of values to read. If None, values
+                are read until the end of the data. Defaults to None.
+            signed (bool, optional): Whether the values are interpreted as signed
+                values. Defaults to True.
+
+        Returns:
+            list[int]: The integers
+        """
+        values: list[int] = []
+        try:
+            if count is None:
+                while True:
+                    values.append(self.read_value(signed=signed))
+            else:
+                for _ in range(count):
+                    values.append(self.read_value(signed=signed))
+        except EOFError:
+            if count is not None:
+                raise
+        return values
+
+
+class StreamReader(BaseReader):
+    """
+    Base class that reads values from the input stream.
+
+    This is the parent class for reading entries and the header from a VFB file. The
+    entry parsers use the faster `BufferReader`.
+    """
+
+    def __init__(self) -> None:
+        self.encoding = "cp1252"
+        self.stream: "BufferedIOBase" = BytesIO()
+
+    def read_bytes(self, size: int | None = None) -> bytes:
+        return self.stream.read(-1 if size is None else size)
+
+    def read_value(self, signed: bool = True) -> int:
         return read_value(self.stream, signed=signed)
 
 
-class BaseParser(StreamReader):
+class BufferReader(BaseReader):
     """
-    Base class to parse data from a vfb file
+    Base class that reads values from a buffer at a cursor position.
+
+    It reads directly from the buffer instead of going through a stream, which avoids
+    creating a stream and a bytes object for each value. The buffer may be a memoryview,
+    e.g. of a memory-mapped file, which is not copied. This is the parent class for the
+    general BaseParser, from which all other parsers inherit.
     """
 
     def __init__(self) -> None:
         self.encoding = "cp1252"
-        self.stream: BytesIO = BytesIO()
+        # The data and the offset of the next byte to be read
+        self.buffer: "bytes | bytearray | memoryview" = b""
+        self.offset = 0
+
+    def read_bytes(self, size: int | None = None) -> bytes:
+        offset = self.offset
+        if size is None:
+            data = self.buffer[offset:]
+        else:
+            data = self.buffer[offset : offset + size]  # noqa: E203
+        self.offset = offset + len(data)
+        # Only slices of a memoryview or bytearray are copied
+        return bytes(data)
+
+    def read_struct(self, s: Struct) -> tuple[Any, ...]:
+        offset = self.offset
+        values = s.unpack_from(self.buffer, offset)
+        self.offset = offset + s.size
+        return values
+
+    def _read_int(self, s: Struct, signed: bool) -> int:
+        offset = self.offset
+        try:
+            value = s.unpack_from(self.buffer, offset)[0]
+        except StructError:
+            # Less than s.size bytes are left
+            return int.from_bytes(self.read_bytes(), byteorder="little", signed=signed)
+
+        self.offset = offset + s.size
+        return value
+
+    def read_uint8(self) -> int:
+        offset = self.offset
+        try:
+            value = self.buffer[offset]
+        except IndexError:
+            return 0
+
+        self.offset = offset + 1
+        return value
+
+    def read_value(self, signed: bool = True) -> int:
+        offset = self.offset
+        try:
+            val = self.buffer[offset]
+        except IndexError:
+            raise EOFError
+
+        if 0x20 <= val < 0xF7:
+            # Most values are represented by 1 byte
+            self.offset = offset + 1
+            return val - 0x8B
+
+        if val == 0:
+            # The 0 byte is consumed, like when reading from a stream
+            self.offset = offset + 1
+            raise EOFError
+
+        values, self.offset = read_values(self.buffer, offset, 1, signed)
+        return values[0]
+
+    def read_values(self, count: int | None = None, signed: bool = True) -> list[int]:
+        try:
+            values, self.offset = read_values(self.buffer, self.offset, count, signed)
+        except EOFError:
+            # Read the values one by one to consume the values before the end and the
+            # 0 byte, like when reading from a stream
+            return super().read_values(count, signed)
+
+        return values
+
+
+class BaseParser(BufferReader):
+    """
+    Base class to parse data from a vfb file
+    """
 
-    def parse(self, stream: BytesIO, size: int, vfb: "Vfb | None") -> Any:
+    def parse(
+        self,
+        data: "bytes | bytearray | memoryview | BufferedIOBase",
+        size: int,
+        vfb: "Vfb | None",
+    ) -> Any:
         """
-        Prepare the parsing of the stream, then call the specialized parser and return
+        Prepare the parsing of the data, then call the specialized parser and return
         the decompiled VFB entry structure.
 
         The specialized parsing is done by calling the `_parse` method, which must be
         implemented for all entry parser sublasses.
 
         Args:
-            stream (BytesIO): The stream to read from.
-            size (int): The number of bytes that will be read from the input stream and
-                parsed.
+            data (bytes | bytearray | memoryview | BufferedIOBase): The data to parse,
+                or a stream to read it from.
+            size (int): The number of bytes that will be parsed.
             vfb (int, optional): The Vfb that is calling the parser.
 
         Raises:
-            AssertionError: If bytes remain in the stream after the parsing finished.
+            AssertionError: If bytes remain in the buffer after the parsing finished.
 
         Returns:
             Any: The parsed structure. The type depends on the specific entry that is
             being parsed.
         """
-        self.stream = BytesIO(stream.read(size))  # type: ignore
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            # Parse the data without copying it
+            self.buffer = data if len(data) == size else memoryview(data)[:size]
+        else:
+            self.buffer = data.read(size)
+        self.offset = 0
         self.vfb = vfb
         decompiled = self._parse()
 
         # Make sure the parser consumed all of the data
-        remainder = self.stream.read()
-        if remainder != b"":
+        if self.offset < len(self.buffer):
+            remainder = bytes(self.buffer[self.offset :])  # noqa: E203
             logger.error(f"Parser {self.__class__.__name__} did not consume all bytes.")
             logger.error(f"Remainder: {remainder!r}")
             raise AssertionError
@@ -225,7 +431,7 @@ class BaseParser(StreamReader):
             hexstr (str): The data
         """
         data = deHexStr(hexstr)
-        return self.parse(BytesIO(data), len(data), vfb)
+        return self.parse(data, len(data), vfb)
 
     def _parse(self) -> Any:
         """
@@ -235,7 +441,7 @@ class BaseParser(StreamReader):
         Returns:
             Any: _description_
         """
-        return hexStr(self.stream.read())
+        return hexStr(self.read_bytes())
 
 
 class EncodedKeyValuesParser(BaseParser):
@@ -301,14 +507,7 @@ class EncodedValueListParser(BaseParser):
     """
 
     def _parse(self) -> list[int]:
-        values = []
-        while True:
-            try:
-                val = self.read_value()
-                values.append(val)
-            except EOFError:
-                logger.debug("EOF")
-                return values
+        return self.read_values()
 
 
 class EncodedValueListWithCountParser(BaseParser):
@@ -319,17 +518,13 @@ class EncodedValueListWithCountParser(BaseParser):
 
     def _parse(self) -> list[int]:
         count = self.read_value()
-        values: list[int] = []  # TODO: We don't need the dict
-        for _ in range(count):
-            val = self.read_value()
-            values.append(val)
-        return values
+        return self.read_values(count)
 
 
 class GlyphEncodingParser(BaseParser):
     def _parse(self) -> tuple[int, str]:
         gid = self.read_uint16()
-        nam = self.stream.read().decode("cp1252")
+        nam = self.read_bytes().decode("cp1252")
         return gid, nam
 
 
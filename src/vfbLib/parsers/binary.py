@@ -9,5 +9,5 @@ logger = logging.getLogger(__name__)
 class BinaryTableParser(BaseParser):
     def _parse(self) -> dict[str, str]:
         tag = self.read_str(4)
-        data = hexStr(self.stream.read())
+        data = hexStr(self.read_bytes())
         return {"tag": tag, "data": data}
@@ -1,14 +1,15 @@
 import logging
-from enum import Enum
-from struct import unpack
-from typing import TYPE_CHECKING, Any
+from struct import Struct
+from typing import Any
 
 from fontTools.ttLib.tables.ttProgram import Program
 
 from vfbLib import DIRECTIONS, gdef_class_names, replace_types
 from vfbLib.helpers import hexStr
+from vfbLib.outlines import CompactOutline, PathCommand, path_command_names
 from vfbLib.parsers.base import BaseParser
 from vfbLib.parsers.guides import parse_guides
+from vfbLib.parsers.value import read_values
 from vfbLib.truetype import TT_COMMANDS
 from vfbLib.typing import (
     AnchorDict,
@@ -25,39 +26,15 @@ from vfbLib.typing import (
     MMNode,
     Point,
 )
-from vfbLib.value import read_value
-
-if TYPE_CHECKING:
-    from io import BytesIO
-
 
 logger = logging.getLogger(__name__)
 
-
-class PathCommand(Enum):
-    move = 0
-    line = 1
-    curve = 3
-    qcurve = 4
-
-
-def read_absolute_point(
-    points: list[list[Any]],
-    stream: "BytesIO",
-    num_masters: int,
-    x_masters: list[int],
-    y_masters: list[int],
-) -> None:
-    # Read coordinates for all masters from stream, add the points to a list
-    # of points per master. Keep track of the relative coordinates reference
-    # value in x_masters and y_masters.
-    for m in range(num_masters):
-        # End point
-        xrel = read_value(stream)
-        yrel = read_value(stream)
-        x_masters[m] += xrel
-        y_masters[m] += yrel
-        points[m].append((x_masters[m], y_masters[m]))
+# The constant at the start of each glyph entry
+glyph_constant_struct = Struct("<4B")
+# The x and y scale of a component in one master
+component_scale_struct = Struct("<2d")
+# The x and y values of the glyph origin and the mask metrics
+int16_pair_struct = Struct("<2h")
 
 
 class GlyphAnchorsParser(BaseParser):
@@ -65,12 +42,11 @@ class GlyphAnchorsParser(BaseParser):
         anchors = []
         num_anchors = self.read_value()
         num_masters = self.read_value()
-        for _ in range(num_anchors):
-            anchor = MMAnchorDict(x=[], y=[])
-            for _ in range(num_masters):
-                anchor["x"].append(self.read_value())
-                anchor["y"].append(self.read_value())
-            anchors.append(anchor)
+        stride = 2 * num_masters
+        values = self.read_values(num_anchors * stride)
+        for i in range(0, len(values), stride):
+            anchor_values = values[i : i + stride]  # noqa: E203
+            anchors.append(MMAnchorDict(x=anchor_values[::2], y=anchor_values[1::2]))
         return anchors
 
 
@@ -78,9 +54,8 @@ class GlyphAnchorsSuppParser(BaseParser):
     def _parse(self) -> list[AnchorPropertiesDict]:
         anchors = []
         num_anchors = self.read_value()
-        for _ in range(num_anchors):
-            hue = self.read_value()
-            data = self.read_value()
+        values = self.read_values(2 * num_anchors)
+        for hue, data in zip(values[::2], values[1::2]):
             anchors.append(AnchorPropertiesDict(hue=hue, data=data))
         return anchors
 
@@ -119,7 +94,7 @@ class GlyphGDEFParser(BaseParser):
 
         num_ot_classes = self.read_value()
         if num_ot_classes > 0:
-            ot_classes = [self.read_value() for _ in range(num_ot_classes)]
+            ot_classes = self.read_values(num_ot_classes)
             gdef["ot_classes"] = ot_classes
 
         return gdef
@@ -127,12 +102,37 @@ class GlyphGDEFParser(BaseParser):
 
 class GlyphOriginParser(BaseParser):
     def _parse(self) -> dict[str, Any]:
-        x = self.read_int16()
-        y = self.read_int16()
+        x, y = self.read_struct(int16_pair_struct)
         return {"x": x, "y": y}
 
 
+def read_glyph_name(data: bytes | memoryview, encoding: str = "cp1252") -> str | None:
+    """
+    Return the glyph name from the compiled data of a glyph entry without parsing the
+    rest of the glyph.
+
+    Args:
+        data (bytes | memoryview): The compiled data of a `G.Glyph` entry.
+        encoding (str, optional): The string encoding. Defaults to "cp1252".
+
+    Returns:
+        str | None: The glyph name, or None if the data doesn't start with the name.
+    """
+    # The glyph constant is followed by the glyph name
+    if len(data) < 6 or data[4] != 0x01:
+        return None
+
+    # The glyph name is preceded by its encoded length
+    values, start = read_values(data, 5, 1, signed=False)
+    size = values[0]
+    return bytes(data[start : start + size]).decode(encoding)  # noqa: E203
+
+
 class GlyphParser(BaseParser):
+    # Whether to store the outline nodes as CompactOutline instead of a list of MMNode
+    # dicts. Also enabled by the `compact_outlines` option of the Vfb.
+    compact_outlines = False
+
     def _parse(self) -> dict[str, Any]:
         """
         01090701
@@ -158,7 +158,7 @@ class GlyphParser(BaseParser):
         0f
         """
         self.glyphdata = GlyphData()
-        start = unpack("<4B", self.stream.read(4))
+        start = self.read_struct(glyph_constant_struct)
         if start != (1, 9, 7, 1):
             logger.warning(f"Unexpected glyph constant: {start}")
         while True:
@@ -214,14 +214,14 @@ class GlyphParser(BaseParser):
 
                 case _:
                     logger.error(f"Unhandled info field: {hex(v)}")
-                    logger.error(hexStr(self.stream.read()))
+                    logger.error(hexStr(self.read_bytes()))
                     raise ValueError
 
         return dict(self.glyphdata)
 
     def parse_guides(self) -> None:
         # Guidelines
-        guides = parse_guides(self.stream, self.num_masters, f"glyph '{self.name}'")
+        guides = parse_guides(self, self.num_masters, f"glyph '{self.name}'")
         if guides:
             self.glyphdata["guides"] = guides
 
@@ -243,15 +243,15 @@ class GlyphParser(BaseParser):
                     imported["unknown1"] = self.read_value()
                     imported["unknown2"] = self.read_value()
                     imported["unknown3"] = self.read_value()
-                    imported["bbox"] = [self.read_value() for _ in range(4)]
+                    imported["bbox"] = self.read_values(4)
 
                 case 0x2A:
                     # Outlines
                     num_contours = self.read_value()  # -1 for composite
                     imported["num_contours"] = num_contours
-                    imported["endpoints"] = [
-                        self.read_value(signed=False) for _ in range(num_contours)
-                    ]
+                    imported["endpoints"] = self.read_values(
+                        max(0, num_contours), signed=False
+                    )
                     num_nodes = self.read_value(signed=False)
                     nodes = []
                     x = 0
@@ -281,7 +281,7 @@ class GlyphParser(BaseParser):
                 case 0x2B:
                     # Instructions
                     num_bytes = self.read_value(signed=False)
-                    instructions = self.stream.read(num_bytes)
+                    instructions = self.read_bytes(num_bytes)
                     p = Program()
                     p.fromBytecode(instructions)
                     imported["instructions"] = p.getAssembly()
@@ -307,9 +307,8 @@ class GlyphParser(BaseParser):
             gid = self.read_value()
             c = Component(gid=gid, offsetX=[], offsetY=[], scaleX=[], scaleY=[])
             for _ in range(self.num_masters):
-                x = self.read_value()
-                y = self.read_value()
-                scaleX, scaleY = self.read_doubles(2)
+                x, y = self.read_values(2)
+                scaleX, scaleY = self.read_struct(component_scale_struct)
                 c["offsetX"].append(x)
                 c["offsetY"].append(y)
                 c["scaleX"].append(scaleX)
@@ -319,15 +318,17 @@ class GlyphParser(BaseParser):
 
     def parse_hints(self) -> None:
         hints = MMHintsDict(v=[], h=[])
+        stride = 2 * self.num_masters
         for direction in DIRECTIONS:
             num_hints = self.read_value()
-            for _ in range(num_hints):
-                master_hints = []
-                for _ in range(self.num_masters):
-                    pos = self.read_value()
-                    width = self.read_value()
-                    master_hints.append(HintDict(pos=pos, width=width))
-                hints[direction].append(master_hints)
+            values = self.read_values(num_hints * stride)
+            for i in range(0, len(values), stride):
+                hints[direction].append(
+                    [
+                        HintDict(pos=values[j], width=values[j + 1])
+                        for j in range(i, i + stride, 2)
+                    ]
+                )
 
         num_hintmasks = self.read_value()
         if num_hintmasks > 0:
@@ -351,28 +352,23 @@ class GlyphParser(BaseParser):
         commands: list[Instruction] = []
         for i in range(num_commands):
             cmd = self.read_uint8()
-            params = [self.read_value() for _ in range(len(TT_COMMANDS[cmd]["params"]))]
+            param_names = TT_COMMANDS[cmd]["params"]
+            params = self.read_values(len(param_names))
             commands.append(
                 Instruction(
                     cmd=TT_COMMANDS[cmd]["name"],
-                    params=dict(zip(TT_COMMANDS[cmd]["params"], params)),
+                    params=dict(zip(param_names, params)),
                 )
             )
         # Instructions are ended by 3 * 0!?
-        for _ in range(3):
-            self.read_value()
+        self.read_values(3)
 
         if commands:
             self.glyphdata["tth"] = commands
 
     def parse_metrics(self) -> None:
-        metrics: list[Point] = []
-        for _ in range(self.num_masters):
-            master_metrics = (
-                self.read_value(),
-                self.read_value(),
-            )
-            metrics.append(master_metrics)
+        values = self.read_values(2 * self.num_masters)
+        metrics: list[Point] = list(zip(values[::2], values[1::2]))
         self.glyphdata["metrics"] = metrics
 
     def parse_outlines(self, target: GlyphData | MaskData) -> int:
@@ -385,69 +381,99 @@ class GlyphParser(BaseParser):
         # glyphdata["num_node_values"] = num_node_values
 
         num_nodes = self.read_value()
+        if self.compact_outlines or (
+            self.vfb is not None and self.vfb.compact_outlines
+        ):
+            target["nodes"] = self.parse_compact_outlines(num_nodes, num_masters)
+            return num_masters
+
         segments: list[MMNode] = []
         x = [0 for _ in range(num_masters)]
         y = [0 for _ in range(num_masters)]
 
+        # Decode the nodes directly from the buffer
+        buffer = self.buffer
+        offset = self.offset
         for _ in range(num_nodes):
-            byte = self.read_uint8()
+            byte = buffer[offset]
             flags = byte >> 4
-            cmd = PathCommand(byte & 0x0F).name
-
-            # End point
+            cmd = path_command_names.get(byte & 0x0F)
+            if cmd is None:
+                raise ValueError(f"Unknown path command: {byte & 0x0F}")
+
+            # End point, for curves followed by the first and second control points.
+            # The relative coordinates are stored for all masters per point.
+            num_points = 3 if cmd == "curve" else 1
+            values, offset = read_values(
+                buffer, offset + 1, 2 * num_points * num_masters
+            )
             points: list[list[Point]] = [[] for _ in range(num_masters)]
-            read_absolute_point(points, self.stream, num_masters, x, y)
-
-            if cmd == "curve":
-                # First control point
-                read_absolute_point(points, self.stream, num_masters, x, y)
-                # Second control point
-                read_absolute_point(points, self.stream, num_masters, x, y)
+            i = 0
+            for _ in range(num_points):
+                for m in range(num_masters):
+                    x[m] += values[i]
+                    y[m] += values[i + 1]
+                    points[m].append((x[m], y[m]))
+                    i += 2
 
             segment = MMNode(type=cmd, flags=flags, points=points)
             segments.append(segment)
+        self.offset = offset
         target["nodes"] = segments
         return num_masters
 
+    def parse_compact_outlines(
+        self, num_nodes: int, num_masters: int
+    ) -> CompactOutline:
+        outline = CompactOutline(num_masters)
+        coords: list[int] = []
+        # The current absolute coordinates, x and y per master
+        ref = [0] * (2 * num_masters)
+        stride = 2 * num_masters
+        buffer = self.buffer
+        offset = self.offset
+        for _ in range(num_nodes):
+            byte = buffer[offset]
+            if byte & 0x0F not in path_command_names:
+                raise ValueError(f"Unknown path command: {byte & 0x0F}")
+
+            num_points = 3 if byte & 0x0F == PathCommand.curve.value else 1
+            values, offset = read_values(buffer, offset + 1, num_points * stride)
+            coords.clear()
+            for i in range(0, len(values), stride):
+                for j in range(stride):
+                    ref[j] += values[i + j]
+                coords.extend(ref)
+            outline.append_node(byte, coords)
+        self.offset = offset
+        return outline
+
     def parse_kerning(self) -> None:
         num = self.read_value()
         kerning = {}
-        for _ in range(num):
-            # Glyph index of right kerning partner
-            gid = self.read_value()
-            values = []
-            for _ in range(self.num_masters):
-                # List of values, one value per master
-                values.append(self.read_value())
-            kerning[gid] = values
+        # Glyph index of right kerning partner, followed by one value per master
+        stride = 1 + self.num_masters
+        values = self.read_values(num * stride)
+        for i in range(0, len(values), stride):
+            kerning[values[i]] = values[i + 1 : i + stride]  # noqa: E203
         self.glyphdata["kerning"] = kerning
 
 
 class GlyphSketchParser(BaseParser):
     def _parse(self) -> list[tuple[int, int, int]]:
         num = self.read_value(signed=False)
-        return [
-            (self.read_value(), self.read_value(), self.read_value())
-            for _ in range(num)
-        ]
+        values = self.read_values(3 * num)
+        return list(zip(values[::3], values[1::3], values[2::3]))
 
 
 class GlyphUnicodeParser(BaseParser):
     def _parse(self) -> list[int]:
-        unicodes = []
-        for _ in range(self.stream.getbuffer().nbytes // 2):
-            u = self.read_uint16()
-            unicodes.append(u)
-        return unicodes
+        return self.read_uint16s(len(self.buffer) // 2)
 
 
 class GlyphUnicodeSuppParser(BaseParser):
     def _parse(self) -> list[int]:
-        unicodes = []
-        for _ in range(self.stream.getbuffer().nbytes // 4):
-            u = self.read_uint32()
-            unicodes.append(u)
-        return unicodes
+        return self.read_uint32s(len(self.buffer) // 4)
 
 
 class LinkParser(BaseParser):
@@ -455,19 +481,15 @@ class LinkParser(BaseParser):
         links = LinkDict(x=[], y=[])
         for i in range(2):
             num = self.read_value()
-            for _ in range(num):
-                src = self.read_value()
-                tgt = self.read_value()
-                links[("y", "x")[i]].append((src, tgt))
+            values = self.read_values(2 * num)
+            links[("y", "x")[i]].extend(zip(values[::2], values[1::2]))
         return links
 
 
 class MaskParser(GlyphParser):
     def _parse(self) -> dict[str, Any]:
         num_values = self.read_value()
-        weight_vector = []
-        for _ in range(num_values):
-            weight_vector.append(self.read_value() / 100_000_000)
+        weight_vector = [v / 100_000_000 for v in self.read_values(num_values)]
         maskdata = MaskData(weight_vector=weight_vector)
 
         # From here, the mask is equal to the outlines
@@ -489,8 +511,7 @@ class MaskMetricsParser(BaseParser):
         # In some cases, the value seems to be saved as big endian, though
         # Maybe try to interpret the value as BE when it is negative and less than a
         # certain sensible value.
-        x = self.read_int16()
-        y = self.read_int16()
+        x, y = self.read_struct(int16_pair_struct)
         return (x, y)
 
 
@@ -498,9 +519,5 @@ class MaskMetricsMMParser(BaseParser):
     # advance width/height for master 1 to 15
     def _parse(self) -> list[tuple[int, int]]:
         assert self.vfb is not None
-        values = []
-        for _ in range(self.vfb.num_masters - 1):
-            x = self.read_value()
-            y = self.read_value()
-            values.append((x, y))
-        return values
+        values = self.read_values(2 * (self.vfb.num_masters - 1))
+        return list(zip(values[::2], values[1::2]))
@@ -5,24 +5,22 @@ from typing import TYPE_CHECKING
 from vfbLib import DIRECTIONS
 from vfbLib.parsers.base import BaseParser
 from vfbLib.typing import GuideDict, GuidePropertiesDict, GuidePropertyDict
-from vfbLib.value import read_value
 
 if TYPE_CHECKING:
-    from io import BytesIO
-
+    from vfbLib.parsers.base import BufferReader
     from vfbLib.typing import MMGuidesDict
 
 
 logger = logging.getLogger(__name__)
 
 
-def parse_guides(stream: "BytesIO", num_masters: int, name: str) -> "MMGuidesDict":
+def parse_guides(reader: "BufferReader", num_masters: int, name: str) -> "MMGuidesDict":
     """
     Common parser for global and glyph guides. Used by `GlobalGuidesParser` and
     `GlyphParser`.
 
     Args:
-        stream (BytesIO): The data stream.
+        reader (BufferReader): The reader of the data, e.g. the calling parser.
         num_masters (int): The number of masters contained in the data.
         name (str): A name used in error messages to describe the current location, e.g.
             "glyph" or "global".
@@ -35,7 +33,7 @@ def parse_guides(stream: "BytesIO", num_masters: int, name: str) -> "MMGuidesDic
     """
     guides: "MMGuidesDict" = {"h": [], "v": []}
     for direction in DIRECTIONS:
-        num_guides = read_value(stream)
+        num_guides = reader.read_value()
         if num_guides == 0:
             continue
 
@@ -43,8 +41,8 @@ def parse_guides(stream: "BytesIO", num_masters: int, name: str) -> "MMGuidesDic
         for i in range(num_guides):
             for _ in range(num_masters):
                 try:
-                    pos = read_value(stream)
-                    angle = degrees(atan2(read_value(stream), 10000))
+                    pos = reader.read_value()
+                    angle = degrees(atan2(reader.read_value(), 10000))
                     guides[direction][i].append(GuideDict(pos=pos, angle=angle))
                 except ValueError:
                     logger.error(f"Missing {direction} guideline data ({name})")
@@ -56,8 +54,8 @@ def parse_guides(stream: "BytesIO", num_masters: int, name: str) -> "MMGuidesDic
 class GlobalGuidesParser(BaseParser):
     def _parse(self) -> "MMGuidesDict":
         assert self.vfb is not None
-        guides = parse_guides(self.stream, self.vfb.num_masters, "global")
-        assert self.stream.read() == b""
+        guides = parse_guides(self, self.vfb.num_masters, "global")
+        assert self.read_bytes() == b""
         return guides
 
 
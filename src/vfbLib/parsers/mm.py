@@ -1,6 +1,11 @@
+from struct import Struct
+
 from vfbLib.parsers.base import BaseParser
 from vfbLib.typing import PrimaryInstanceDict
 
+# The master index and the location on all 4 axes
+master_location_struct = Struct("<I4d")
+
 
 class AnisotropicInterpolationsParser(BaseParser):
     def _parse(self) -> list[list[tuple[int, int]]]:
@@ -22,7 +27,7 @@ class AxisMappingsCountParser(BaseParser):
         # or not.
         # 0300 0000  0000 0000  0000 0000  0000 0000
         # -> [3, 0, 0, 0]
-        return [self.read_uint32() for _ in range(4)]
+        return self.read_uint32s(4)
 
 
 class AxisMappingsParser(BaseParser):
@@ -31,23 +36,14 @@ class AxisMappingsParser(BaseParser):
         # Look at "Axis Mappings Count" to find out which mappings are used in each
         # axis.
         # The trailing unused fields may contain junk and must be ignored.
-        mappings = []
-        for _ in range(self.stream.getbuffer().nbytes // 16):
-            src = self.read_double()
-            tgt = self.read_double()
-            mappings.append((src, tgt))
-
-        return mappings
+        values = self.read_doubles(2 * (len(self.buffer) // 16))
+        return list(zip(values[::2], values[1::2]))
 
 
 class MasterLocationParser(BaseParser):
     def _parse(self) -> tuple[int, tuple[float, float, float, float]]:
         # The location on all 4 axes for this master
-        master_index = self.read_uint32()
-        a1 = self.read_double()
-        a2 = self.read_double()
-        a3 = self.read_double()
-        a4 = self.read_double()
+        master_index, a1, a2, a3, a4 = self.read_struct(master_location_struct)
         return master_index, (a1, a2, a3, a4)
 
 
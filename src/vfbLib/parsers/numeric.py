@@ -23,8 +23,8 @@ class FloatListParser(BaseParser):
 
     def _parse(self):
         values = []
-        for _ in range(self.stream.getbuffer().nbytes // self.__size__):
-            values.extend(unpack(self.__fmt__, self.stream.read(self.__size__)))
+        for _ in range(len(self.buffer) // self.__size__):
+            values.extend(unpack(self.__fmt__, self.read_bytes(self.__size__)))
 
         return values
 
@@ -74,10 +74,10 @@ class IntListParser(BaseParser):
 
     def _parse(self):
         values = []
-        for _ in range(self.stream.getbuffer().nbytes // self.__size__):
+        for _ in range(len(self.buffer) // self.__size__):
             values.append(
                 int.from_bytes(
-                    self.stream.read(self.__size__),
+                    self.read_bytes(self.__size__),
                     byteorder="little",
                     signed=False,
                 )
@@ -91,7 +91,7 @@ class PanoseParser(BaseParser):
     """
 
     def _parse(self):
-        return list(unpack("<10b", self.stream.read()))
+        return list(unpack("<10b", self.read_bytes()))
 
 
 class SignedInt16Parser(BaseParser):
@@ -119,5 +119,5 @@ class UnicodeRangesParser(BaseParser):
     """
 
     def _parse(self):
-        result = int.from_bytes(self.stream.read(64), byteorder="little", signed=False)
+        result = int.from_bytes(self.read_bytes(64), byteorder="little", signed=False)
         return binaryToIntList(result)
@@ -14,7 +14,7 @@ class NameRecordsParser(BaseParser):
             encID = self.read_value()
             langID = self.read_value()
             name_length = self.read_value()
-            name_codes = [self.read_value() for _ in range(name_length)]
+            name_codes = self.read_values(name_length)
             name = ""
             for c in name_codes:
                 try:
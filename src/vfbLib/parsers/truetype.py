@@ -1,5 +1,4 @@
 import logging
-from struct import unpack
 from typing import TYPE_CHECKING
 
 from vfbLib import tt_settings, ttinfo_names
@@ -35,8 +34,7 @@ class GaspParser(BaseParser):
     """
 
     def _parse(self) -> "GaspList":
-        data = self.stream.read()
-        gasp = unpack(f"<{len(data) // 2}H", data)
+        gasp = self.read_uint16s(len(self.buffer) // 2)
         it = iter(gasp)
         return [
             {
@@ -107,7 +105,7 @@ class TrueTypeInfoParser(BaseParser):
                 case 0x4C:
                     # PANOSE
                     self.assert_unique(info, dk)
-                    info[dk] = [self.read_uint8() for _ in range(10)]
+                    info[dk] = list(self.read_bytes(10))
 
                 case 0x4D | 0x4E | 0x4F | 0x50 | 0x51 | 0x52:
                     # OS/2: typo_ascender, typo_descender, typo_line_gap, fs_selection,
@@ -119,7 +117,7 @@ class TrueTypeInfoParser(BaseParser):
                     # HDMX ppms 1
                     self.assert_unique(info, dk)
                     num_values = self.read_value()
-                    info[dk] = [self.read_uint8() for _ in range(num_values)]
+                    info[dk] = list(self.read_bytes(num_values))
 
                 case 0x54:
                     # Codepages
@@ -149,7 +147,7 @@ class TrueTypeInfoParser(BaseParser):
                     # HDMX ppms 2
                     self.assert_unique(info, hk)
                     num_values = self.read_value()
-                    info[hk] = [self.read_uint8() for _ in range(num_values)]
+                    info[hk] = list(self.read_bytes(num_values))
 
                 case _:
                     logger.warning(f"Unknown key in TrueType info: {hex(k)}")
@@ -165,7 +163,7 @@ class TrueTypeStemsParser(BaseParser):
             for _ in range(num_stems):
                 width = self.read_value()
                 stem_name_length = self.read_uint8()
-                stem_name = self.stream.read(stem_name_length).decode(self.encoding)
+                stem_name = self.read_str(stem_name_length)
                 ppm6 = self.read_value()
 
                 direction.append(
@@ -60,3 +60,87 @@ def read_value(stream: "BufferedIOBase", signed=True) -> int:
         return decoded
 
     raise ValueError
+
+
+def read_values(
+    buffer: "bytes | bytearray | memoryview",
+    offset: int,
+    count: int | None = None,
+    signed=True,
+) -> tuple[list[int], int]:
+    """
+    Decode `count` encoded values from a buffer, starting at `offset`, and return them
+    together with the offset after the last decoded value.
+
+    This is the bulk version of `read_value`, working on a buffer with an index instead
+    of a stream.
+
+    Args:
+        buffer (bytes | bytearray | memoryview): The input buffer.
+        offset (int): The offset of the first value in the buffer.
+        count (int | None, optional): The number of values to decode. If None, values
+            are decoded until the end of the buffer or until a 0 byte, which is
+            consumed. Defaults to None.
+        signed (bool, optional): Whether to interpret 32-bit values as signed
+            integers. Defaults to True.
+
+    Raises:
+        EOFError: When a 0 byte is encountered, or the buffer ends before `count`
+            values were decoded.
+        ValueError: When a byte value < 0x20 is encountered.
+
+    Returns:
+        tuple[list[int], int]: The decoded values and the new offset.
+    """
+    end = len(buffer)
+    until_end = count is None
+    if count is None:
+        # Upper bound, each value takes at least one byte
+        count = end - offset
+
+    values: list[int] = []
+    append = values.append
+    try:
+        for _ in range(count):
+            if until_end and offset == end:
+                break
+
+            val = buffer[offset]
+            if 0x20 <= val < 0xF7:
+                # -107 to 107, represented by 1 byte
+                append(val - 0x8B)
+                offset += 1
+            elif 0xF7 <= val <= 0xFA:
+                # 108 to 1131, represented by 2 bytes
+                append(0x100 * val - 0xF694 + buffer[offset + 1])
+                offset += 2
+            elif 0xFB <= val <= 0xFE:
+                # -108 to -1131, represented by 2 bytes
+                append(-0x100 * val + 0xFA94 - buffer[offset + 1])
+                offset += 2
+            elif val == 0xFF:
+                # 32 bit integer follows
+                if offset + 5 > end:
+                    raise EOFError
+
+                append(
+                    int.from_bytes(
+                        buffer[offset + 1 : offset + 5],  # noqa: E203
+                        byteorder="big",
+                        signed=signed,
+                    )
+                )
+                offset += 5
+            elif val == 0:
+                if until_end:
+                    offset += 1
+                    break
+
+                raise EOFError
+
+            else:
+                raise ValueError
+    except IndexError:
+        raise EOFError
+
+    return values, offset
@@ -0,0 +1,292 @@
+from functools import cache
+from math import cos, pi, sin
+from pathlib import Path
+from typing import Any
+
+from vfbLib.compilers.glyph import GlyphCompiler
+from vfbLib.enum import F, G, M
+from vfbLib.parsers.header import FL30_APP, FL30_FILE, FL30_SIGNATURE
+from vfbLib.templates.glyph import get_empty_glyph
+from vfbLib.vfb.entry import VfbEntry
+from vfbLib.vfb.vfb import Vfb
+
+# The possible numbers of masters, FontLab 5 supports up to 4 axes with 2 masters each
+MASTER_COUNTS = (1, 2, 4, 8, 16)
+
+# The maximum number of nodes per contour, more nodes are split into more contours
+NODES_PER_CONTOUR = 24
+
+# The first code point that is assigned to synthetic glyphs, and the last one
+FIRST_CODEPOINT = 0x4E00
+LAST_CODEPOINT = 0x9FFF
+
+# The TrueType commands that are cycled through to build the TrueType hinting
+TT_COMMAND_CYCLE = ("SingleLinkH", "SingleLinkV", "InterpolateH", "MDeltaV")
+
+
+def get_glyph_name(index: int) -> str:
+    """
+    Return the name of the synthetic glyph at `index`. The first glyph is .notdef, the
+    following glyphs are named after the CJK code points they are encoded at, and any
+    glyphs beyond the CJK block are unencoded.
+    """
+    if index == 0:
+        return ".notdef"
+
+    codepoint = get_codepoint(index)
+    if codepoint is None:
+        return f"cid{index:05d}"
+
+    return f"uni{codepoint:04X}"
+
+
+def get_codepoint(index: int) -> int | None:
+    codepoint = FIRST_CODEPOINT + index - 1
+    if index == 0 or codepoint > LAST_CODEPOINT:
+        return None
+
+    return codepoint
+
+
+@cache
+def get_synthetic_contour(
+    size: int, cx: int, cy: int, radius: int, num_masters: int
+) -> list[dict[str, Any]]:
+    """
+    Return the nodes of a polygon contour with alternating line and curve segments,
+    which is wider in each master. The result is cached, so it must not be modified.
+    """
+    nodes: list[dict[str, Any]] = []
+    for k in range(size):
+        angle = 2 * pi * k / size
+        node_type = "move" if k == 0 else ("curve" if k % 2 else "line")
+        master_points = []
+        for m in range(num_masters):
+            r = radius + 10 * m
+            x = round(cx + r * cos(angle))
+            y = round(cy + r * sin(angle))
+            if node_type == "curve":
+                # The end point is followed by the control points, which are placed
+                # halfway along the polygon
+                a = 2 * pi * (k - 0.5) / size
+                c = (round(cx + r * cos(a)), round(cy + r * sin(a)))
+                master_points.append([(x, y), c, c])
+            else:
+                master_points.append([(x, y)])
+        nodes.append({"type": node_type, "flags": 0, "points": master_points})
+    return nodes
+
+
+def get_synthetic_nodes(
+    index: int, num_nodes: int, num_masters: int
+) -> list[dict[str, Any]]:
+    """
+    Return `num_nodes` nodes in contours of at most NODES_PER_CONTOUR nodes.
+    """
+    nodes: list[dict[str, Any]] = []
+    contour = 0
+    while len(nodes) < num_nodes:
+        size = min(NODES_PER_CONTOUR, num_nodes - len(nodes))
+        cx = 250 + 100 * (contour % 4)
+        cy = 350 + 100 * (contour // 4 % 4)
+        radius = 40 + (index + contour) % 60
+        nodes.extend(get_synthetic_contour(size, cx, cy, radius, num_masters))
+        contour += 1
+    return nodes
+
+
+def get_synthetic_glyph(
+    index: int,
+    num_glyphs: int,
+    num_masters: int,
+    num_nodes: int,
+    num_kerning_pairs: int,
+    num_hints: int,
+    num_tt_commands: int,
+) -> dict[str, Any]:
+    """
+    Return the decompiled data of a synthetic glyph, see `get_synthetic_vfb`.
+    """
+    glyph = get_empty_glyph(num_masters)
+    glyph["name"] = get_glyph_name(index)
+    glyph["nodes"] = get_synthetic_nodes(index, num_nodes, num_masters)
+    glyph["metrics"] = [(600 + 20 * m, 0) for m in range(num_masters)]
+    if num_hints:
+        glyph["hints"] = {
+            direction: [
+                [
+                    {"pos": 100 + 40 * h + m, "width": 30 + 10 * m}
+                    for m in range(num_masters)
+                ]
+                for h in range(num_hints)
+            ]
+            for direction in ("h", "v")
+        }
+    if num_kerning_pairs:
+        glyph["kerning"] = {
+            (index + k) % num_glyphs: [-10 - m - k % 50 for m in range(num_masters)]
+            for k in range(1, num_kerning_pairs + 1)
+        }
+    if num_tt_commands and num_nodes > 1:
+        tth: list[dict[str, Any]] = []
+        for i in range(num_tt_commands):
+            cmd = TT_COMMAND_CYCLE[i % len(TT_COMMAND_CYCLE)]
+            pt1 = i % num_nodes
+            pt2 = (i + 1) % num_nodes
+            params: dict[str, int]
+            if cmd == "InterpolateH":
+                pti = (i + 2) % num_nodes
+                params = {"pti": pti, "pt1": pt1, "pt2": pt2, "align": -1}
+            elif cmd == "MDeltaV":
+                params = {"pt": pt1, "shift": 1, "ppm1": 12, "ppm2": 16}
+            else:
+                params = {"pt1": pt1, "pt2": pt2, "stem": -1, "align": -1}
+            tth.append({"cmd": cmd, "params": params})
+        glyph["tth"] = tth
+    return glyph
+
+
+def get_master_location(master_index: int, num_axes: int) -> tuple[float, ...]:
+    # The masters are at the corners of the design space, the first axis changes first
+    location = [float(master_index >> axis & 1) for axis in range(num_axes)]
+    return tuple(location + [0.0] * (4 - num_axes))
+
+
+def get_postscript_info() -> dict[str, Any]:
+    return {
+        "font_matrix": (0.001, 0.0, 0.0, 0.001, 0.0, 0.0),
+        "force_bold": 0,
+        "blue_values": [0] * 14,
+        "other_blues": [0] * 10,
+        "family_blues": [0] * 14,
+        "family_other_blues": [0] * 10,
+        "blue_scale": 0.039625,
+        "blue_shift": 7,
+        "blue_fuzz": 1,
+        "std_hw": 100,
+        "std_vw": 50,
+        "stem_snap_h": [0] * 12,
+        "stem_snap_v": [0] * 12,
+        "bounding_box": {"xMin": 0, "yMin": 0, "xMax": 1000, "yMax": 1000},
+        "adv_width_min": 0,
+        "adv_width_max": 0,
+        "adv_width_avg": 600,
+        "ascender": 880,
+        "descender": -120,
+        "x_height": 500,
+        "cap_height": 700,
+    }
+
+
+def get_synthetic_vfb(
+    num_glyphs: int = 1000,
+    num_masters: int = 1,
+    num_nodes: int = 40,
+    num_kerning_pairs: int = 0,
+    num_hints: int = 0,
+    num_tt_commands: int = 0,
+) -> Vfb:
+    """
+    Build a synthetic VFB for load testing, which has the minimal font-level entries
+    and a number of generated glyphs. The glyph entries are compiled right away, so even
+    large fonts can be built in memory.
+
+    Args:
+        num_glyphs (int, optional): The number of glyphs. Defaults to 1000.
+        num_masters (int, optional): The number of masters, 1, 2, 4, 8, or 16.
+            Defaults to 1.
+        num_nodes (int, optional): The number of outline nodes per glyph. Defaults to
+            40.
+        num_kerning_pairs (int, optional): The number of kerning pairs per glyph.
+            Defaults to 0.
+        num_hints (int, optional): The number of PostScript hints per direction and
+            glyph. Defaults to 0.
+        num_tt_commands (int, optional): The number of TrueType hinting commands per
+            glyph. Defaults to 0.
+
+    Returns:
+        Vfb: The synthetic VFB.
+    """
+    if num_masters not in MASTER_COUNTS:
+        raise ValueError(
+            f"Number of masters must be one of {MASTER_COUNTS}: {num_masters}"
+        )
+
+    vfb = Vfb(timing=False)
+    vfb.header.data = {
+        "signature": FL30_SIGNATURE,
+        "app_version": FL30_APP,
+        "file_version": FL30_FILE,
+        "version_major": 3,
+        "version_minor": 0,
+    }
+    vfb.num_masters = num_masters
+
+    def add(eid: int, data: Any) -> None:
+        entry = VfbEntry(vfb, eid=eid)
+        entry.data = data
+        vfb.add_entry(entry)
+
+    num_axes = (num_masters - 1).bit_length()
+    add(F.BlockFileDataStart, "")
+    add(F.BlockFontStart, "")
+    add(F.FLVersion, {"platform": "macos", "version": (5, 2, 2, 128), "owner": 0})
+    add(F.BlockNamesStart, "")
+    add(F.MMEncType, 1 if num_axes else 0)
+    add(F.BlockNamesEnd, "")
+    add(F.BlockFontInfoStart, "")
+    add(F.font_name, "Synthetic-Regular")
+    add(F.MasterCount, num_masters)
+    add(F.weight_vector, [1.0] + [0.0] * (num_masters - 1))
+    add(F.family_name, "Synthetic")
+    add(F.version, "1.000")
+    add(F.upm, 1000)
+    add(F.BlockFontInfoEnd, "")
+    add(F.BlockMMFontInfoStart, "")
+    add(F.AxisCount, num_axes)
+    for axis in range(num_axes):
+        add(F.AxisName, f"Axis{axis + 1}")
+    add(
+        F.AnisotropicInterpolationMappings,
+        [[(0, 0), (1000, 1000)] for _ in range(num_axes)],
+    )
+    add(F.AxisMappingsCount, [2] * num_axes + [0] * (4 - num_axes))
+    axis_mappings: list[tuple[float, float]] = []
+    for axis in range(4):
+        mappings = [(0.0, 0.0), (1000.0, 1.0)] if axis < num_axes else []
+        axis_mappings.extend(mappings + [(0.0, 0.0)] * (10 - len(mappings)))
+    add(F.AxisMappings, axis_mappings)
+    for m in range(num_masters):
+        add(M.MasterName, f"Master {m}")
+        add(M.MasterLocation, (m + 1, get_master_location(m, num_axes)))
+    for m in range(num_masters):
+        add(M.PostScriptInfo, get_postscript_info())
+    add(F.BlockMMFontInfoEnd, "")
+
+    compiler = GlyphCompiler()
+    for i in range(num_glyphs):
+        glyph = get_synthetic_glyph(
+            i,
+            num_glyphs,
+            num_masters,
+            num_nodes,
+            num_kerning_pairs,
+            num_hints,
+            num_tt_commands,
+        )
+        add(G.Glyph, compiler.compile(glyph, vfb))
+        codepoint = get_codepoint(i)
+        if codepoint is not None:
+            add(G.unicodes, [codepoint])
+
+    add(F.BlockFontEnd, "")
+    add(F.BlockFileDataEnd, "")
+    return vfb
+
+
+def write_synthetic_vfb(out_path: Path, **kwargs: int) -> None:
+    """
+    Build a synthetic VFB and write it to `out_path`. See `get_synthetic_vfb` for the
+    keyword arguments.
+    """
+    get_synthetic_vfb(**kwargs).write(out_path)
@@ -1,5 +1,5 @@
 import codecs
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from copy import deepcopy
 from pathlib import Path
 from sys import exit
@@ -7,11 +7,59 @@ from typing import Any
 
 import orjson
 
+from vfbLib.batch import add_batch_arguments, get_input_paths, run_batch
 from vfbLib.ufo.glyph import IndexVfbToUfoGlyph
 from vfbLib.ufo.tth import TTGlyphHints, transform_stem_rounds
 from vfbLib.vfb.vfb import Vfb
 
 
+def _export_tth(vfb_path: Path, args: Namespace) -> bool:
+    """
+    Export the TrueType hinting of one VFB file. Returns whether there were
+    decompilation errors.
+    """
+    print(f"Reading file {vfb_path} ...")
+    vfb = Vfb(
+        vfb_path,
+        only_header=False,
+        minimal=True,
+        unicode_strings=True,
+    )
+    suffix = f".tth.{args.format}"
+    if args.path:
+        out_path = (Path(args.path[0]) / vfb_path.name).with_suffix(suffix)
+    else:
+        out_path = vfb_path.with_suffix(suffix)
+    data = extract_truetype_hinting(vfb)
+    if args.format == "toml":
+        import tomli_w
+
+        with open(out_path, "wb") as f:
+            tomli_w.dump(data, f)
+    elif args.format == "yaml":
+        import yaml
+
+        with codecs.open(str(out_path), "wb", "utf-8") as f:
+            yaml.dump(data, f, sort_keys=True, indent=2)
+    else:
+        with open(str(out_path), "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_SORT_KEYS,
+                )
+            )
+
+    return vfb.any_errors
+
+
+def _vfb2tth_file(vfb_path: Path, args: Namespace) -> None:
+    if _export_tth(vfb_path, args):
+        raise ValueError("There were decompilation errors.")
+
+
 def vfb2tth():
     """
     The command line interface for exporting TrueType hinting in FontLab's high-level
@@ -34,51 +82,15 @@ def vfb2tth():
         nargs=1,
         help="output folder",
     )
-    parser.add_argument(
-        "inputpath",
-        type=str,
-        nargs=1,
-        help="input file path (.vfb)",
-    )
+    add_batch_arguments(parser)
     args = parser.parse_args()
     if args:
-        vfb_path = Path(args.inputpath[0])
         print(parser.description)
-        print(f"Reading file {vfb_path} ...")
-        vfb = Vfb(
-            vfb_path,
-            only_header=False,
-            minimal=True,
-            unicode_strings=True,
-        )
-        suffix = f".tth.{args.format}"
-        if args.path:
-            out_path = (Path(args.path[0]) / vfb_path.name).with_suffix(suffix)
-        else:
-            out_path = vfb_path.with_suffix(suffix)
-        data = extract_truetype_hinting(vfb)
-        if args.format == "toml":
-            import tomli_w
-
-            with open(out_path, "wb") as f:
-                tomli_w.dump(data, f)
-        elif args.format == "yaml":
-            import yaml
-
-            with codecs.open(str(out_path), "wb", "utf-8") as f:
-                yaml.dump(data, f, sort_keys=True, indent=2)
-        else:
-            with open(str(out_path), "wb") as f:
-                f.write(
-                    orjson.dumps(
-                        data,
-                        option=orjson.OPT_INDENT_2
-                        | orjson.OPT_NON_STR_KEYS
-                        | orjson.OPT_SORT_KEYS,
-                    )
-                )
+        vfb_paths = get_input_paths(args)
+        if len(vfb_paths) > 1:
+            exit(1 if run_batch(_vfb2tth_file, vfb_paths, args, args.jobs) else 0)
 
-        if vfb.any_errors:
+        if _export_tth(vfb_paths[0], args):
             exit("There were decompilation errors.")
     else:
         parser.print_help()
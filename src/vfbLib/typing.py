@@ -1,4 +1,7 @@
-from typing import Any, Literal, NotRequired, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict
+
+if TYPE_CHECKING:
+    from vfbLib.outlines import CompactOutline
 
 Point = tuple[int, int]
 
@@ -392,7 +395,7 @@ class GlyphData(TypedDict):
     kerning: NotRequired[dict[int, list[int]]]
     metrics: NotRequired[list[Point]]
     name: NotRequired[str]
-    nodes: NotRequired[list[MMNode]]
+    nodes: NotRequired["list[MMNode] | CompactOutline"]
     num_masters: NotRequired[int]
     # num_node_values: NotRequired[int]
     tth: NotRequired[list[Instruction]]
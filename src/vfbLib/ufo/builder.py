@@ -1,5 +1,7 @@
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from hashlib import sha256
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -24,6 +26,14 @@ from vfbLib.ufo.features import rename_kern_classes_in_feature_code
 from vfbLib.ufo.glyph import VfbToUfoGlyph
 from vfbLib.ufo.groups import transform_groups
 from vfbLib.ufo.guides import apply_guide_properties, get_master_guides
+from vfbLib.ufo.hashcache import GlyphHashCache
+from vfbLib.ufo.incremental import (
+    get_glyph_digests,
+    get_manifest_path,
+    read_manifest,
+    update_ufo,
+    write_manifest,
+)
 from vfbLib.ufo.info import VfbToUfoInfo, default_tt_lib
 from vfbLib.ufo.instructions import format_assembly
 from vfbLib.ufo.kerning import UfoKerning
@@ -51,6 +61,32 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# The builder in a worker process, see VfbToUfoBuilder.get_ufo_masters
+_worker_builder: "VfbToUfoBuilder | None" = None
+
+
+def _init_master_worker(builder: "VfbToUfoBuilder") -> None:
+    global _worker_builder
+    _worker_builder = builder
+
+
+def _build_ufo_master(index: int, silent: bool) -> Font:
+    assert _worker_builder is not None
+    return _worker_builder.get_ufo_master(index, silent)
+
+
+def _save_ufo(
+    ufo: Font,
+    path: Path,
+    structure: UFOFileStructure | None,
+    overwrite: bool,
+    normalize: bool,
+) -> None:
+    ufo.save(path, structure=structure, overwrite=overwrite)
+    if normalize:
+        normalizeUFO(ufoPath=path, onlyModified=False, writeModTimes=False)
+
+
 class VfbToUfoBuilder:
     def __init__(
         self,
@@ -61,6 +97,7 @@ class VfbToUfoBuilder:
         add_kerning_groups=False,
         move_groups=True,
         normalize=True,
+        hash_cache: GlyphHashCache | Path | None = None,
     ) -> None:
         """Serialize the JSON structure to UFO(s)
 
@@ -75,6 +112,10 @@ class VfbToUfoBuilder:
                 Defaults to False.
             move_groups (bool, optional): Move non-kerning groups from `groups.plist` to
                 `features.fea`. Defaults to True.
+            hash_cache (GlyphHashCache | Path | None, optional): A cache, or the path
+                of a cache file, for the TrueType glyph hashes. Glyphs whose outlines
+                have not changed since the hash was stored reuse it instead of
+                calculating it again. Defaults to None.
         """
         self.axes: "list[AxisDescriptor | DiscreteAxisDescriptor]" = []
         self.axis_count: int = 0
@@ -85,6 +126,10 @@ class VfbToUfoBuilder:
         self.add_kerning_groups_to_fea = add_kerning_groups
         self.move_groups_to_fea = move_groups
         self.normalize_ufos = normalize
+        if isinstance(hash_cache, Path):
+            hash_cache = GlyphHashCache(hash_cache)
+        self.hash_cache = hash_cache
+        self._glyph_hash_keys: dict[tuple[str, int], str | None] = {}
 
         self.features_classes = ""
         self.features_code = ""
@@ -109,6 +154,8 @@ class VfbToUfoBuilder:
         self.current_glyph: VfbToUfoGlyph | None = None
         self.glyph_masters: dict[str, VfbToUfoGlyph] = {}
         self.glyphOrder: list[str] = []
+        # The glyph index by glyph name, for fast lookups in glyphOrder
+        self.glyph_ids: dict[str, int] = {}
         # TT
         self.stem_ppms: TUfoStemPPMsDict = {"ttStemsH": [], "ttStemsV": []}
         self.stems: TUfoStemsDict = {"ttStemsH": [], "ttStemsV": []}
@@ -117,6 +164,12 @@ class VfbToUfoBuilder:
         self.zone_names: dict[str, list[str]] = {}
         self.build()
 
+    def __getstate__(self) -> dict[str, Any]:
+        # The Vfb is not needed after building, don't copy it to worker processes
+        state = self.__dict__.copy()
+        state["vfb"] = None
+        return state
+
     def add_axis_mappings(self, data: list[tuple[float, float]]) -> None:
         if not self.axis_mappings_count:
             raise ValueError(
@@ -437,6 +490,15 @@ class VfbToUfoBuilder:
             if key in skip_keys:
                 continue
 
+            glyph_digest = None
+            if key == G.Glyph and self.hash_cache is not None:
+                # Get the digest of the compiled glyph data before it is accessed in
+                # decompiled form
+                if e.is_compiled or not e.modified:
+                    raw = e.raw
+                    if raw is not None:
+                        glyph_digest = sha256(raw).digest()
+
             data = e.data
             if data is None:
                 continue
@@ -468,6 +530,8 @@ class VfbToUfoBuilder:
                                 self.glyph_masters[name] = self.current_glyph
                                 self.glyphOrder.append(name)
                     self.build_mm_glyph(data)
+                    assert self.current_glyph is not None
+                    self.current_glyph.source_digest = glyph_digest
                 case G.VSB:
                     assert self.current_glyph is not None
                     # TODO
@@ -664,6 +728,7 @@ class VfbToUfoBuilder:
             self.glyph_masters[self.current_glyph.name] = self.current_glyph
             self.glyphOrder.append(self.current_glyph.name)
         self.lib["public.glyphOrder"] = self.glyphOrder
+        self.glyph_ids = {name: gid for gid, name in enumerate(self.glyphOrder)}
         self.build_tt_glyph_lib()
         self.assure_tt_lib()
         self.build_tt_stems_lib()
@@ -690,6 +755,8 @@ class VfbToUfoBuilder:
             self.masters.extend(additional)
 
     def get_master_info(self, master_index: int = 0) -> VfbToUfoInfo:
+        # The info is small and only copied once per master, so each master gets its
+        # own copy, including the nested lists
         master_info = deepcopy(self.info)
         # Update the info with master-specific values
         properties = [
@@ -755,10 +822,11 @@ class VfbToUfoBuilder:
         master_kerning = self.ufo_kerning.get_master_kerning(master_index=index)
         master_info = self.get_master_info(master_index=index)
 
-        # Pass as much data right to the UFO
+        # Pass as much data right to the UFO. Each master gets its own group member
+        # lists, only the glyph names are shared.
         ufo = Font(
             features=self.ufo_features.text,
-            groups=deepcopy(self.ufo_groups),
+            groups={name: list(glyphs) for name, glyphs in self.ufo_groups.items()},
             info=master_info,
             kerning=master_kerning,
             lib=self.lib,
@@ -815,19 +883,95 @@ class VfbToUfoBuilder:
             if TT_UFO_LIB_KEY not in glyph.lib:
                 continue
 
-            # Calculate the glyph hash
-            hp = HashPointPen(glyph.width, glyphSet=ufo)
-            glyph.drawPoints(hp)
-            glyph.lib[TT_UFO_LIB_KEY]["id"] = hp.hash
+            glyph_hash = None
+            if self.hash_cache is not None:
+                assert glyph.name is not None
+                hash_key = self.get_glyph_hash_key(glyph.name, index)
+                if hash_key is not None:
+                    glyph_hash = self.hash_cache.get(hash_key)
+
+            if glyph_hash is None:
+                # Calculate the glyph hash
+                hp = HashPointPen(glyph.width, glyphSet=ufo)
+                glyph.drawPoints(hp)
+                glyph_hash = hp.hash
+            glyph.lib[TT_UFO_LIB_KEY]["id"] = glyph_hash
 
         return ufo
 
-    def get_ufo_masters(self, silent=False) -> list[Font]:
+    def get_glyph_hash_key(self, name: str, master_index: int) -> str | None:
+        """
+        Return the key of a master glyph in the TrueType glyph hash cache. It is built
+        from the digest of the glyph entry, the master index, and the keys of the
+        component base glyphs.
+
+        Returns:
+            str | None: The key, or None if the glyph can't be cached, e.g. because its
+                glyph entry or one of its base glyphs was modified before conversion.
+        """
+        cache_key = (name, master_index)
+        if cache_key in self._glyph_hash_keys:
+            return self._glyph_hash_keys[cache_key]
+
+        # Guard against cyclic component references
+        self._glyph_hash_keys[cache_key] = None
+        mm_glyph = self.glyph_masters.get(name)
+        if mm_glyph is None or mm_glyph.source_digest is None:
+            return None
+
+        h = sha256(mm_glyph.source_digest)
+        h.update(master_index.to_bytes(2, "little"))
+        for c in mm_glyph.mm_components:
+            base_key = self.get_glyph_hash_key(self.glyphOrder[c["gid"]], master_index)
+            if base_key is None:
+                return None
+
+            h.update(base_key.encode("ascii"))
+        hash_key = h.hexdigest()
+        self._glyph_hash_keys[cache_key] = hash_key
+        return hash_key
+
+    def update_hash_cache(self, ufo_masters: list[Font]) -> None:
+        """
+        Store the TrueType glyph hashes of the master UFOs in the hash cache, and save
+        the cache.
+        """
+        if self.hash_cache is None:
+            return
+
+        for index, ufo in enumerate(ufo_masters):
+            for glyph in ufo:
+                tt_lib = glyph.lib.get(TT_UFO_LIB_KEY)
+                if tt_lib is None or "id" not in tt_lib:
+                    continue
+
+                assert glyph.name is not None
+                hash_key = self.get_glyph_hash_key(glyph.name, index)
+                if hash_key is not None:
+                    self.hash_cache.set(hash_key, tt_lib["id"])
+        self.hash_cache.save()
+
+    def get_ufo_masters(self, silent=False, workers: int | None = None) -> list[Font]:
+        """
+        Build and return the master UFOs.
+
+        Args:
+            silent (bool, optional): Don't print progress. Defaults to False.
+            workers (int | None, optional): The number of worker processes used to
+                build the masters. The first master is always built in the current
+                process, because it may add point labels that are used by the other
+                masters. The other masters are built concurrently in a process pool,
+                which receives the prepared builder once per worker. If None or 1, all
+                masters are built in the current process. Defaults to None.
+
+        Returns:
+            list[Font]: The master UFOs.
+        """
         # Prepare data shared by the master UFOs
         ufo_groups, group_order, key_glyphs = transform_groups(
             self.groups,
             self.kerning_class_flags,
-            self.glyphOrder,
+            self.glyph_ids,
             self.minimal,
         )
         self.ufo_kerning = UfoKerning(
@@ -872,20 +1016,39 @@ class VfbToUfoBuilder:
             self.ufo_features.text += f"\n\n{self.features_code}"
 
         ufo_masters = []
-        logger.info(f"Extracting {len(self.masters)} master UFOs...")
-        for i in range(len(self.masters)):
-            ufo_masters.append(self.get_ufo_master(i, silent))
+        num_masters = len(self.masters)
+        logger.info(f"Extracting {num_masters} master UFOs...")
+        if workers is None or workers < 2 or num_masters < 3:
+            for i in range(num_masters):
+                ufo_masters.append(self.get_ufo_master(i, silent))
+            self.update_hash_cache(ufo_masters)
+            return ufo_masters
+
+        if num_masters:
+            ufo_masters.append(self.get_ufo_master(0, silent))
+        with ProcessPoolExecutor(
+            max_workers=min(workers, num_masters - 1),
+            initializer=_init_master_worker,
+            initargs=(self,),
+        ) as executor:
+            indices = range(1, num_masters)
+            ufo_masters.extend(
+                executor.map(_build_ufo_master, indices, [silent] * len(indices))
+            )
+        self.update_hash_cache(ufo_masters)
         return ufo_masters
 
     def get_ufos_designspace(
-        self, out_path: Path, silent=False
+        self, out_path: Path, silent=False, workers: int | None = None
     ) -> tuple[list[Font], DesignSpaceDocument | None]:
         """
         Build UFOs and a DesignSpaceDocument from the VFB contents in memory and return
         them. The DesignSpaceDocument is only returned for VFBs containing more than one
         master. In other cases, the second element of the returned tuple is None.
+
+        See `get_ufo_masters` for the `workers` argument.
         """
-        ufo_masters = self.get_ufo_masters(silent)
+        ufo_masters = self.get_ufo_masters(silent, workers)
         if not ufo_masters:
             logger.error("Could not extract any UFO masters.")
             raise ValueError
@@ -896,30 +1059,64 @@ class VfbToUfoBuilder:
         return ufo_masters, ds
 
     def write(
-        self, out_path: Path, overwrite=False, silent=False, ufoz=False, json=False
+        self,
+        out_path: Path,
+        overwrite=False,
+        silent=False,
+        ufoz=False,
+        json=False,
+        workers: int | None = None,
+        incremental=False,
     ) -> None:
         """
         Write a the VFB contents to master UFOs and a designspace file. The designspace
         file is only written if the VFB contains more than one master.
+
+        See `get_ufo_masters` for the `workers` argument. If it is given, the master
+        UFOs are also saved and normalized concurrently in a process pool.
+
+        If `incremental` is True, a manifest of glyph digests is written next to the
+        UFO. In the next incremental run, the UFOs listed in the manifest are updated in
+        place, and only the glyphs that have changed are written and normalized. The
+        font-level files are always written. Writing UFOs non-incrementally removes the
+        manifest.
         """
         if json:
             out_path = out_path.with_suffix(".json")
         # Build UFOs and DesignSpace
-        ufos, ds = self.get_ufos_designspace(out_path, silent)
+        ufos, ds = self.get_ufos_designspace(out_path, silent, workers)
 
         # Write the master UFOs
         strct = UFOFileStructure.ZIP if ufoz else None
         indent = None if ufoz else 2
-        for index, ufo in enumerate(ufos):
-            master_path = self.get_master_path(out_path, index)
-            if json:
+        normalize = self.normalize_ufos and not ufoz
+        master_paths = [self.get_master_path(out_path, i) for i in range(len(ufos))]
+        if json:
+            for ufo, master_path in zip(ufos, master_paths):
                 ufo.json_dump(master_path, indent=indent, sort_keys=False)
+        else:
+            save_ufos = list(zip(ufos, master_paths))
+            manifest = None
+            if incremental and not ufoz:
+                manifest = read_manifest(out_path, normalize)
+                digests = [get_glyph_digests(ufo) for ufo in ufos]
+                if manifest is not None and len(manifest) == len(ufos):
+                    # Update the UFOs from the previous run in place
+                    save_ufos = [
+                        (ufo, master_path)
+                        for ufo, master_path, old, new in zip(
+                            ufos, master_paths, manifest, digests
+                        )
+                        if not master_path.is_dir()
+                        or not update_ufo(ufo, master_path, old, new, normalize)
+                    ]
+                    # The files belong to the previous run, they may be overwritten
+                    overwrite = True
             else:
-                ufo.save(master_path, structure=strct, overwrite=overwrite)
-                if self.normalize_ufos and not ufoz:
-                    normalizeUFO(
-                        ufoPath=master_path, onlyModified=False, writeModTimes=False
-                    )
+                get_manifest_path(out_path).unlink(missing_ok=True)
+            self._save_ufos(save_ufos, strct, overwrite, normalize, workers)
+            if incremental and not ufoz:
+                write_manifest(out_path, digests, normalize)
 
         # Write the Designspace
         if ds:
@@ -931,6 +1128,36 @@ class VfbToUfoBuilder:
                 print(f"Writing designspace: {ds_path}")
             ds.write(str(ds_path))
 
+    def _save_ufos(
+        self,
+        save_ufos: list[tuple[Font, Path]],
+        structure: UFOFileStructure | None,
+        overwrite: bool,
+        normalize: bool,
+        workers: int | None = None,
+    ) -> None:
+        """
+        Save and normalize the UFOs to their paths, optionally in a process pool.
+        """
+        n = len(save_ufos)
+        if workers is None or workers < 2 or n < 2:
+            for ufo, master_path in save_ufos:
+                _save_ufo(ufo, master_path, structure, overwrite, normalize)
+            return
+
+        with ProcessPoolExecutor(max_workers=min(workers, n)) as executor:
+            # Consume the results to raise any exceptions from the workers
+            list(
+                executor.map(
+                    _save_ufo,
+                    [ufo for ufo, _ in save_ufos],
+                    [master_path for _, master_path in save_ufos],
+                    [structure] * n,
+                    [overwrite] * n,
+                    [normalize] * n,
+                )
+            )
+
     def get_designspace(self, out_path: Path) -> DesignSpaceDocument:
         """
         Build and return a DesignSpaceDocument. The out_path argument will be used to
@@ -7,6 +7,7 @@ from vfbLib.ufo.instructions import format_assembly
 from vfbLib.ufo.vfb2ufo import TT_UFO_LIB_KEY, vfb2ufo_label_codes
 
 if TYPE_CHECKING:
+    from vfbLib.outlines import CompactOutline
     from vfbLib.typing import (
         AnchorDict,
         MMGuidesDict,
@@ -14,6 +15,7 @@ if TYPE_CHECKING:
         MMNode,
     )
     from vfbLib.ufo.builder import VfbToUfoBuilder
+    from vfbLib.ufo.paths import ContourTemplate
     from vfbLib.ufo.tth import TTGlyphHints
 
 
@@ -34,8 +36,8 @@ class VfbToUfoGlyph:
         self.mm_guides: "MMGuidesDict | None" = None
         self.mm_hints: "MMHintsDict" = {"h": [], "v": []}
         self.mm_metrics: list[tuple[int, int]] = []
-        self.mm_nodes: "list[MMNode]" = []
-        self.mm_mask_nodes: "list[MMNode]" = []
+        self.mm_nodes: "list[MMNode] | CompactOutline" = []
+        self.mm_mask_nodes: "list[MMNode] | CompactOutline" = []
         self.mm_mask_metrics: list[tuple[int, int]] = []
         self.name: str | None = None
         self.note: str | None = None
@@ -45,6 +47,21 @@ class VfbToUfoGlyph:
         self.tt_glyph_hints: "TTGlyphHints | None" = None
         self.tth_commands: list[dict[str, str | bool]] = []
         self.unicodes: list[int] = []
+        # The digest of the compiled glyph entry, for the TrueType glyph hash cache
+        self.source_digest: bytes | None = None
+        # The contour structures shared by all masters, for the outline and the mask
+        self._contour_templates: "dict[bool, ContourTemplate]" = {}
+
+    def get_contour_template(self, to_mask: bool = False) -> "ContourTemplate | None":
+        return self._contour_templates.get(to_mask)
+
+    def set_contour_template(
+        self, to_mask: bool, template: "ContourTemplate | None"
+    ) -> None:
+        if template is None:
+            self._contour_templates.pop(to_mask, None)
+        else:
+            self._contour_templates[to_mask] = template
 
     def get_point_label(self, index: int, code: str, start_count: int = 1) -> str:
         if self.mm_components:
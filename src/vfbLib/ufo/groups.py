@@ -2,6 +2,8 @@ import logging
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from vfbLib.typing import KerningClassFlagDict
     from vfbLib.ufo.typing import UfoGroups
 
@@ -12,7 +14,7 @@ logger = logging.getLogger(__name__)
 def check_for_missing_glyphs(
     group_name: str,
     glyphs: list[str],
-    glyphOrder: list[str],
+    glyphOrder: "Collection[str]",
     skip_missing_group_glyphs: bool = False,
 ) -> tuple[list[str], list[str]]:
     missing = [n for n in glyphs if n not in glyphOrder]
@@ -34,14 +36,15 @@ def check_for_missing_glyphs(
             if not remaining_glyphs:
                 logger.warning(f"Not adding empty group '{group_name}' to the UFO.")
                 return glyphs, missing
-            glyphs = [g for g in glyphs if g not in missing]
+            missing_set = set(missing)
+            glyphs = [g for g in glyphs if g not in missing_set]
     return glyphs, missing
 
 
 def transform_groups(
     orig_groups: "UfoGroups",
     kerning_class_flags: "KerningClassFlagDict",
-    glyphOrder: list[str],
+    glyphOrder: "Collection[str]",
     skip_missing_group_glyphs: bool = False,
 ) -> "tuple[UfoGroups, list[str], dict[str, str]]":
     """
@@ -62,8 +65,9 @@ def transform_groups(
         orig_groups (UfoGroups): The unprocessed groups.
         kerning_class_flags (KerningClassFlagDict): The dict containing information
             about which side of the kerning pair a group pertains to.
-        glyphOrder (list[str]): The glyph order of the font. It is used to remove any
-            glyphs that are not present in the font from the groups.
+        glyphOrder (Collection[str]): The glyph order of the font. It is used to remove
+            any glyphs that are not present in the font from the groups. For large
+            fonts, pass a set or a dict of glyph names for faster lookups.
         skip_missing_group_glyphs (bool, optional): Whether do omit glyphs that are not
             present in the font from the resulting groups. Empty groups are omitted as
             well.Defaults to False.
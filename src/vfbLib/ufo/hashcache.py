@@ -0,0 +1,110 @@
+import logging
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+import orjson
+from fontTools import version as fonttools_version
+
+logger = logging.getLogger(__name__)
+
+
+HASH_CACHE_FORMAT_VERSION = 1
+
+
+def get_vfblib_version() -> str:
+    # The hashes depend on the outline and TrueType conversion of vfbLib itself
+    try:
+        return version("vfbLib")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class GlyphHashCache:
+    """
+    A persistent cache of TrueType glyph hashes, as calculated by the `HashPointPen`.
+
+    The hashes are stored by a key that is built from the digests of the glyph entries
+    that contribute to the glyph outline, see `VfbToUfoBuilder.get_glyph_hash_key`. The
+    cache file is discarded if it was written by a different cache format version,
+    vfbLib version or fontTools version.
+
+    Only the hashes that were looked up or set since the cache was loaded are saved, so
+    the hashes of glyphs that have been changed, renamed or removed are dropped.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self.hashes: dict[str, str] = {}
+        # The keys that have been used in the current run
+        self.used: set[str] = set()
+        self.modified = False
+        if path is not None:
+            self.load()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.hashes
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def get(self, key: str) -> str | None:
+        glyph_hash = self.hashes.get(key)
+        if glyph_hash is not None:
+            self.used.add(key)
+        return glyph_hash
+
+    def set(self, key: str, glyph_hash: str) -> None:
+        self.used.add(key)
+        if self.hashes.get(key) != glyph_hash:
+            self.hashes[key] = glyph_hash
+            self.modified = True
+
+    def load(self) -> None:
+        """
+        Load the hashes from the cache file, if it exists and is valid.
+        """
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            with open(self.path, "rb") as f:
+                d = orjson.loads(f.read())
+        except orjson.JSONDecodeError:
+            logger.warning(f"Ignoring invalid glyph hash cache file: {self.path}")
+            return
+
+        if (
+            d.get("version") != HASH_CACHE_FORMAT_VERSION
+            or d.get("vfblib") != get_vfblib_version()
+            or d.get("fonttools") != fonttools_version
+        ):
+            logger.info(f"Ignoring outdated glyph hash cache file: {self.path}")
+            return
+
+        self.hashes = d["hashes"]
+        self.modified = False
+
+    def save(self) -> None:
+        """
+        Save the hashes that have been used in the current run to the cache file, if
+        there are any changes.
+        """
+        if self.path is None:
+            return
+
+        if len(self.used) < len(self.hashes):
+            self.hashes = {k: v for k, v in self.hashes.items() if k in self.used}
+            self.modified = True
+
+        if not self.modified:
+            return
+
+        d = {
+            "version": HASH_CACHE_FORMAT_VERSION,
+            "vfblib": get_vfblib_version(),
+            "fonttools": fonttools_version,
+            "hashes": self.hashes,
+        }
+        with open(self.path, "wb") as f:
+            f.write(orjson.dumps(d))
+        self.modified = False
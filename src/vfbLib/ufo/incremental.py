@@ -0,0 +1,195 @@
+import logging
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+import orjson
+from ufoLib2.objects.font import Font
+from ufonormalizer import (
+    normalizeFontInfoPlist,
+    normalizeGLIF,
+    normalizeGlyphNames,
+    normalizeGlyphsDirectoryNames,
+    normalizeGroupsPlist,
+    normalizeKerningPlist,
+    normalizeLayerContentsPlist,
+    normalizeLayerInfoPlist,
+    normalizeLibPlist,
+    normalizeMetaInfoPlist,
+    subpathExists,
+    subpathReadPlist,
+    subpathWritePlist,
+)
+
+logger = logging.getLogger(__name__)
+
+
+MANIFEST_FORMAT_VERSION = 1
+
+# The glyph digests of one master UFO, a list of (layer name, glyph digests) pairs in
+# layer order
+MasterDigests = list[tuple[str, dict[str, str]]]
+
+
+def get_manifest_path(ufo_path: Path) -> Path:
+    """
+    Return the path of the manifest file for the UFO at `ufo_path`.
+    """
+    return ufo_path.with_suffix(".ufo.manifest.json")
+
+
+def get_glyph_digests(ufo: Font) -> MasterDigests:
+    """
+    Return the digests of all glyphs of a UFO, per layer.
+
+    The digests are built from the converted glyphs rather than from the VFB entries,
+    because the UFO glyph also depends on other glyphs, e.g. on its component base
+    glyphs via the TrueType glyph hash, or on composites that add point labels to it.
+    """
+    return [
+        (
+            layer.name,
+            {
+                glyph.name: sha256(glyph.json_dumps()).hexdigest()
+                for glyph in layer
+                if glyph.name is not None
+            },
+        )
+        for layer in ufo.layers
+    ]
+
+
+def read_manifest(ufo_path: Path, normalize: bool) -> list[MasterDigests] | None:
+    """
+    Read the manifest for the UFO at `ufo_path`.
+
+    Returns:
+        list[MasterDigests] | None: The glyph digests per master, or None if there is no
+            valid manifest for the current options.
+    """
+    manifest_path = get_manifest_path(ufo_path)
+    if not manifest_path.exists():
+        return None
+
+    try:
+        with open(manifest_path, "rb") as f:
+            d = orjson.loads(f.read())
+    except orjson.JSONDecodeError:
+        logger.warning(f"Ignoring invalid manifest file: {manifest_path}")
+        return None
+
+    if d.get("version") != MANIFEST_FORMAT_VERSION or d.get("normalize") != normalize:
+        return None
+
+    return [
+        [(layer_name, digests) for layer_name, digests in master]
+        for master in d["masters"]
+    ]
+
+
+def write_manifest(
+    ufo_path: Path, masters: list[MasterDigests], normalize: bool
+) -> Path:
+    """
+    Write the manifest for the UFO at `ufo_path`.
+
+    Returns:
+        Path: The path of the manifest file.
+    """
+    manifest_path = get_manifest_path(ufo_path)
+    d: dict[str, Any] = {
+        "version": MANIFEST_FORMAT_VERSION,
+        "normalize": normalize,
+        "masters": masters,
+    }
+    with open(manifest_path, "wb") as f:
+        f.write(orjson.dumps(d))
+    return manifest_path
+
+
+def update_ufo(
+    ufo: Font,
+    path: Path,
+    old_digests: MasterDigests,
+    new_digests: MasterDigests,
+    normalize: bool,
+) -> bool:
+    """
+    Update the UFO at `path`, which was written from a previous version of `ufo`, by
+    writing only the glyphs whose digests have changed, and all the font-level files.
+
+    Returns:
+        bool: Whether the UFO could be updated. If False, the UFO must be written
+            completely, e.g. because its layers have changed.
+    """
+    if [name for name, _ in old_digests] != [name for name, _ in new_digests]:
+        return False
+
+    try:
+        existing = Font.open(path, lazy=True)
+    except Exception as e:
+        logger.info(f"Can't update UFO {path}: {e}")
+        return False
+
+    if existing.layers.layerOrder != [name for name, _ in new_digests]:
+        return False
+
+    changed_glyphs: dict[str, set[str]] = {}
+    for (layer_name, old), (_, new) in zip(old_digests, new_digests):
+        layer = ufo.layers[layer_name]
+        existing_layer = existing.layers[layer_name]
+        changed = {name for name, digest in new.items() if old.get(name) != digest}
+        for name in set(old) - set(new):
+            if name in existing_layer:
+                del existing_layer[name]
+        for name in changed:
+            existing_layer.insertGlyph(layer[name], overwrite=True, copy=False)
+        changed_glyphs[layer_name] = changed
+
+    existing.features = ufo.features
+    existing.groups = ufo.groups
+    existing.info = ufo.info
+    existing.kerning = ufo.kerning
+    existing.lib = ufo.lib
+    existing.save()
+
+    if normalize:
+        normalize_ufo_glyphs(path, changed_glyphs)
+    return True
+
+
+def normalize_ufo_glyphs(ufo_path: Path, glyphs: dict[str, set[str]]) -> None:
+    """
+    Normalize a UFO 3 like `ufonormalizer.normalizeUFO` does, but only normalize the
+    GLIF files of the supplied glyph names by layer name. The GLIF files of the other
+    glyphs must already be normalized.
+    """
+    normalizeGlyphsDirectoryNames(ufo_path)
+    if subpathExists(ufo_path, "layercontents.plist"):
+        layer_contents = subpathReadPlist(ufo_path, "layercontents.plist")
+        for layer_name, layer_directory in layer_contents:
+            glyph_mapping = normalizeGlyphNames(ufo_path, layer_directory)
+            for name in glyphs.get(layer_name, ()):
+                if name in glyph_mapping:
+                    normalizeGLIF(ufo_path, layer_directory, glyph_mapping[name])
+            # The layer info is always written, see normalizeGlyphsDirectory
+            if subpathExists(ufo_path, layer_directory, "layerinfo.plist"):
+                layer_info = subpathReadPlist(
+                    ufo_path, layer_directory, "layerinfo.plist"
+                )
+            else:
+                layer_info = {}
+            subpathWritePlist(layer_info, ufo_path, layer_directory, "layerinfo.plist")
+            normalizeLayerInfoPlist(ufo_path, layer_directory)
+
+    normalizeMetaInfoPlist(ufo_path, {})
+    if subpathExists(ufo_path, "fontinfo.plist"):
+        normalizeFontInfoPlist(ufo_path, {})
+    if subpathExists(ufo_path, "groups.plist"):
+        normalizeGroupsPlist(ufo_path, {})
+    if subpathExists(ufo_path, "kerning.plist"):
+        normalizeKerningPlist(ufo_path, {})
+    if subpathExists(ufo_path, "layercontents.plist"):
+        normalizeLayerContentsPlist(ufo_path, {})
+    if subpathExists(ufo_path, "lib.plist"):
+        normalizeLibPlist(ufo_path)
@@ -1,4 +1,5 @@
 import logging
+from array import array
 from typing import TYPE_CHECKING
 
 from vfbLib.ufo.groups import build_glyph_to_group_maps
@@ -23,8 +24,49 @@ class UfoKerning:
         self.groups, self.glyph_group_1, self.glyph_group_2 = group_info
         self.mm_kerning = mm_kerning
         self.key_glyphs = self._reverse_key_glyph_dict(key_glyphs)
+        # The columnar kerning store: The kerning pairs, the values per master in the
+        # same order as the pairs, and whether each pair is an exception
+        self.pairs: list[tuple[str, str]] = []
+        self.master_values: list[array] = []
+        self.exceptions = array("B")
         self._make_name_based_kerning()
 
+    @property
+    def mm_kerning_names(self) -> dict[tuple[str, str], list[int]]:
+        """
+        The name-based kerning, a dict of kerning pair to a list of master values.
+        Setting it rebuilds the columnar kerning store.
+        """
+        return self._mm_kerning_names
+
+    @mm_kerning_names.setter
+    def mm_kerning_names(self, value: dict[tuple[str, str], list[int]]) -> None:
+        self._mm_kerning_names = value
+        self._build_columns()
+
+    def _build_columns(self) -> None:
+        """
+        Build the columnar kerning store from the name-based kerning. The exception
+        status is computed only once for each pair.
+        """
+        kerning = self._mm_kerning_names
+        self.pairs = list(kerning)
+        self.master_values = [array("i", column) for column in zip(*kerning.values())]
+        key_glyphs = self.key_glyphs
+        group_1 = self.glyph_group_1
+        group_2 = self.glyph_group_2
+        # Inlined version of _is_exception
+        self.exceptions = array(
+            "B",
+            (
+                not (
+                    ((1, L) in key_glyphs or L not in group_1)
+                    and ((2, R) in key_glyphs or R not in group_2)
+                )
+                for L, R in self.pairs
+            ),
+        )
+
     def _is_exception(self, L: str, R: str):
         L_is_key = (1, L) in self.key_glyphs or L not in self.glyph_group_1
 
@@ -39,7 +81,7 @@ class UfoKerning:
         """
         Convert the glyph indices to glyph names. Also solves group kerning references.
         """
-        self.mm_kerning_names: dict[tuple[str, str], list[int]] = {}
+        mm_kerning_names: dict[tuple[str, str], list[int]] = {}
         for pair, values in self.mm_kerning.items():
             L, Rid = pair
             # Make right GID into glyph name
@@ -54,7 +96,8 @@ class UfoKerning:
             right_group = self.key_glyphs.get((2, R))
             right = right_group if right_group in self.groups else R
 
-            self.mm_kerning_names[left, right] = values
+            mm_kerning_names[left, right] = values
+        self.mm_kerning_names = mm_kerning_names
 
     def _reverse_key_glyph_dict(
         self, key_glyphs: dict[str, str]
@@ -86,11 +129,16 @@ class UfoKerning:
     def get_master_kerning(self, master_index: int) -> "UfoMasterKerning":
         """
         Extract the kerning values for master_index and return the kerning as
-        dict[tuple[str, str], int].
+        dict[tuple[str, str], int]. Pairs with a value of 0 are omitted unless they are
+        exceptions.
         """
-        master_kerning: "UfoMasterKerning" = {}
-        for pair, values in self.mm_kerning_names.items():
-            value = values[master_index]
-            if value != 0 or self._is_exception(*pair):
-                master_kerning[pair] = value
-        return master_kerning
+        if not self.pairs:
+            return {}
+
+        return {
+            pair: value
+            for pair, value, is_exception in zip(
+                self.pairs, self.master_values[master_index], self.exceptions
+            )
+            if value or is_exception
+        }
@@ -1,17 +1,19 @@
 import logging
 from base64 import b64encode
+from collections.abc import Sequence
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any
 
+from vfbLib.outlines import CompactOutline
 from vfbLib.ufo.guides import apply_guide_properties, get_master_guides
 from vfbLib.ufo.pshints import build_ps_glyph_hints, get_master_hints
 from vfbLib.ufo.tth import set_tth_lib
-from vfbLib.ufo.vfb2ufo import TT_GLYPH_LIB_KEY, TT_UFO_LIB_KEY
+from vfbLib.ufo.vfb2ufo import TT_GLYPH_LIB_KEY
 
 if TYPE_CHECKING:
     from fontTools.pens.pointPen import AbstractPointPen
 
-    from vfbLib.typing import AnchorDict
+    from vfbLib.typing import AnchorDict, MMNode, Point
     from vfbLib.ufo.glyph import VfbToUfoGlyph
     from vfbLib.ufo.typing import UfoComponent, UfoContour
 
@@ -34,6 +36,100 @@ def _drawPoints(pen: "AbstractPointPen", contours, components) -> None:
         pen.addComponent(gn, tr)
 
 
+class ContourTemplate:
+    """
+    The master-independent structure of the contours of a multiple master glyph.
+
+    Each contour is stored as a tuple of its open path flag and its segments. Each
+    segment is a tuple of the UFO segment type, the smooth flag, the index of the node
+    that is used to look up the point label, and the index of the point in the points
+    of one master, see `get_master_points`. The points themselves are not stored.
+    """
+
+    def __init__(self, mm_nodes: "list[MMNode] | CompactOutline") -> None:
+        self.nodes = mm_nodes
+        self.contours: list[tuple[bool, list[tuple[str | None, bool, int | None, int]]]]
+        self.contours = []
+        # The index of the first point of each node
+        starts: Sequence[int]
+        if isinstance(mm_nodes, CompactOutline):
+            self.num_masters = mm_nodes.num_masters
+            step = 2 * self.num_masters
+            starts = [start // step for start in mm_nodes.starts]
+            node_types = [
+                (mm_nodes.node_type(i), mm_nodes.node_flags(i))
+                for i in range(len(mm_nodes))
+            ]
+        else:
+            self.num_masters = len(mm_nodes[0]["points"]) if mm_nodes else 0
+            starts = [0]
+            for n in mm_nodes:
+                starts.append(starts[-1] + len(n["points"][0]))
+            node_types = [(n["type"], n["flags"]) for n in mm_nodes]
+        self._build(node_types, starts)
+
+    def get_master_points(self, master_index: int) -> "list[Point]":
+        """
+        Return the points of all nodes for one master, in the order of the nodes.
+
+        Args:
+            master_index (int): The index of the master.
+
+        Returns:
+            list[Point]: The points.
+        """
+        nodes = self.nodes
+        if isinstance(nodes, CompactOutline):
+            # The coordinates are ordered by node, point, master, and x/y, so the
+            # coordinates of one master are a slice with a step of 2 * num_masters
+            coords = nodes.coords
+            step = 2 * self.num_masters
+            x = 2 * master_index
+            return list(zip(coords[x::step], coords[x + 1 :: step]))  # noqa: E203
+
+        return [pt for n in nodes for pt in n["points"][master_index]]
+
+    def _build(self, node_types: list[tuple[str, int]], starts: Sequence[int]) -> None:
+        path_is_open = False
+        in_qcurve = False
+        contour: list[tuple[str | None, bool, int | None, int]] = []
+        for i, (segment_type, flags) in enumerate(node_types):
+            k = starts[i]
+            smooth = bool(flags & 1)
+
+            if segment_type == "move":
+                if contour:
+                    self.contours.append((path_is_open, contour))
+                contour = [("move", smooth, i, k)]
+                path_is_open = bool(flags & 8)
+                in_qcurve = False
+
+            elif segment_type == "line":
+                if in_qcurve:
+                    contour.append(("qcurve", smooth, i, k))
+                    in_qcurve = False
+                else:
+                    contour.append(("line", smooth, i, k))
+
+            elif segment_type == "curve":
+                # The end point is followed by the first and second control points
+                contour.append((None, False, None, k + 1))
+                contour.append((None, False, None, k + 2))
+                contour.append(("curve", smooth, i, k))
+                in_qcurve = False
+
+            elif segment_type == "qcurve":
+                contour.append((None, False, i, k))
+                in_qcurve = True
+
+            else:
+                logger.error(f"Unknown segment type: {segment_type}")
+                raise ValueError
+
+        if contour:
+            self.contours.append((path_is_open, contour))
+
+
 class UfoMasterGlyph:
     def __init__(
         self,
@@ -73,7 +169,8 @@ class UfoMasterGlyph:
         # Extract the single master glyph from an mm glyph. The main method.
         # Copy glyph lib
         self.lib = deepcopy(self.mm_glyph.lib)
-        self.tth_commands = deepcopy(self.mm_glyph.tth_commands)
+        # The TT commands only contain immutable values, copying the dicts is enough
+        self.tth_commands = [cmd.copy() for cmd in self.mm_glyph.tth_commands]
         if include_ps_hints:
             self._extract_master_ps_hints()
         self._extract_master_tt_hints()
@@ -119,6 +216,10 @@ class UfoMasterGlyph:
     def _extract_master_contours(self, to_mask: bool = False) -> None:
         """
         Extract the contours and components from the mm contours.
+
+        The contour structure is the same in all masters, so it is built only once per
+        glyph in `get_contour_template` and shared by all masters, which only need to
+        fill in their points. The template is released after the last master.
         """
         if to_mask:
             self.mask_contours = []
@@ -134,51 +235,32 @@ class UfoMasterGlyph:
 
             mm_nodes = self.mm_glyph.mm_nodes
 
-        path_is_open = False
-        in_qcurve = False
-        if True:
-            contour: "UfoContour" = []
-            for i, n in enumerate(mm_nodes):
-                if to_mask:
-                    name: str | None = None
-                else:
-                    name = self.mm_glyph.point_labels.get(i, None)
-                nodes = n["points"][self.master_index]
-                pt = nodes[0]
-                segment_type = n["type"]
-                flags = n["flags"]
-                smooth = bool(flags & 1)
-
-                if segment_type == "move":
-                    self._append_contour(contour, path_is_open, to_mask)
-                    contour = [("move", smooth, name, pt)]
-                    path_is_open = bool(flags & 8)
-                    in_qcurve = False
-
-                elif segment_type == "line":
-                    if in_qcurve:
-                        contour.append(("qcurve", smooth, name, pt))
-                        in_qcurve = False
-                    else:
-                        contour.append(("line", smooth, name, pt))
-
-                elif segment_type == "curve":
-                    pt, c1, c2 = nodes
-                    contour.append((None, False, None, c1))
-                    contour.append((None, False, None, c2))
-                    contour.append(("curve", smooth, name, pt))
-                    in_qcurve = False
-
-                elif segment_type == "qcurve":
-                    contour.append((None, False, name, pt))
-                    in_qcurve = True
-
-                else:
-                    logger.error(f"Unknown segment type: {segment_type}")
-                    raise ValueError
-
+        template = self.mm_glyph.get_contour_template(to_mask)
+        if template is None or template.nodes is not mm_nodes:
+            template = ContourTemplate(mm_nodes)
+            self.mm_glyph.set_contour_template(to_mask, template)
+
+        # Point labels may be added while building other glyphs, so they are looked up
+        # for each master
+        labels = {} if to_mask else self.mm_glyph.point_labels
+        m = self.master_index
+        points = template.get_master_points(m)
+        for path_is_open, segments in template.contours:
+            contour: "UfoContour" = [
+                (
+                    segment_type,
+                    smooth,
+                    None if label_index is None else labels.get(label_index),
+                    points[k],
+                )
+                for segment_type, smooth, label_index, k in segments
+            ]
             self._append_contour(contour, path_is_open, to_mask)
 
+        if m == template.num_masters - 1:
+            # Don't keep the template after the last master has been built
+            self.mm_glyph.set_contour_template(to_mask, None)
+
         if to_mask:
             # Mask has no components
             return
@@ -257,8 +339,6 @@ class UfoMasterGlyph:
             data = self.lib[TT_GLYPH_LIB_KEY]
             if not isinstance(data, bytes):
                 self.lib[TT_GLYPH_LIB_KEY] = b64encode(data.encode("ascii"))
-        if TT_UFO_LIB_KEY in self.lib:
-            self.lib[TT_UFO_LIB_KEY] = deepcopy(self.lib[TT_UFO_LIB_KEY])
 
     def _finalize_point_labels(self, include_ps_hints: bool = True) -> None:
         self._finalize_tt_point_labels()
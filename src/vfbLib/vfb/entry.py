@@ -1,7 +1,6 @@
 import logging
-from functools import cached_property
-from io import BytesIO
 from struct import pack
+from time import perf_counter
 from typing import TYPE_CHECKING
 
 from vfbLib.compilers.base import BaseCompiler
@@ -13,6 +12,7 @@ from vfbLib.typing import EntryDict
 
 if TYPE_CHECKING:
     from io import BufferedIOBase
+    from mmap import mmap
 
     from vfbLib.typing import EntryDecompiled
     from vfbLib.vfb.vfb import Vfb
@@ -34,8 +34,22 @@ class VfbEntry(StreamReader):
     ) -> None:
         # The parent object, Vfb
         self.vfb = parent
-        # The original or decompiled data
-        self._data: "bytes | EntryDecompiled | None" = None
+        # The original or decompiled data. When the parent Vfb was read in mmap mode,
+        # the original data is a memoryview into the mapped file.
+        self._data: "bytes | memoryview | EntryDecompiled | None" = None
+        # The compiled data from before the entry was decompiled. It is written instead
+        # of recompiling the entry as long as the entry is not modified.
+        self._original: "bytes | memoryview | None" = None
+        # Whether the data may differ from the data that was read. This is the case
+        # when decompiled data has been handed out by VfbEntry.data.
+        self.modified = False
+        # The start and end offset of the entry, including its header, in the file it
+        # was read from, and the original entry header
+        self.source_range: tuple[int, int] | None = None
+        self._source_header: bytes | None = None
+        # The cached entry header and the data size it was built for
+        self._header: bytes | None = None
+        self._header_size = -1
         # Temporary data for additional master, must be merged when compiling
         self.temp_masters: list[list] | None = None
         self.parser = None
@@ -59,13 +73,18 @@ class VfbEntry(StreamReader):
             f"compiler: {self.compiler}>"
         )
 
-    @cached_property
+    @property
     def header(self) -> bytes:
-        """The entry header.
+        """The entry header. It is only rebuilt when the id or the size of the compiled
+        data have changed.
 
         Returns:
             bytes: The data of the current entry header.
         """
+        size = self.size
+        if self._header is not None and self._header_size == size:
+            return self._header
+
         if self.id is None:
             logger.error(
                 "You need to set VfbEntry.id before accessing its header, "
@@ -73,17 +92,16 @@ class VfbEntry(StreamReader):
             )
             raise ValueError
 
-        header = BytesIO()
-        if self.size > 0xFFFF:
-            entry_id = self.id | 0x8000
-        else:
-            entry_id = self.id
-        header.write(pack("<H", entry_id))
-        if self.size > 0xFFFF:
-            header.write(pack("<I", self.size))
-        else:
-            header.write(pack("<H", self.size))
-        return header.getvalue()
+        self._header = self._build_header(self.id, size)
+        self._header_size = size
+        return self._header
+
+    @staticmethod
+    def _build_header(eid: int, size: int) -> bytes:
+        if size > 0xFFFF:
+            return pack("<HI", eid | 0x8000, size)
+
+        return pack("<HH", eid, size)
 
     @property
     def decompiled(self) -> "EntryDecompiled | None":
@@ -96,33 +114,100 @@ class VfbEntry(StreamReader):
             "VfbEntry.decompiled is deprecated, use VfbEntry.data instead",
             DeprecationWarning,
         )
-        if isinstance(self._data, bytes):
+        if isinstance(self._data, (bytes, memoryview)):
             return None
 
         return self._data
 
     @property
     def size(self) -> int:
-        """The size of the compiled data.
+        """The size of the compiled data. Modified entries must be compiled first.
 
         Returns:
             int: The size of the current compiled data.
         """
-        if self.data is None:
+        if self._data is None:
             return 0
 
-        if isinstance(self.data, bytes):
-            return len(self.data)
+        if isinstance(self._data, (bytes, memoryview)):
+            return len(self._data)
+
+        if not self.modified and self._original is not None:
+            return len(self._original)
 
         raise RuntimeError
 
     @property
-    def data(self) -> "bytes | EntryDecompiled | None":
+    def data(self) -> "bytes | memoryview | EntryDecompiled | None":
+        """The original or decompiled data of the entry.
+
+        If the parent Vfb is in lazy mode, the entry is decompiled on first access.
+
+        Setting the data or getting decompiled data marks the entry as modified, because
+        the decompiled data may be changed in place. When a modified entry is compiled
+        to the same data that was read, it is unmodified again.
+        """
+        if self.vfb.lazy and self.is_compiled and self.parser is not None:
+            self.decompile()
+        if not self.is_compiled and self._data is not None:
+            self.modified = True
         return self._data
 
     @data.setter
-    def data(self, value: "bytes | EntryDecompiled | None") -> None:
+    def data(self, value: "bytes | memoryview | EntryDecompiled | None") -> None:
         self._data = value
+        self.modified = True
+
+    @property
+    def is_compiled(self) -> bool:
+        """Whether the entry data is in its compiled, binary form.
+
+        Returns:
+            bool: True if the data is bytes or a memoryview.
+        """
+        return isinstance(self._data, (bytes, memoryview))
+
+    @property
+    def raw(self) -> "bytes | memoryview | None":
+        """The compiled data of the entry. If the entry has been decompiled and not
+        modified, the original data is returned. If it has been modified, it is compiled
+        first. Use this instead of VfbEntry.data to get the bytes of an entry in a lazy
+        Vfb without decompiling it.
+
+        Returns:
+            bytes | memoryview | None: The compiled data.
+        """
+        if self.is_compiled or self._data is None:
+            return self._data  # type: ignore
+
+        if not self.modified and self._original is not None:
+            return self._original
+
+        self.compile()
+        return self._data  # type: ignore
+
+    @property
+    def is_copyable(self) -> bool:
+        """Whether the entry can be copied unchanged, including its header, from the
+        file it was read from.
+
+        Returns:
+            bool: True if the entry is unmodified and its header would be unchanged.
+        """
+        return (
+            not self.modified
+            and self.source_range is not None
+            and self.header == self._source_header
+        )
+
+    def release_view(self) -> None:
+        """
+        Copy data that references a memory-mapped file into memory.
+        """
+        if isinstance(self._data, memoryview):
+            self._data = self._data.tobytes()
+        if isinstance(self._original, memoryview):
+            self._original = self._original.tobytes()
 
     @property
     def id(self) -> int | None:
@@ -131,6 +216,7 @@ class VfbEntry(StreamReader):
     @id.setter
     def id(self, value: int | None) -> None:
         self._id = value
+        self._header = None
         self.key = str(self._id)
         self.compiler = None
         if self._id is None:
@@ -166,11 +252,14 @@ class VfbEntry(StreamReader):
 
     def as_dict(self, minimize=True) -> EntryDict:
         d = EntryDict(key=str(self.key))
-        if isinstance(self.data, bytes):
+        if self.vfb.lazy and self.is_compiled and self.parser is not None:
+            self.decompile()
+        data = self._data
+        if isinstance(data, (bytes, memoryview)):
             d["size"] = self.size
-            d["decompiled"] = hexStr(self.data)
+            d["decompiled"] = hexStr(data)
         else:
-            d["decompiled"] = self.data
+            d["decompiled"] = data
         if not minimize:
             if self.parser is not None:
                 d["parser"] = self.parser.__name__
@@ -180,25 +269,42 @@ class VfbEntry(StreamReader):
 
     def compile(self) -> bool:
         """
-        Compile the entry. The result is stored in VfbEntry.data.
+        Compile the entry. The result is stored in VfbEntry.data. If the entry has not
+        been modified since it was decompiled, the original data is restored instead.
+        If the compiled data is the same as the original data, the entry is no longer
+        modified.
 
         Returns:
             bool: Whether compilation was successful.
         """
-        if isinstance(self.data, bytes):
+        if self.is_compiled:
             # Is already compiled
             return True
 
+        if not self.modified and self._original is not None:
+            self._data = self._original
+            self._original = None
+            return True
+
         if self.compiler is None:
             logger.error(
                 f"Compiling '{self.id}' is not supported yet in {self} "
-                f"Data: {self.data}"
+                f"Data: {self._data}"
             )
             return False
 
         self.merge_masters_data()
 
-        self.data = self.compiler().compile(self.data, vfb=self.vfb)
+        profile = self.vfb.profile
+        start = perf_counter() if profile is not None else 0.0
+        self._data = self.compiler().compile(self._data, vfb=self.vfb)
+        if self._original is not None and self._data == self._original:
+            # Keep the original data, which may be copied from the source file
+            self._data = self._original
+            self.modified = False
+        self._original = None
+        if profile is not None:
+            profile.add_compile(self.key, len(self._data), perf_counter() - start)
 
         # TODO: Return False here if compilation has failed. How to tell?
 
@@ -211,17 +317,19 @@ class VfbEntry(StreamReader):
         if self.parser is None:
             raise ValueError(f"No parser is specified for entry type {self.id}")
 
-        if self.data is None:
+        if self._data is None:
             raise ValueError
 
-        if not isinstance(self.data, bytes):
+        if not self.is_compiled:
             # Already decompiled
             return
 
-        byte_data = self.data
+        byte_data = self._data
+        profile = self.vfb.profile
+        start = perf_counter() if profile is not None else 0.0
 
         try:
-            self.data = self.parser().parse(BytesIO(byte_data), self.size, self.vfb)
+            self.set_decompiled(self.parser().parse(byte_data, self.size, self.vfb))
         except:  # noqa: E722
             logger.error(f"Parse error for data: {self.key}; {hexStr(byte_data)}")
             logger.error(f"Parser class: {self.parser.__name__}")
@@ -230,6 +338,23 @@ class VfbEntry(StreamReader):
             self.vfb.any_errors |= True
             raise
 
+        if profile is not None:
+            profile.add_parse(self.key, len(byte_data), perf_counter() - start)
+
+    def set_decompiled(self, data: "EntryDecompiled") -> None:
+        """
+        Replace the compiled data by the decompiled data, which must have been parsed
+        from it. Unlike setting VfbEntry.data, this does not mark the entry as modified.
+
+        Args:
+            data (EntryDecompiled): The decompiled data.
+        """
+        if not self.is_compiled:
+            raise ValueError("The entry has already been decompiled.")
+
+        self._original = self._data  # type: ignore
+        self._data = data
+
     def merge_masters_data(self) -> None:
         """
         Merge any temporary masters data into the main decompiled structure. Such data
@@ -245,14 +370,25 @@ class VfbEntry(StreamReader):
         if self.compiler is None:
             return
 
-        self.compiler.merge(self.temp_masters, self.data)
+        self.compiler.merge(self.temp_masters, self._data)
 
-    def read(self, stream: "BufferedIOBase") -> None:
+    def read(self, stream: "BufferedIOBase | mmap") -> None:
         """
         Read the entry from the stream without decompiling the data.
+
+        If the parent Vfb has a memory-mapped view of the file, the data is not copied
+        but stored as a memoryview slice of the mapped file.
         """
         self.stream = stream
+        profile = self.vfb.profile
+        start_time = perf_counter() if profile is not None else 0.0
+        start = stream.tell()
         size = self._read_entry()
+        if self.id is not None:
+            self._source_header = self._build_header(self.id, size)
+            if stream.tell() - start > 4:
+                # The original header used a uint32 for the size
+                self._source_header = pack("<HI", self.id | 0x8000, size)
 
         # Special cases, probably remnants from FL3
         if self.id == F.MMKernPair:
@@ -260,4 +396,15 @@ class VfbEntry(StreamReader):
             # In this case it can be calculated from the number of masters:
             size = 2 * int32_size + self.vfb.num_masters * 2
 
-        self.data = self.stream.read(size)
+        view = self.vfb.mmap_view
+        if view is None:
+            self._data = self.stream.read(size)
+        else:
+            offset = self.stream.tell()
+            self._data = view[offset : offset + size]  # noqa: E203
+            self.stream.seek(offset + len(self._data))
+        self._original = None
+        self.modified = False
+        self.source_range = (start, self.stream.tell())
+        if profile is not None:
+            profile.add_read(self.key, len(self._data), perf_counter() - start_time)
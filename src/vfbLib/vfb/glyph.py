@@ -6,15 +6,13 @@ from fontTools.pens.pointPen import AbstractPointPen, SegmentToPointPen
 
 from vfbLib import DIRECTIONS
 from vfbLib.templates.glyph import get_empty_glyph
-from vfbLib.ufo.glyph import VfbToUfoGlyph
-from vfbLib.ufo.paths import UfoMasterGlyph
-from vfbLib.ufo.pshints import normalize_hint_dict
 from vfbLib.vfb.pens import VfbGlyphPointPen
 
 if TYPE_CHECKING:
     from fontTools.pens.basePen import AbstractPen
 
     from vfbLib.typing import HintTuple
+    from vfbLib.ufo.paths import UfoMasterGlyph
     from vfbLib.vfb.entry import VfbEntry
     from vfbLib.vfb.vfb import Vfb, VfbMaster
 
@@ -31,9 +29,11 @@ class VfbGlyph:
         self.ps_hinting_options: "VfbEntry | None" = None
 
         self._parent = parent
-        self._glyph: UfoMasterGlyph | None = None
+        self._glyph: "UfoMasterGlyph | None" = None
         self.master_index = 0
-        self.empty()
+        # Don't hand out the data, which would mark the entry as modified
+        if self.entry._data is None:
+            self.empty()
 
     # UFO/cu2qu compatibility
 
@@ -71,10 +71,11 @@ class VfbGlyph:
         Decompile the Glyph entry and return the glyph name.
         """
         self.entry.decompile()
-        if self.entry.data is None:
+        data = self.entry._data
+        if data is None:
             raise ValueError
 
-        return self.entry.data["name"]
+        return data["name"]
 
     def empty(self) -> None:
         self.entry.data = get_empty_glyph(self._parent.num_masters)
@@ -84,6 +85,10 @@ class VfbGlyph:
         Copy minimal data to the VfbToUfoGlyph. Only data that is necessary for the pen
         methods is copied.
         """
+        # The UFO modules are only imported when needed, they import fontTools.ttLib
+        from vfbLib.ufo.glyph import VfbToUfoGlyph
+        from vfbLib.ufo.paths import UfoMasterGlyph
+
         if self.entry.data is None:
             raise ValueError
 
@@ -137,6 +142,8 @@ class VfbGlyph:
         return hint_sets
 
     def resolve_hints(self) -> "dict[str, list[HintTuple]]":
+        from vfbLib.ufo.pshints import normalize_hint_dict
+
         hints: "dict[str, list[HintTuple]]" = {"h": [], "v": []}
 
         mm_hints = self.entry.data.get("hints", {"h": [], "v": []})
@@ -390,6 +397,10 @@ class VfbGlyphMaster:
         Copy minimal data to the VfbToUfoGlyph. Only data that is necessary for the pen
         methods is copied.
         """
+        # The UFO modules are only imported when needed, they import fontTools.ttLib
+        from vfbLib.ufo.glyph import VfbToUfoGlyph
+        from vfbLib.ufo.paths import UfoMasterGlyph
+
         if self.entry.data is None:
             raise ValueError
 
@@ -0,0 +1,249 @@
+import logging
+from hashlib import file_digest
+from pathlib import Path
+from struct import unpack
+from typing import TYPE_CHECKING, NamedTuple
+
+import orjson
+
+from vfbLib.constants import parser_classes
+from vfbLib.enum import F, G
+from vfbLib.helpers import int16_size, int32_size
+from vfbLib.parsers.header import VfbHeaderParser
+
+if TYPE_CHECKING:
+    from io import BufferedIOBase
+
+
+logger = logging.getLogger(__name__)
+
+
+INDEX_FORMAT_VERSION = 1
+
+# Entries that belong to the preceding glyph entry
+glyph_entry_ids = frozenset(G)
+
+
+class VfbIndexRecord(NamedTuple):
+    """
+    The location of a VFB entry in the file.
+    """
+
+    # The numeric entry id
+    id: int
+    # The file offset of the entry data, after the entry header
+    offset: int
+    # The size of the entry data
+    size: int
+    # The index of the glyph the entry belongs to, or None for font-level entries
+    glyph_index: int | None
+
+    @property
+    def key(self) -> str:
+        key = parser_classes.get_key(self.id)
+        if key is None:
+            return str(self.id)
+
+        return key
+
+
+class VfbIndex:
+    """
+    An index of the entries of a VFB file that allows random access to entries without
+    reading the whole file. The index is built by only reading the entry headers, and
+    can be saved to and loaded from a sidecar file next to the VFB.
+    """
+
+    def __init__(self, records: list[VfbIndexRecord] | None = None) -> None:
+        self.records: list[VfbIndexRecord] = [] if records is None else records
+        self._build_lookups()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _build_lookups(self) -> None:
+        self._by_id: dict[int, list[VfbIndexRecord]] = {}
+        self._glyphs: list[list[VfbIndexRecord]] = []
+        for record in self.records:
+            self._by_id.setdefault(record.id, []).append(record)
+            if record.id == G.Glyph:
+                self._glyphs.append([record])
+            elif record.glyph_index is not None:
+                self._glyphs[record.glyph_index].append(record)
+
+    @property
+    def num_glyphs(self) -> int:
+        return len(self._glyphs)
+
+    def find(self, eid: int) -> list[VfbIndexRecord]:
+        """
+        Return the records of all entries with the given id.
+
+        Args:
+            eid (int): The entry id, e.g. `F.features`.
+
+        Returns:
+            list[VfbIndexRecord]: The records in file order.
+        """
+        return self._by_id.get(eid, [])
+
+    def glyph(self, glyph_index: int) -> VfbIndexRecord:
+        """
+        Return the record of the N-th glyph entry.
+
+        Args:
+            glyph_index (int): The index of the glyph in the VFB.
+
+        Returns:
+            VfbIndexRecord: The record of the `G.Glyph` entry.
+        """
+        return self._glyphs[glyph_index][0]
+
+    def glyph_records(self, glyph_index: int) -> list[VfbIndexRecord]:
+        """
+        Return the records of the N-th glyph entry and its trailing per-glyph entries,
+        e.g. `G.Links` or `G.unicodes`.
+
+        Args:
+            glyph_index (int): The index of the glyph in the VFB.
+
+        Returns:
+            list[VfbIndexRecord]: The records in file order.
+        """
+        return self._glyphs[glyph_index]
+
+    @classmethod
+    def from_path(cls, vfb_path: Path) -> "VfbIndex":
+        """
+        Build the index for the VFB file at `vfb_path`.
+        """
+        with open(vfb_path, "rb") as f:
+            return cls.from_stream(f)
+
+    @classmethod
+    def from_stream(cls, stream: "BufferedIOBase") -> "VfbIndex":
+        """
+        Build the index by scanning the entry headers of a VFB stream. The entry data is
+        skipped, except for the master count, which is needed to calculate the size of
+        some entries.
+        """
+        VfbHeaderParser(stream).parse()
+        records: list[VfbIndexRecord] = []
+        num_masters = 0
+        glyph_index = -1
+        while True:
+            raw = stream.read(int16_size)
+            if len(raw) < int16_size:
+                break
+
+            raw_id = unpack("<H", raw)[0]
+            eid = raw_id & ~0x8000
+            if raw_id & 0x8000:
+                # Uses uint32 for data length
+                size = unpack("<I", stream.read(int32_size))[0]
+            else:
+                # Uses uint16 for data length
+                size = unpack("<H", stream.read(int16_size))[0]
+
+            if eid == F.MMKernPair:
+                # The size must be calculated, see VfbEntry.read
+                size = 2 * int32_size + num_masters * 2
+
+            offset = stream.tell()
+            if eid == F.MasterCount:
+                num_masters = unpack("<H", stream.read(int16_size))[0]
+
+            if eid == G.Glyph:
+                glyph_index += 1
+                owner: int | None = glyph_index
+            elif eid in glyph_entry_ids and glyph_index >= 0:
+                owner = glyph_index
+            else:
+                owner = None
+            records.append(VfbIndexRecord(eid, offset, size, owner))
+
+            if eid == F.BlockFileDataEnd:
+                break
+
+            stream.seek(offset + size)
+
+        return cls(records)
+
+    # Sidecar files
+
+    @staticmethod
+    def get_sidecar_path(vfb_path: Path) -> Path:
+        """
+        Return the path of the index sidecar file for a VFB file.
+        """
+        return Path(vfb_path).with_suffix(".vfb.index.json")
+
+    @staticmethod
+    def get_file_key(vfb_path: Path, with_hash: bool = True) -> dict[str, int | str]:
+        """
+        Return the properties of the VFB file that are used to validate a sidecar file.
+        """
+        stat = Path(vfb_path).stat()
+        key: dict[str, int | str] = {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+        if with_hash:
+            with open(vfb_path, "rb") as f:
+                key["sha256"] = file_digest(f, "sha256").hexdigest()
+        return key
+
+    def save_sidecar(self, vfb_path: Path) -> Path:
+        """
+        Save the index to a sidecar file next to the VFB file at `vfb_path`.
+
+        Returns:
+            Path: The path of the sidecar file.
+        """
+        sidecar_path = self.get_sidecar_path(vfb_path)
+        d = {
+            "version": INDEX_FORMAT_VERSION,
+            "file": self.get_file_key(vfb_path),
+            "records": [tuple(r) for r in self.records],
+        }
+        with open(sidecar_path, "wb") as f:
+            f.write(orjson.dumps(d))
+        return sidecar_path
+
+    @classmethod
+    def load_sidecar(cls, vfb_path: Path, check_hash=False) -> "VfbIndex | None":
+        """
+        Load the index for the VFB file at `vfb_path` from its sidecar file.
+
+        The sidecar is accepted if the file size and modification time of the VFB match
+        the ones stored in the sidecar. If `check_hash` is True, a sidecar with a
+        different modification time is also accepted if the file hash matches.
+
+        Returns:
+            VfbIndex | None: The index, or None if there is no valid sidecar file.
+        """
+        sidecar_path = cls.get_sidecar_path(vfb_path)
+        if not sidecar_path.exists():
+            return None
+
+        try:
+            with open(sidecar_path, "rb") as f:
+                d = orjson.loads(f.read())
+        except orjson.JSONDecodeError:
+            logger.warning(f"Ignoring invalid index sidecar file: {sidecar_path}")
+            return None
+
+        if d.get("version") != INDEX_FORMAT_VERSION:
+            return None
+
+        stored = d["file"]
+        current = cls.get_file_key(vfb_path, with_hash=False)
+        if stored["size"] != current["size"]:
+            return None
+
+        if stored["mtime"] != current["mtime"]:
+            if not check_hash:
+                return None
+
+            current = cls.get_file_key(vfb_path)
+            if stored["sha256"] != current["sha256"]:
+                return None
+
+        return cls([VfbIndexRecord(*r) for r in d["records"]])
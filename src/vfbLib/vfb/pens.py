@@ -106,7 +106,7 @@ class VfbGlyphPointPen(AbstractPointPen):
         **kwargs: Any,
     ) -> None:
         assert self.currentPath is None
-        base_index = self.glyphSet.glyph_order.index(baseGlyphName)
+        base_index = self.glyphSet.glyph_ids.get(baseGlyphName, -1)
         if base_index == -1:
             raise KeyError(f"Base glyph not found: '{baseGlyphName}'")
 
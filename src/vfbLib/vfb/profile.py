@@ -0,0 +1,133 @@
+from collections.abc import Callable
+from typing import Any
+
+# A function that is called for each profiled event with the event name ("read",
+# "parse" or "compile"), the entry key, the size of the compiled data, and the duration
+# in seconds
+ProfileCallback = Callable[[str, str, int, float], None]
+
+
+class EntryProfile:
+    """
+    The profile of all entries with the same key.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        # The number and total size of entries that were read
+        self.count = 0
+        self.bytes = 0
+        self.read_time = 0.0
+        # The number of entries that were decompiled, and the total parse time
+        self.parse_count = 0
+        self.parse_time = 0.0
+        # The number of entries that were compiled, and the total compile time
+        self.compile_count = 0
+        self.compile_time = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<EntryProfile {self.key}: {self.count} entries, {self.bytes} bytes, "
+            f"parse {self.parse_time:.6f} s, compile {self.compile_time:.6f} s>"
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "count": self.count,
+            "bytes": self.bytes,
+            "read_time": self.read_time,
+            "parse_count": self.parse_count,
+            "parse_time": self.parse_time,
+            "compile_count": self.compile_count,
+            "compile_time": self.compile_time,
+        }
+
+
+class VfbProfile:
+    """
+    Collects the number, size and cumulative read, parse and compile times of entries
+    by entry key. Pass it to `Vfb` to profile reading, decompiling and compiling:
+
+        profile = VfbProfile()
+        vfb = Vfb(vfb_path, profile=profile)
+        vfb.decompile()
+        print(profile.format())
+
+    If a `callback` is given, it is also called for each event, e.g. to feed the times
+    into a metrics system.
+    """
+
+    def __init__(self, callback: ProfileCallback | None = None) -> None:
+        self.callback = callback
+        self.entries: dict[str, EntryProfile] = {}
+
+    def __getitem__(self, key: str) -> EntryProfile:
+        return self.entries[key]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _get(self, key: str) -> EntryProfile:
+        profile = self.entries.get(key)
+        if profile is None:
+            profile = self.entries[key] = EntryProfile(key)
+        return profile
+
+    def add_read(self, key: str, size: int, duration: float) -> None:
+        profile = self._get(key)
+        profile.count += 1
+        profile.bytes += size
+        profile.read_time += duration
+        if self.callback is not None:
+            self.callback("read", key, size, duration)
+
+    def add_parse(self, key: str, size: int, duration: float) -> None:
+        profile = self._get(key)
+        profile.parse_count += 1
+        profile.parse_time += duration
+        if self.callback is not None:
+            self.callback("parse", key, size, duration)
+
+    def add_compile(self, key: str, size: int, duration: float) -> None:
+        profile = self._get(key)
+        profile.compile_count += 1
+        profile.compile_time += duration
+        if self.callback is not None:
+            self.callback("compile", key, size, duration)
+
+    def clear(self) -> None:
+        self.entries = {}
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the profiles by entry key, e.g. for saving as JSON.
+        """
+        return {key: profile.as_dict() for key, profile in self.entries.items()}
+
+    def sorted(self) -> list[EntryProfile]:
+        """
+        Return the entry profiles, sorted by the sum of parse and compile time, the
+        slowest first.
+        """
+        return sorted(
+            self.entries.values(),
+            key=lambda p: p.parse_time + p.compile_time,
+            reverse=True,
+        )
+
+    def format(self) -> str:
+        """
+        Return the profiles as a table, the slowest entry types first. Times are in ms.
+        """
+        lines = [
+            f"{'Entry':<36} {'Count':>8} {'Bytes':>12} {'Read':>10} {'Parse':>10} "
+            f"{'Compile':>10}"
+        ]
+        for p in self.sorted():
+            lines.append(
+                f"{p.key[:36]:<36} {p.count:>8} {p.bytes:>12} "
+                f"{p.read_time * 1000:>10.2f} {p.parse_time * 1000:>10.2f} "
+                f"{p.compile_time * 1000:>10.2f}"
+            )
+        return "\n".join(lines)
@@ -1,24 +1,120 @@
 import logging
-from collections.abc import Iterable
+import os
+from collections.abc import Iterable, Iterator
+from mmap import ACCESS_READ
+from mmap import mmap as memory_map
 from pathlib import Path
-from time import time
-from typing import TYPE_CHECKING, Any
+from time import perf_counter, time
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from vfbLib.constants import parser_classes
 from vfbLib.enum import F, G, T
 from vfbLib.vfb.entry import VfbEntry
 from vfbLib.vfb.glyph import VfbGlyph, VfbGlyphMaster
 from vfbLib.vfb.header import VfbHeader
+from vfbLib.vfb.index import VfbIndex, VfbIndexRecord, glyph_entry_ids
 from vfbLib.vfb.info import VfbInfo
 
 if TYPE_CHECKING:
     from io import BufferedIOBase
 
     from vfbLib.typing import VfbDict
+    from vfbLib.vfb.profile import VfbProfile
 
 
 logger = logging.getLogger(__name__)
 
 
+# Entries that can be decompiled without access to the Vfb, so they can be
+# decompiled in worker processes
+PARALLEL_ENTRY_IDS = frozenset((G.Glyph, G.mask))
+
+
+def _decompile_chunk(
+    chunk: list[tuple[int, bytes]],
+    encoding: str,
+    num_masters: int,
+    compact_outlines: bool = False,
+) -> list[tuple[bool, Any, float]]:
+    """
+    Decompile a chunk of entries in a worker process.
+
+    Args:
+        chunk (list[tuple[int, bytes]]): The entry ids and raw entry data.
+        encoding (str): The string encoding of the Vfb.
+        num_masters (int): The number of masters of the Vfb.
+        compact_outlines (bool, optional): Whether to decompile glyph outlines to
+            CompactOutline objects. Defaults to False.
+
+    Returns:
+        list[tuple[bool, Any, float]]: For each entry, whether it was decompiled
+        successfully, the decompiled data, and the parse time in seconds.
+    """
+    # A minimal Vfb with the settings the parsers need, like in Vfb.decompile
+    vfb = Vfb(timing=False, compact_outlines=compact_outlines)
+    vfb.encoding = encoding
+    vfb.num_masters = num_masters
+    results: list[tuple[bool, Any, float]] = []
+    for eid, data in chunk:
+        _, parser_class, _ = parser_classes[eid]
+        parser_class.encoding = encoding
+        parser = parser_class()
+        start = perf_counter()
+        try:
+            decompiled = parser.parse(data, len(data), vfb)
+        except Exception:
+            # The entry is decompiled again by the main process to report the error
+            results.append((False, None, 0.0))
+        else:
+            results.append((True, decompiled, perf_counter() - start))
+    return results
+
+
+class VfbGlyphRecord(NamedTuple):
+    """
+    A glyph entry and its trailing per-glyph entries, as yielded by
+    `Vfb.iter_glyph_records`.
+    """
+
+    # The G.Glyph entry
+    glyph: VfbEntry
+    # The entries following the glyph entry that belong to the glyph, e.g. G.Links,
+    # G.unicodes, or G.mask
+    entries: list[VfbEntry]
+
+
+def _copy_file_range(
+    source: "BufferedIOBase", target: "BufferedIOBase", offset: int, count: int
+) -> None:
+    """
+    Copy `count` bytes starting at `offset` from the source file to the current
+    position of the target file. The copy is done in the kernel if the platform
+    supports it, else the data is read and written.
+    """
+    target.flush()
+    target_fd = target.fileno()
+    try:
+        while count > 0:
+            if hasattr(os, "copy_file_range"):
+                n = os.copy_file_range(source.fileno(), target_fd, count, offset)
+            elif hasattr(os, "sendfile"):
+                n = os.sendfile(target_fd, source.fileno(), offset, count)
+            else:
+                break
+            if n == 0:
+                break
+            offset += n
+            count -= n
+    except OSError:
+        # E.g. sendfile only supports sockets as the target on macOS
+        pass
+    # Sync the position of the buffered writer with the file descriptor
+    target.seek(os.lseek(target_fd, 0, os.SEEK_CUR))
+    if count > 0:
+        source.seek(offset)
+        target.write(source.read(count))
+
+
 # Convenience objects for vfb access
 
 
@@ -41,6 +137,10 @@ class VfbMaster:
     def glyph_order(self) -> list[str]:
         return self.vfb.glyph_order
 
+    @property
+    def glyph_ids(self) -> dict[str, int]:
+        return self.vfb.glyph_ids
+
     @property
     def info(self) -> VfbInfo:
         return self.vfb.info
@@ -65,6 +165,19 @@ class Vfb:
     Object to represent the vfb data, with the ability to read and write. You can use
     the Vfb object to access glyphs through dict methods, where the glyph name is the
     key and the glyph object is the value.
+
+    If `mmap` is True, the file at `vfb_path` is memory-mapped instead of read into
+    memory, and the entries hold views into the mapped file until they are decompiled
+    or modified.
+
+    If `lazy` is True, entries are decompiled on first access of `VfbEntry.data`. Use
+    `VfbEntry.raw` to access the binary data without decompiling.
+
+    If `compact_outlines` is True, the outline nodes of glyphs and masks are decompiled
+    to `CompactOutline` objects, which use much less memory than lists of node dicts.
+
+    If a `VfbProfile` is given as `profile`, the number, size and read, parse and
+    compile times of the entries are recorded in it by entry key.
     """
 
     def __init__(
@@ -75,6 +188,10 @@ class Vfb:
         drop_keys: set[int] | None = None,
         only_header=False,
         unicode_strings=False,
+        mmap=False,
+        lazy=False,
+        compact_outlines=False,
+        profile: "VfbProfile | None" = None,
     ) -> None:
         self.vfb_path = vfb_path
         self.timing = timing
@@ -86,10 +203,18 @@ class Vfb:
         self.only_header = only_header
         self.encoding = "utf-8"
         self.force_unicode_strings = unicode_strings
+        self.mmap = mmap
+        self.lazy = lazy
+        self.compact_outlines = compact_outlines
+        self.profile = profile
+        self._mmap: memory_map | None = None
+        self.mmap_view: memoryview | None = None
 
         # We need some minimal API to make pen access work ...
         self._glyphs: dict[str, VfbGlyph] = {}
         self.glyph_order: list[str] = []
+        # The glyph index by glyph name
+        self.glyph_ids: dict[str, int] = {}
 
         # cu2qu accesses the info and lib ...
         self.info = VfbInfo(vfb=self)
@@ -103,6 +228,13 @@ class Vfb:
 
         self.ps_hinting_options: VfbEntry | None = None
 
+        # The entry index, see Vfb.read_index
+        self.index: VfbIndex | None = None
+
+        # The size and modification time of the file at vfb_path when it was read, to
+        # check if unmodified entries can be copied from it when writing
+        self._source_key: dict[str, int | str] | None = None
+
         # Track decompile errors
         self.any_errors = False
         if self.vfb_path:
@@ -136,9 +268,33 @@ class Vfb:
         """
         Clear any data that may have been read before.
         """
+        if self._mmap is not None:
+            self.entries = []
+            self.close()
         self.header = VfbHeader()
         self.entries = []
 
+    def close(self) -> None:
+        """
+        Release the memory-mapped file, if any. Entries that still reference the mapped
+        data are copied into memory first, so the Vfb stays usable.
+        """
+        if self._mmap is None:
+            return
+
+        for entry in self.entries:
+            entry.release_view()
+        if self.mmap_view is not None:
+            self.mmap_view.release()
+            self.mmap_view = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Entry data is still referenced elsewhere. The mapping will be released
+            # when the last view is garbage collected.
+            pass
+        self._mmap = None
+
     def compile(self) -> None:
         """
         Compile the header and all entries in the VFB.
@@ -162,6 +318,7 @@ class Vfb:
                             i += 1
                         name = f"{name}#{i}"
                     self._glyphs[name] = glyph
+                    self.glyph_ids[name] = len(self.glyph_order)
                     self.glyph_order.append(name)
                 case G.Links:
                     # We need to store the links of the glyph for converting links to
@@ -201,33 +358,247 @@ class Vfb:
     def get_masters(self) -> list[VfbMaster]:
         return [VfbMaster(self, i) for i in range(self.num_masters)]
 
-    def decompile(self) -> None:
+    def decompile(self, workers: int | None = None) -> None:
         """
         Decompile all entries, except for the ones listed in `drop_keys`.
+
+        Args:
+            workers (int | None, optional): The number of worker processes used to
+                decompile glyph and mask entries in parallel. If None or 1, all entries
+                are decompiled in the current process. Defaults to None.
         """
         self.any_errors = False
         start = time()
         self.header.decompile()
-        for entry in self.entries:
-            if entry.id in self.drop_keys:
-                continue
+        if workers is None or workers < 2:
+            for entry in self.entries:
+                if entry.id in self.drop_keys:
+                    continue
 
-            entry.decompile()
+                entry.decompile()
+        else:
+            self._decompile_parallel(workers)
 
         end = time()
         if self.timing:
             print(f"Interpreting binary data took {round((end - start) * 1000)} ms.")
 
+    def _decompile_parallel(self, workers: int) -> None:
+        """
+        Decompile glyph and mask entries in a process pool, and all other entries in the
+        current process. The entries are processed in order, so errors are raised the
+        same way as when decompiling serially.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        parallel = [
+            e
+            for e in self.entries
+            if e.id in PARALLEL_ENTRY_IDS
+            and e.id not in self.drop_keys
+            and e.is_compiled
+        ]
+        chunk_size = max(1, min(256, len(parallel) // (4 * workers)))
+        chunks = [
+            [(e.id, bytes(e.raw)) for e in parallel[i : i + chunk_size]]  # noqa: E203
+            for i in range(0, len(parallel), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = (
+                r
+                for chunk in executor.map(
+                    _decompile_chunk,
+                    chunks,
+                    [self.encoding] * len(chunks),
+                    [self.num_masters] * len(chunks),
+                    [self.compact_outlines] * len(chunks),
+                )
+                for r in chunk
+            )
+            parallel_ids = {id(e) for e in parallel}
+            for entry in self.entries:
+                if entry.id in self.drop_keys:
+                    continue
+
+                if id(entry) in parallel_ids:
+                    success, data, duration = next(results)
+                    if success:
+                        if self.profile is not None:
+                            size = entry.size
+                            self.profile.add_parse(entry.key, size, duration)
+                        entry.set_decompiled(data)
+                        continue
+
+                entry.decompile()
+
     def items(self) -> Iterable[tuple[str, VfbGlyph]]:
         if not self._glyphs:
             self._decompile_glyphs()
         return self._glyphs.items()
 
+    def iter_glyph_records(self, decompile=False) -> Iterator[VfbGlyphRecord]:
+        """
+        Read the file at vfb_path entry by entry, and yield one glyph at a time together
+        with its trailing per-glyph entries. The entries are not added to Vfb.entries,
+        so memory use does not depend on the number of glyphs. Font-level entries are
+        only read to update the settings that are needed for decompiling, e.g. the
+        master count.
+
+            vfb = Vfb(vfb_path, only_header=True)
+            for glyph, entries in vfb.iter_glyph_records(decompile=True):
+                print(glyph.data["name"])
+
+        Args:
+            decompile (bool, optional): Whether to decompile the entries before they
+                are yielded. Defaults to False.
+
+        Yields:
+            VfbGlyphRecord: The glyph entry and its trailing entries.
+        """
+        if self.vfb_path is None:
+            raise ValueError("Vfb.vfb_path must be set to iterate over glyphs.")
+
+        with open(self.vfb_path, "rb") as stream:
+            header = VfbHeader()
+            header.read(stream)
+            record: VfbGlyphRecord | None = None
+            while True:
+                try:
+                    entry = VfbEntry(self)
+                    entry.read(stream)
+                except EOFError:
+                    break
+
+                if entry.id == G.Glyph:
+                    if record is not None:
+                        yield record
+                    record = VfbGlyphRecord(entry, [])
+                elif entry.id in glyph_entry_ids and record is not None:
+                    if entry.id in self.drop_keys:
+                        continue
+
+                    record.entries.append(entry)
+                else:
+                    if record is not None:
+                        yield record
+                        record = None
+                    self._read_settings(entry)
+                    if entry.id == F.BlockFileDataEnd:
+                        break
+
+                    continue
+
+                if decompile:
+                    entry.decompile()
+
+            if record is not None:
+                yield record
+
     def keys(self) -> Iterable[str]:
         if not self._glyphs:
             self._decompile_glyphs()
         return self._glyphs.keys()
 
+    def _read_settings(self, entry: VfbEntry) -> None:
+        """
+        Some info needs to be stored for later access, so we decompile a selection of
+        entries right when they are read.
+        """
+        if entry.id == F.FLVersion:
+            entry.decompile()
+            data = entry._data
+            if data is not None:
+                if TYPE_CHECKING:
+                    assert isinstance(data, dict)
+                self.writer_platform = data["platform"]
+                if self.force_unicode_strings or self.writer_platform == "macos":
+                    self.encoding = "utf-8"
+                else:
+                    self.encoding = "cp1252"
+
+        elif entry.id == F.MasterCount:
+            entry.decompile()
+            data = entry._data
+            if data is not None:
+                if TYPE_CHECKING:
+                    assert isinstance(data, int)
+                self.num_masters = data
+
+        elif entry.id == T.TrueTypeStems:
+            entry.decompile()
+            data = entry._data
+            if data is not None:
+                if TYPE_CHECKING:
+                    assert isinstance(data, dict)
+                self.ttStemsV_count = len(data.get("ttStemsV", []))
+                self.ttStemsH_count = len(data.get("ttStemsH", []))
+
+    def read_index(self, sidecar=False, check_hash=False) -> VfbIndex:
+        """
+        Build the entry index of the file at vfb_path by only scanning the entry
+        headers, and read the entries that are needed to decompile other entries (FL
+        version, master count, TrueType stems). The index is stored in Vfb.index, and
+        single entries can then be loaded with `Vfb.load_entry`.
+
+        Use together with `only_header` to skip reading the entries:
+
+            vfb = Vfb(vfb_path, only_header=True)
+            vfb.read_index()
+            entry = vfb.load_entry(vfb.index.find(F.features)[0])
+
+        Args:
+            sidecar (bool, optional): Whether to load the index from a sidecar file
+                next to the VFB, and save it there if no valid sidecar file exists.
+                Defaults to False.
+            check_hash (bool, optional): Whether to accept a sidecar file with a
+                different file modification time if the file hash matches. Defaults to
+                False.
+
+        Returns:
+            VfbIndex: The entry index.
+        """
+        if self.vfb_path is None:
+            raise ValueError("Vfb.vfb_path must be set to read the index.")
+
+        index = None
+        if sidecar:
+            index = VfbIndex.load_sidecar(self.vfb_path, check_hash=check_hash)
+        if index is None:
+            index = VfbIndex.from_path(self.vfb_path)
+            if sidecar:
+                index.save_sidecar(self.vfb_path)
+        self.index = index
+
+        for eid in (F.FLVersion, F.MasterCount, T.TrueTypeStems):
+            for record in index.find(eid):
+                self._read_settings(self.load_entry(record))
+
+        return index
+
+    def load_entry(self, record: VfbIndexRecord) -> VfbEntry:
+        """
+        Read a single entry from the file at vfb_path, without decompiling. The entry is
+        not added to Vfb.entries.
+
+        Args:
+            record (VfbIndexRecord): The index record of the entry, from Vfb.index.
+
+        Returns:
+            VfbEntry: The entry.
+        """
+        entry = VfbEntry(self, eid=record.id)
+        if self.mmap_view is not None:
+            end = record.offset + record.size
+            entry._data = self.mmap_view[record.offset : end]  # noqa: E203
+        else:
+            if self.vfb_path is None:
+                raise ValueError("Vfb.vfb_path must be set to load entries.")
+
+            with open(self.vfb_path, "rb") as f:
+                f.seek(record.offset)
+                entry._data = f.read(record.size)
+        return entry
+
     def read_stream(self, stream: "BufferedIOBase") -> None:
         """
         Lazily read and parse the vfb stream, i.e. parse the header, but only read the
@@ -247,37 +618,8 @@ class Vfb:
             except EOFError:
                 break
 
-            # Some info needs to be stored for later access, so we decompile a selection
-            # of entries right here.
-
             if entry is not None:
-                if entry.id == F.FLVersion:
-                    entry.decompile()
-                    if entry.data is not None:
-                        self.writer_platform = entry.data["platform"]
-                        if (
-                            self.force_unicode_strings
-                            or self.writer_platform == "macos"
-                        ):
-                            self.encoding = "utf-8"
-                        else:
-                            self.encoding = "cp1252"
-
-                elif entry.id == F.MasterCount:
-                    entry.decompile()
-                    if entry.data is not None:
-                        if TYPE_CHECKING:
-                            assert isinstance(entry.data, int)
-                        self.num_masters = entry.data
-
-                elif entry.id == T.TrueTypeStems:
-                    entry.decompile()
-                    if entry.data is not None:
-                        if TYPE_CHECKING:
-                            assert isinstance(entry.data, dict)
-                        self.ttStemsV_count = len(entry.data.get("ttStemsV", []))
-                        self.ttStemsH_count = len(entry.data.get("ttStemsH", []))
-
+                self._read_settings(entry)
                 if entry.id not in self.drop_keys:
                     self.entries.append(entry)
 
@@ -299,8 +641,15 @@ class Vfb:
         if self.vfb_path is None:
             return
 
+        self._source_key = VfbIndex.get_file_key(self.vfb_path, with_hash=False)
         with open(self.vfb_path, "rb") as vfb:
-            self.read_stream(vfb)
+            if self.mmap:
+                # The mapping stays valid after the file has been closed
+                self._mmap = memory_map(vfb.fileno(), 0, access=ACCESS_READ)
+                self.mmap_view = memoryview(self._mmap)
+                self.read_stream(self._mmap)  # type: ignore
+            else:
+                self.read_stream(vfb)
 
     def read_bytes(self, buffer: "BufferedIOBase") -> None:
         """
@@ -310,36 +659,111 @@ class Vfb:
             buffer (BufferedIOBase): The buffered reader.
         """
         self.clear()
+        self._source_key = None
         self.read_stream(buffer)
 
+    def _get_copy_source(self, out_path: Path) -> Path | None:
+        """
+        Return the path of the file the VFB was read from, if unmodified entries can be
+        copied from it when writing to out_path.
+        """
+        if self.vfb_path is None or self._source_key is None:
+            return None
+
+        source_path = Path(self.vfb_path)
+        if Path(out_path).resolve() == source_path.resolve():
+            # Overwriting the source file, the entries must be in memory
+            self.close()
+            return None
+
+        try:
+            key = VfbIndex.get_file_key(source_path, with_hash=False)
+        except OSError:
+            return None
+
+        if key != self._source_key:
+            logger.warning(
+                f"{source_path} has changed since it was read, not copying from it."
+            )
+            return None
+
+        return source_path
+
     def write(self, out_path: Path) -> None:
         """
-        Compile any entries with changes, and write the VFB to out_path.
+        Compile any entries with changes, and write the VFB to out_path. Runs of
+        unmodified entries are copied directly from the file the VFB was read from.
         """
+        source_path = self._get_copy_source(out_path)
         with open(out_path, "wb") as vfb:
-            self.write_bytes(vfb)
+            if source_path is None:
+                self.write_bytes(vfb)
+            else:
+                with open(source_path, "rb") as source:
+                    self._write_entries(vfb, source)
 
     def write_bytes(self, buffer: "BufferedIOBase") -> None:
         """
-        Compile any entries with changes, and write the VFB data to a buffer.
+        Compile any entries with changes, and write the VFB data to a buffer. Entries
+        that have not been modified since they were decompiled are not recompiled.
 
         Args:
             buffer (BufferedIOBase): The buffer.
         """
+        self._write_entries(buffer)
+
+    def _write_entries(
+        self, buffer: "BufferedIOBase", source: "BufferedIOBase | None" = None
+    ) -> None:
+        """
+        Write the header and entries to the buffer. If a source file is given, runs of
+        unmodified entries that are contiguous in the source are copied from it.
+        """
         if self.header is None:
             raise ValueError
 
-        self.compile()
-
+        self.header.compile()
         assert isinstance(self.header.data, bytes)
         buffer.write(self.header.data)
 
+        # The source range of the current run of unmodified entries
+        run = [-1, -1]
+
+        def copy_run() -> None:
+            if source is not None and run[1] > run[0]:
+                _copy_file_range(source, buffer, run[0], run[1] - run[0])
+            run[:] = [-1, -1]
+
         for entry in self.entries:
+            if source is not None and entry.is_copyable:
+                assert entry.source_range is not None
+                start, end = entry.source_range
+                if start != run[1]:
+                    copy_run()
+                    run[0] = start
+                run[1] = end
+                continue
+
+            copy_run()
+            data = entry.raw
             buffer.write(entry.header)
-            if entry.data is not None:
+            if data is not None:
                 # There may be entries without data
-                assert isinstance(entry.data, bytes)
-                buffer.write(entry.data)
+                buffer.write(data)
+
+        copy_run()
+
+
+def iter_glyph_records(
+    vfb_path: Path, decompile=False, drop_keys: set[int] | None = None
+) -> Iterator[VfbGlyphRecord]:
+    """
+    Yield the glyphs of the VFB file at `vfb_path` one at a time, together with their
+    trailing per-glyph entries, without keeping the other entries in memory. See
+    `Vfb.iter_glyph_records`.
+    """
+    vfb = Vfb(vfb_path, timing=False, only_header=True, drop_keys=drop_keys)
+    yield from vfb.iter_glyph_records(decompile=decompile)
 
 
 def get_vfb_with_masters(num_masters: int) -> Vfb: